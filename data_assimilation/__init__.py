@@ -6,10 +6,13 @@ Data assimilation using PINNs. Combine model predictions with observational data
 
 from .trainer import DataAssimilationTrainer
 from .evaluator import DataAssimilationEvaluator
-from .models import DataAssimilationPINN
+from .models import DataAssimilationPINN, DataAssimilationEnsemble
+from .streaming import StreamingAssimilator
 
 __all__ = [
     'DataAssimilationTrainer',
     'DataAssimilationEvaluator', 
-    'DataAssimilationPINN'
+    'DataAssimilationPINN',
+    'DataAssimilationEnsemble',
+    'StreamingAssimilator'
 ]
@@ -14,6 +14,8 @@ import seaborn as sns
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from utils.loggers import get_purpose_logger
+from utils.models import StackedEnsemble
+from .models import DataAssimilationEnsemble
 
 
 class DataAssimilationEvaluator:
@@ -48,9 +50,59 @@ class DataAssimilationEvaluator:
         """
         with torch.no_grad():
             inputs = torch.cat([x, t], dim=1)
-            predictions = self.model(inputs)
+            if isinstance(self.model, StackedEnsemble):
+                predictions = self.model(inputs).mean(dim=0)
+            else:
+                predictions = self.model(inputs)
         return predictions
 
+    def predict_with_uncertainty(self, x: torch.Tensor, t: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Predict the ensemble mean and standard deviation in one vectorized pass.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates.
+            t (torch.Tensor): Temporal coordinates.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Mean and standard deviation (zero for a single model).
+        """
+        with torch.no_grad():
+            inputs = torch.cat([x, t], dim=1)
+            if isinstance(self.model, StackedEnsemble):
+                mean, var = self.model.predict_mean_var(inputs)
+                return mean, torch.sqrt(var)
+            predictions = self.model(inputs)
+        return predictions, torch.zeros_like(predictions)
+
+    def assimilate(self, x_obs: torch.Tensor, t_obs: torch.Tensor, u_obs: torch.Tensor,
+                   obs_noise: Any = 0.01, inflation: float = 1.0,
+                   n_iterations: int = 1) -> Dict[str, float]:
+        """Correct the ensemble with observations using a batched EnKF analysis step.
+
+        Args:
+            x_obs (torch.Tensor): Observation spatial coordinates.
+            t_obs (torch.Tensor): Observation temporal coordinates.
+            u_obs (torch.Tensor): Observed values.
+            obs_noise (Any): Observation noise standard deviation.
+            inflation (float): Multiplicative inflation of the prior spread.
+            n_iterations (int): Number of assimilation passes.
+
+        Returns:
+            Dict[str, float]: RMSE and spread at the observations before and after the analysis.
+        """
+        if not isinstance(self.model, DataAssimilationEnsemble):
+            raise ValueError("EnKF assimilation requires a DataAssimilationEnsemble model")
+        
+        report = self.model.analysis_step(torch.cat([x_obs, t_obs], dim=1), u_obs,
+                                          obs_noise, inflation, n_iterations)
+        
+        self.logger.log_equation_specific_info(
+            f"EnKF analysis - RMSE {report['prior_rmse']:.4e} -> {report['posterior_rmse']:.4e}, "
+            f"spread {report['prior_spread']:.4e} -> {report['posterior_spread']:.4e}"
+        )
+        
+        return report
+
     def compute_metrics(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
         """Compute evaluation metrics.
 
@@ -100,7 +152,7 @@ class DataAssimilationEvaluator:
         t_tensor = torch.FloatTensor(t_grid.flatten().reshape(-1, 1))
         
         # Make predictions
-        u_pred_tensor = self.predict(x_tensor, t_tensor)
+        u_pred_tensor, u_std_tensor = self.predict_with_uncertainty(x_tensor, t_tensor)
         u_pred = u_pred_tensor.numpy().reshape(x_grid.shape)
         
         # Compute metrics
@@ -114,8 +166,10 @@ class DataAssimilationEvaluator:
             'x_grid': x_grid,
             't_grid': t_grid
         }
+        if isinstance(self.model, StackedEnsemble):
+            results['uncertainty'] = u_std_tensor.numpy().reshape(x_grid.shape)
         
-        self.logger.log_equation_specific_info(f"Grid evaluation completed - R: {metrics['r2']:.4f}")
+        self.logger.log_equation_specific_info(f"Grid evaluation completed - R²: {metrics['r2']:.4f}")
         
         return results
 
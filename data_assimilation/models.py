@@ -10,8 +10,10 @@ import torch.nn.functional as F
 import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 import math
+import copy
 
 from utils.loggers import get_purpose_logger
+from utils.models import StackedEnsemble, init_linear_weights
 
 
 class DataAssimilationPINN(nn.Module):
@@ -45,14 +47,6 @@ class DataAssimilationPINN(nn.Module):
         self.dropout_rate = dropout_rate
         self.use_fourier_features = use_fourier_features
         
-        # Build network (implement specific architecture for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        layers = []
-        prev_dim = input_dim
-        
-        # Initialize weights
-        self._init_weights(weight_init)
-        
         # Build network layers
         layers = []
         prev_dim = input_dim
@@ -91,6 +85,9 @@ class DataAssimilationPINN(nn.Module):
         # linear activation (no activation) is default
         
         self.network = nn.Sequential(*layers)
+        
+        # Initialize weights
+        init_linear_weights(self, weight_init)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass.
@@ -117,6 +114,101 @@ class DataAssimilationPINN(nn.Module):
         return self.forward(inputs)
 
 
+class DataAssimilationEnsemble(StackedEnsemble):
+    """Ensemble of PINNs corrected by a batched ensemble Kalman analysis.
+
+    Each member's state is its parameter vector. Members are evaluated
+    together at the observation locations with ``vmap``, and the analysis
+    step updates all members at once with pure tensor operations. The
+    Kalman gain is formed in ensemble space (an M x M Cholesky solve for M
+    members), so the cost grows linearly with the number of observations.
+    """
+
+    @classmethod
+    def from_model(cls, model: nn.Module, num_members: int = 32,
+                   perturbation: float = 0.01) -> 'DataAssimilationEnsemble':
+        """Create a prior ensemble by perturbing the weights of a trained model.
+
+        Args:
+            model (nn.Module): Trained (e.g. physics-informed) model.
+            num_members (int): Number of ensemble members.
+            perturbation (float): Standard deviation of the Gaussian weight perturbation.
+
+        Returns:
+            DataAssimilationEnsemble: Prior ensemble.
+        """
+        members = []
+        for _ in range(num_members):
+            member = copy.deepcopy(model)
+            with torch.no_grad():
+                for param in member.parameters():
+                    param.add_(perturbation * torch.randn_like(param))
+            members.append(member)
+        return cls(members)
+
+    def analysis_step(self, x_obs: torch.Tensor, y_obs: torch.Tensor,
+                      obs_noise: Any = 0.01, inflation: float = 1.0,
+                      n_iterations: int = 1) -> Dict[str, float]:
+        """Assimilate observations with a stochastic EnKF analysis.
+
+        With ``n_iterations`` > 1 the observations are assimilated several
+        times with the noise variance scaled by ``n_iterations`` (ensemble
+        smoother with multiple data assimilation), which handles the
+        nonlinear observation operator of a neural network better.
+
+        Args:
+            x_obs (torch.Tensor): Observation inputs of shape (n, input_dim).
+            y_obs (torch.Tensor): Observed values of shape (n, output_dim).
+            obs_noise (Any): Observation noise standard deviation (scalar or per observation).
+            inflation (float): Multiplicative inflation of the prior ensemble spread.
+            n_iterations (int): Number of assimilation passes.
+
+        Returns:
+            Dict[str, float]: RMSE of the ensemble mean and ensemble spread before and after.
+        """
+        m = self.num_members
+        if m < 2:
+            raise ValueError("EnKF analysis needs at least two members")
+
+        y = y_obs.reshape(-1)
+        noise_var = torch.as_tensor(obs_noise, dtype=y.dtype, device=y.device).reshape(-1) ** 2
+        noise_var = noise_var.expand_as(y) * n_iterations
+
+        with torch.no_grad():
+            prior_predictions = self.forward(x_obs).reshape(m, -1)
+            report = {
+                'prior_rmse': torch.sqrt(torch.mean((prior_predictions.mean(dim=0) - y) ** 2)).item(),
+                'prior_spread': prior_predictions.std(dim=0).mean().item()
+            }
+
+            for _ in range(n_iterations):
+                theta = self.flat_parameters()
+                predictions = self.forward(x_obs).reshape(m, -1)
+
+                # Anomalies, with multiplicative inflation of the parameter spread
+                theta_mean = theta.mean(dim=0, keepdim=True)
+                a = (theta - theta_mean) * inflation
+                theta = theta_mean + a
+                s = (predictions - predictions.mean(dim=0, keepdim=True)) * inflation
+                s = s / math.sqrt(m - 1)
+
+                # Perturbed observations
+                d = y + torch.sqrt(noise_var) * torch.randn_like(predictions) - predictions
+
+                # (S^T S + R)^{-1} S^T = R^{-1} S^T (I + S R^{-1} S^T)^{-1}
+                s_scaled = s / noise_var
+                g = torch.eye(m, dtype=s.dtype, device=s.device) + s_scaled @ s.T
+                w = torch.cholesky_solve((d @ s_scaled.T).T, torch.linalg.cholesky(g)).T
+
+                self.set_flat_parameters(theta + w @ a / math.sqrt(m - 1))
+
+            posterior_predictions = self.forward(x_obs).reshape(m, -1)
+            report['posterior_rmse'] = torch.sqrt(torch.mean((posterior_predictions.mean(dim=0) - y) ** 2)).item()
+            report['posterior_spread'] = posterior_predictions.std(dim=0).mean().item()
+
+        return report
+
+
 def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """Factory function to create PINN models.
 
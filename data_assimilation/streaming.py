@@ -0,0 +1,321 @@
+"""
+DataAssimilation Streaming for PINN Research Platform.
+
+This module provides online data assimilation: a live PINN that absorbs
+observation batches as they arrive with a bounded number of warm-started
+update steps, instead of retraining from scratch for every new batch.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Dict, Any, Optional, Callable, Tuple
+from collections import deque
+import copy
+import queue
+import threading
+import time
+
+from utils.trainer import PINNTrainer
+
+
+class StreamingAssimilator:
+    """Online assimilation of observation batches into a live PINN.
+
+    Observations enter a sliding window of the most recent points; points
+    that leave the window go into a bounded replay buffer (reservoir sampled)
+    so the model does not forget older observations. Every batch triggers at
+    most ``max_steps`` optimizer steps over the physics/boundary/initial terms
+    plus the window and a replay sample. The optimizer state is kept between
+    batches, so each update continues from the previous one.
+
+    Predictions are served from a published snapshot of the model. A new
+    snapshot is swapped in after each update, so readers never see
+    half-updated weights.
+    """
+
+    def __init__(self, trainer: PINNTrainer, background_data: Dict[str, Any],
+                 physics_fn: Callable, weights: Optional[Dict[str, float]] = None,
+                 window_size: int = 512, replay_size: int = 4096, replay_batch: int = 256,
+                 max_steps: int = 20, max_update_time: Optional[float] = None,
+                 tolerance: float = 0.0, learning_rate: float = 0.001,
+                 optimizer_type: str = "adam"):
+        """Initialize the streaming assimilator.
+
+        Args:
+            trainer (PINNTrainer): Trainer holding the (pre-trained) live model.
+            background_data (Dict[str, Any]): Collocation, boundary and initial data.
+            physics_fn (Callable): Physics function.
+            weights (Dict[str, float], optional): Loss weights.
+            window_size (int): Number of most recent observations in the sliding window.
+            replay_size (int): Capacity of the replay buffer of older observations.
+            replay_batch (int): Replay points mixed into every update step.
+            max_steps (int): Maximum optimizer steps per observation batch.
+            max_update_time (float, optional): Time budget per update in seconds.
+            tolerance (float): Stop an update early once the data loss is below this value.
+            learning_rate (float): Learning rate for the update optimizer.
+            optimizer_type (str): Optimizer used for updates ('adam', 'sgd', 'adamw').
+        """
+        self.trainer = trainer
+        self.background_data = {
+            key: value for key, value in background_data.items()
+            if key not in ('x_data', 'u_data', 't_data')
+        }
+        self.physics_fn = physics_fn
+        self.weights = weights or {'physics': 1.0, 'boundary': 1.0, 'initial': 1.0, 'data': 1.0}
+        self.window_size = window_size
+        self.replay_size = replay_size
+        self.replay_batch = replay_batch
+        self.max_steps = max_steps
+        self.max_update_time = max_update_time
+        self.tolerance = tolerance
+        self.logger = trainer.logger
+
+        if trainer.optimizer is None or isinstance(trainer.optimizer, torch.optim.LBFGS):
+            trainer.setup_optimizer(learning_rate, optimizer_type)
+        if 'data' not in [term.name for term in trainer.loss_terms]:
+            trainer.add_loss_term('data')
+
+        # Observation buffers
+        self.x_window = None
+        self.u_window = None
+        self.x_replay = None
+        self.u_replay = None
+        self.replay_seen = 0
+
+        # Statistics
+        self.latencies = deque(maxlen=1000)
+        self.n_updates = 0
+        self.n_observations = 0
+
+        self._update_lock = threading.Lock()
+        self._queue = None
+        self._worker = None
+
+        self._version = 0
+        self._published = None
+        self.publish()
+
+        self.logger.log_purpose_specific_info(
+            f"Streaming assimilation started (window={window_size}, replay={replay_size}, max_steps={max_steps})"
+        )
+
+    def publish(self) -> int:
+        """Publish a snapshot of the live model for prediction.
+
+        Returns:
+            int: Version number of the published snapshot.
+        """
+        snapshot = copy.deepcopy(self.trainer.model)
+        snapshot.eval()
+        for param in snapshot.parameters():
+            param.requires_grad_(False)
+
+        self._version += 1
+        # Single reference assignment: readers see either the old or the new snapshot
+        self._published = (self._version, snapshot)
+        return self._version
+
+    @property
+    def version(self) -> int:
+        """Version number of the currently published snapshot."""
+        return self._published[0]
+
+    def predict(self, x: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
+        """Predict with the most recently published snapshot.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates.
+            t (torch.Tensor): Temporal coordinates.
+
+        Returns:
+            torch.Tensor: Predicted solution values.
+        """
+        _, model = self._published
+        with torch.no_grad():
+            return model(torch.cat([x, t], dim=1))
+
+    def _add_to_replay(self, x: torch.Tensor, u: torch.Tensor) -> None:
+        """Insert evicted observations into the replay buffer by reservoir sampling."""
+        if self.replay_size <= 0 or x.shape[0] == 0:
+            return
+
+        if self.x_replay is None:
+            self.x_replay = x.new_empty((0, x.shape[1]))
+            self.u_replay = u.new_empty((0, u.shape[1]))
+
+        # Fill free slots first
+        n_free = self.replay_size - self.x_replay.shape[0]
+        if n_free > 0:
+            self.x_replay = torch.cat([self.x_replay, x[:n_free]], dim=0)
+            self.u_replay = torch.cat([self.u_replay, u[:n_free]], dim=0)
+            self.replay_seen += min(n_free, x.shape[0])
+            x, u = x[n_free:], u[n_free:]
+            if x.shape[0] == 0:
+                return
+
+        # Point number k (1-based) replaces a random slot with probability size/k
+        seen = self.replay_seen + torch.arange(1, x.shape[0] + 1)
+        slots = (torch.rand(x.shape[0]) * seen).long()
+        accepted = slots < self.replay_size
+        self.x_replay[slots[accepted]] = x[accepted]
+        self.u_replay[slots[accepted]] = u[accepted]
+        self.replay_seen += x.shape[0]
+
+    def _add_observations(self, x_obs: torch.Tensor, u_obs: torch.Tensor) -> None:
+        """Append observations to the sliding window, evicting old ones to the replay buffer."""
+        if self.x_window is None:
+            self.x_window, self.u_window = x_obs, u_obs
+        else:
+            self.x_window = torch.cat([self.x_window, x_obs], dim=0)
+            self.u_window = torch.cat([self.u_window, u_obs], dim=0)
+
+        n_evict = self.x_window.shape[0] - self.window_size
+        if n_evict > 0:
+            self._add_to_replay(self.x_window[:n_evict], self.u_window[:n_evict])
+            self.x_window = self.x_window[n_evict:]
+            self.u_window = self.u_window[n_evict:]
+
+        self.n_observations += x_obs.shape[0]
+
+    def _assemble_data(self) -> Dict[str, Any]:
+        """Build the training data for one update step."""
+        x_data, u_data = self.x_window, self.u_window
+        if self.x_replay is not None and self.x_replay.shape[0] > 0 and self.replay_batch > 0:
+            n_replay = self.x_replay.shape[0]
+            if n_replay > self.replay_batch:
+                index = torch.randint(n_replay, (self.replay_batch,))
+                x_replay, u_replay = self.x_replay[index], self.u_replay[index]
+            else:
+                x_replay, u_replay = self.x_replay, self.u_replay
+            x_data = torch.cat([x_data, x_replay], dim=0)
+            u_data = torch.cat([u_data, u_replay], dim=0)
+
+        train_data = dict(self.background_data)
+        train_data['x_data'] = x_data
+        train_data['u_data'] = u_data
+        return train_data
+
+    def update(self, x_obs: torch.Tensor, u_obs: torch.Tensor) -> Dict[str, Any]:
+        """Assimilate one observation batch and publish the updated model.
+
+        Args:
+            x_obs (torch.Tensor): Observation coordinates of shape (n, 2) as (x, t).
+            u_obs (torch.Tensor): Observed values of shape (n, 1).
+
+        Returns:
+            Dict[str, Any]: Update report with version, steps, losses and latency.
+        """
+        with self._update_lock:
+            start_time = time.perf_counter()
+
+            self._add_observations(x_obs.detach(), u_obs.detach())
+
+            self.trainer.model.train()
+            steps = 0
+            losses = {}
+            for steps in range(1, self.max_steps + 1):
+                losses = self.trainer._step(self._assemble_data(), self.physics_fn, self.weights)
+                if losses['data_loss'].item() <= self.tolerance:
+                    break
+                if (self.max_update_time is not None and
+                        time.perf_counter() - start_time >= self.max_update_time):
+                    break
+
+            version = self.publish()
+            latency = time.perf_counter() - start_time
+            self.latencies.append(latency)
+            self.n_updates += 1
+
+        report = {
+            'version': version,
+            'steps': steps,
+            'latency': latency,
+            'n_window': self.x_window.shape[0],
+            'n_replay': 0 if self.x_replay is None else self.x_replay.shape[0]
+        }
+        report.update({key: value.item() for key, value in losses.items()})
+
+        self.logger.log_equation_specific_info(
+            f"Assimilation update {version}: {steps} steps, "
+            f"data loss {report.get('data_loss', float('nan')):.6e}, latency {latency * 1000:.1f} ms"
+        )
+
+        return report
+
+    def submit(self, x_obs: torch.Tensor, u_obs: torch.Tensor) -> None:
+        """Queue an observation batch for the background worker.
+
+        Args:
+            x_obs (torch.Tensor): Observation coordinates of shape (n, 2) as (x, t).
+            u_obs (torch.Tensor): Observed values of shape (n, 1).
+        """
+        if self._worker is None:
+            self.start()
+        self._queue.put((x_obs, u_obs))
+
+    def _run_worker(self) -> None:
+        """Process queued batches; batches that piled up are merged into one update."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batches = [item]
+            stop = False
+            while True:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batches.append(pending)
+
+            try:
+                self.update(torch.cat([x for x, _ in batches], dim=0),
+                            torch.cat([u for _, u in batches], dim=0))
+            except Exception as e:
+                self.logger.log_error(e, "streaming assimilation update")
+
+            if stop:
+                return
+
+    def start(self) -> None:
+        """Start the background worker that processes submitted batches."""
+        if self._worker is not None:
+            return
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run_worker, daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background worker after the queued batches are processed.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the worker.
+        """
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join(timeout)
+        self._worker = None
+        self._queue = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming statistics including per-update latency.
+
+        Returns:
+            Dict[str, Any]: Statistics.
+        """
+        latencies = np.array(self.latencies) if self.latencies else np.zeros(1)
+        return {
+            'version': self.version,
+            'n_updates': self.n_updates,
+            'n_observations': self.n_observations,
+            'latency_mean': float(latencies.mean()),
+            'latency_p50': float(np.percentile(latencies, 50)),
+            'latency_p95': float(np.percentile(latencies, 95)),
+            'latency_max': float(latencies.max())
+        }
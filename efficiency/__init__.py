@@ -7,9 +7,15 @@ Computational efficiency improvements for PINNs. Optimize training strategies, n
 from .trainer import EfficiencyTrainer
 from .evaluator import EfficiencyEvaluator
 from .models import EfficiencyPINN
+from .benchmarks import benchmark_optimizers
+from .compression import compress_model, distill, prune_neurons
 
 __all__ = [
     'EfficiencyTrainer',
     'EfficiencyEvaluator', 
-    'EfficiencyPINN'
+    'EfficiencyPINN',
+    'benchmark_optimizers',
+    'compress_model',
+    'distill',
+    'prune_neurons'
 ]
@@ -0,0 +1,80 @@
+"""
+Efficiency Benchmarks for PINN Research Platform.
+
+This module compares optimizers on the same PINN problem: every optimizer
+trains an identically initialized model and is scored by final loss, wall
+time and the number of iterations needed to reach a target loss.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Any, Callable, Dict, Optional
+import time
+
+from .trainer import EfficiencyTrainer
+
+
+# Learning rate and iteration budget per optimizer. L-BFGS runs up to 20
+# inner iterations per step; for 'lm' the learning rate is the initial damping.
+DEFAULT_OPTIMIZER_SETTINGS = {
+    'adam': {'learning_rate': 1e-3, 'epochs': 10000},
+    'lbfgs': {'learning_rate': 1.0, 'epochs': 500},
+    'lm': {'learning_rate': 1e-3, 'epochs': 300}
+}
+
+
+def benchmark_optimizers(model_fn: Callable[[], nn.Module], train_data: Dict[str, Any],
+                         physics_fn: Callable, equation: str,
+                         optimizers: Optional[Dict[str, Dict[str, Any]]] = None,
+                         weights: Optional[Dict[str, float]] = None,
+                         target_loss: float = 1e-6, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """Train the same model with several optimizers and compare convergence.
+
+    Args:
+        model_fn (Callable[[], nn.Module]): Builds a fresh model (e.g. a 4x20 MLP).
+        train_data (Dict[str, Any]): Training data.
+        physics_fn (Callable): Physics function (``functools.partial`` with coefficients for 'lm').
+        equation (str): Equation type.
+        optimizers (Dict[str, Dict[str, Any]], optional): Settings ('learning_rate', 'epochs')
+            per optimizer type (default DEFAULT_OPTIMIZER_SETTINGS).
+        weights (Dict[str, float], optional): Loss weights.
+        target_loss (float): Total loss counted as converged.
+        seed (int): Seed for the model initialization, shared by all optimizers.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Per optimizer 'final_loss', 'best_loss', 'training_time',
+        'iterations', 'iterations_to_target' and 'time_to_target' (None if not reached),
+        and 'loss_history'.
+    """
+    optimizers = optimizers or DEFAULT_OPTIMIZER_SETTINGS
+    results = {}
+
+    for optimizer_type, settings in optimizers.items():
+        torch.manual_seed(seed)
+        trainer = EfficiencyTrainer(model_fn(), 'efficiency', equation)
+        trainer.setup_optimizer(settings.get('learning_rate', 1e-3), optimizer_type)
+
+        epochs = settings.get('epochs', 1000)
+        start_time = time.perf_counter()
+        history = trainer.train(train_data, physics_fn, epochs=epochs, weights=weights,
+                                save_interval=epochs)
+        training_time = time.perf_counter() - start_time
+
+        losses = np.asarray(history['total_loss'])
+        reached = np.nonzero(losses <= target_loss)[0]
+        iterations_to_target = int(reached[0]) + 1 if len(reached) else None
+
+        results[optimizer_type] = {
+            'final_loss': float(losses[-1]),
+            'best_loss': float(losses.min()),
+            'training_time': training_time,
+            'iterations': epochs,
+            'iterations_to_target': iterations_to_target,
+            # Steps take roughly constant time, so scale the total by the fraction used
+            'time_to_target': (training_time * iterations_to_target / epochs
+                               if iterations_to_target is not None else None),
+            'loss_history': losses.tolist()
+        }
+
+    return results
@@ -0,0 +1,315 @@
+"""
+Efficiency Compression for PINN Research Platform.
+
+This module compresses trained PINNs for cheaper prediction. Hidden neurons
+are pruned structurally (whole rows and columns removed, so the layers get
+smaller rather than sparse) by weight magnitude, each pruning step followed
+by a short physics-informed fine-tuning. The teacher is then distilled into a
+narrower MLP from its outputs and PDE residuals at collocation points. Every
+step is scored by parameter count, prediction time and accuracy.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import copy
+import time
+
+from utils.models import MLP
+from utils.trainer import DistillationLoss
+from .models import EfficiencyPINN
+from .trainer import EfficiencyTrainer
+
+
+def layer_stack(model: nn.Module) -> nn.Sequential:
+    """Get the layer stack of a model built as a single ``network`` Sequential.
+
+    Args:
+        model (nn.Module): Model (e.g. MLP, EfficiencyPINN).
+
+    Returns:
+        nn.Sequential: The model's layers.
+    """
+    network = getattr(model, 'network', None)
+    if not isinstance(network, nn.Sequential) or \
+            sum(1 for _ in model.parameters()) != sum(1 for _ in network.parameters()):
+        raise ValueError(f"Structured pruning needs a model whose layers form one `network` "
+                         f"nn.Sequential, got {model.__class__.__name__}")
+    return network
+
+
+def neuron_importance(model: nn.Module) -> List[torch.Tensor]:
+    """Magnitude importance of every hidden neuron.
+
+    A neuron scores the norm of its incoming weights (and bias) times the
+    norm of its outgoing weights, i.e. how much signal it can pass on.
+
+    Args:
+        model (nn.Module): Model with a ``network`` layer stack.
+
+    Returns:
+        List[torch.Tensor]: Scores per hidden layer.
+    """
+    linear_layers = [m for m in layer_stack(model) if isinstance(m, nn.Linear)]
+    scores = []
+    for layer, next_layer in zip(linear_layers[:-1], linear_layers[1:]):
+        incoming = layer.weight
+        if layer.bias is not None:
+            incoming = torch.cat([incoming, layer.bias.unsqueeze(1)], dim=1)
+        scores.append((incoming.norm(dim=1) * next_layer.weight.norm(dim=0)).detach())
+    return scores
+
+
+def prune_neurons(model: nn.Module, hidden_dims: List[int]) -> nn.Module:
+    """Remove the least important hidden neurons.
+
+    Args:
+        model (nn.Module): Model with a ``network`` layer stack.
+        hidden_dims (List[int]): Neurons to keep per hidden layer.
+
+    Returns:
+        nn.Module: Pruned copy of the model (the original is unchanged).
+    """
+    pruned = copy.deepcopy(model)
+    network = layer_stack(pruned)
+    indices = [i for i, m in enumerate(network) if isinstance(m, nn.Linear)]
+    if len(hidden_dims) != len(indices) - 1:
+        raise ValueError(f"Expected {len(indices) - 1} hidden layer widths, got {len(hidden_dims)}")
+
+    scores = neuron_importance(pruned)
+    widths = [min(width, len(layer_scores)) for width, layer_scores in zip(hidden_dims, scores)]
+    kept_inputs = None
+    for k, index in enumerate(indices):
+        layer = network[index]
+        weight = layer.weight.detach()
+        bias = layer.bias.detach() if layer.bias is not None else None
+        if kept_inputs is not None:
+            weight = weight[:, kept_inputs]
+
+        kept_inputs = None
+        if k < len(hidden_dims):
+            kept_inputs = torch.topk(scores[k], widths[k]).indices.sort().values
+            weight = weight[kept_inputs]
+            bias = bias[kept_inputs] if bias is not None else None
+
+        smaller = nn.Linear(weight.shape[1], weight.shape[0], bias=bias is not None).to(weight)
+        with torch.no_grad():
+            smaller.weight.copy_(weight)
+            if bias is not None:
+                smaller.bias.copy_(bias)
+        network[index] = smaller
+
+    if hasattr(pruned, 'hidden_dims'):
+        pruned.hidden_dims = widths
+    return pruned
+
+
+def collocation_targets(model: nn.Module, points: torch.Tensor, physics_fn: Callable,
+                        equation: str) -> Dict[str, torch.Tensor]:
+    """Predictions and PDE residuals of a model at collocation points.
+
+    Args:
+        model (nn.Module): Teacher model.
+        points (torch.Tensor): Collocation points of shape (n, input_dim).
+        physics_fn (Callable): Physics function.
+        equation (str): Equation type.
+
+    Returns:
+        Dict[str, torch.Tensor]: 'x_distill', 'u_teacher' and 'r_teacher' (detached).
+    """
+    trainer = EfficiencyTrainer(model, 'efficiency', equation, loss_terms=['physics'])
+    residual = trainer.compute_residuals({'x': points}, physics_fn)['physics'].detach()
+    with torch.no_grad():
+        outputs = model(points)
+    return {'x_distill': points.detach(), 'u_teacher': outputs, 'r_teacher': residual}
+
+
+def fine_tune(model: nn.Module, train_data: Dict[str, Any], physics_fn: Callable, equation: str,
+              epochs: int = 1000, learning_rate: float = 1e-3,
+              weights: Optional[Dict[str, float]] = None,
+              loss_terms: Optional[List[Any]] = None) -> Dict[str, list]:
+    """Train a model for a few physics-informed steps.
+
+    Args:
+        model (nn.Module): Model to train (in place).
+        train_data (Dict[str, Any]): Training data.
+        physics_fn (Callable): Physics function.
+        equation (str): Equation type.
+        epochs (int): Number of steps.
+        learning_rate (float): Adam learning rate.
+        weights (Dict[str, float], optional): Loss weights.
+        loss_terms (List[Any], optional): Loss terms (default: the efficiency trainer's).
+
+    Returns:
+        Dict[str, list]: Training history.
+    """
+    trainer = EfficiencyTrainer(model, 'efficiency', equation, loss_terms)
+    trainer.setup_optimizer(learning_rate, 'adam')
+    return trainer.train(train_data, physics_fn, epochs=epochs, weights=weights, save_interval=epochs)
+
+
+def distill(teacher: nn.Module, student: nn.Module, train_data: Dict[str, Any], physics_fn: Callable,
+            equation: str, epochs: int = 5000, learning_rate: float = 1e-3, residual_weight: float = 1.0,
+            points: Optional[torch.Tensor] = None,
+            weights: Optional[Dict[str, float]] = None) -> Dict[str, list]:
+    """Distill a teacher PINN into a (smaller) student.
+
+    The student is trained on the usual physics, boundary and initial losses
+    plus the 'distillation' loss: the mismatch to the teacher's predictions
+    and PDE residuals at the collocation points.
+
+    Args:
+        teacher (nn.Module): Trained teacher model.
+        student (nn.Module): Student model (trained in place).
+        train_data (Dict[str, Any]): Training data.
+        physics_fn (Callable): Physics function.
+        equation (str): Equation type.
+        epochs (int): Number of training steps.
+        learning_rate (float): Adam learning rate.
+        residual_weight (float): Weight of the residual mismatch in the distillation loss.
+        points (torch.Tensor, optional): Distillation points (default: the interior points 'x').
+        weights (Dict[str, float], optional): Loss weights.
+
+    Returns:
+        Dict[str, list]: Training history.
+    """
+    data = dict(train_data)
+    data.update(collocation_targets(teacher, train_data['x'] if points is None else points,
+                                    physics_fn, equation))
+    loss_terms = list(EfficiencyTrainer.default_loss_terms) + [DistillationLoss(residual_weight)]
+    return fine_tune(student, data, physics_fn, equation, epochs, learning_rate, weights, loss_terms)
+
+
+def build_student(teacher: nn.Module, hidden_dims: List[int], activation: Optional[str] = None,
+                  input_dim: Optional[int] = None, output_dim: Optional[int] = None) -> nn.Module:
+    """Build an untrained student of the teacher's architecture family.
+
+    An EfficiencyPINN teacher gets an EfficiencyPINN student (so e.g. 'sin'
+    activations carry over); any other teacher gets an MLP. Unsupported
+    activations raise here, before any pruning or training.
+
+    Args:
+        teacher (nn.Module): Teacher model.
+        hidden_dims (List[int]): Student hidden layer widths.
+        activation (str, optional): Student activation (default: the teacher's).
+        input_dim (int, optional): Input dimension (default: the teacher's).
+        output_dim (int, optional): Output dimension (default: the teacher's).
+
+    Returns:
+        nn.Module: Student model.
+    """
+    input_dim = input_dim if input_dim is not None else getattr(teacher, 'input_dim', None)
+    output_dim = output_dim if output_dim is not None else getattr(teacher, 'output_dim', None)
+    if input_dim is None or output_dim is None:
+        raise ValueError(f"Cannot infer the dimensions of a {teacher.__class__.__name__} teacher: "
+                         f"pass input_dim and output_dim")
+
+    if isinstance(teacher, EfficiencyPINN):
+        activation = activation or teacher.hidden_activation
+        if activation.lower() not in ('tanh', 'sin', 'softplus', 'sigmoid', 'relu'):
+            raise ValueError(f"Unsupported activation: {activation}")
+        return EfficiencyPINN(input_dim, output_dim, hidden_dims, activation, teacher.output_activation,
+                              weight_init=teacher.weight_init)
+
+    return MLP(input_dim, output_dim, hidden_dims,
+               activation or getattr(teacher, 'activation_name', 'tanh'),
+               getattr(teacher, 'output_activation_name', 'linear'))
+
+
+def measure_model(model: nn.Module, inputs: torch.Tensor, targets: torch.Tensor,
+                  repeats: int = 5) -> Dict[str, float]:
+    """Parameter count, prediction time and accuracy of a model.
+
+    Args:
+        model (nn.Module): Model.
+        inputs (torch.Tensor): Validation inputs.
+        targets (torch.Tensor): Reference values at the inputs.
+        repeats (int): Timed predictions (the median is reported).
+
+    Returns:
+        Dict[str, float]: 'parameters', 'prediction_time', 'relative_l2' and 'max_error'.
+    """
+    model.eval()
+    times = []
+    with torch.no_grad():
+        for _ in range(repeats):
+            start = time.perf_counter()
+            outputs = model(inputs)
+            times.append(time.perf_counter() - start)
+
+    error = outputs - targets
+    return {
+        'parameters': sum(p.numel() for p in model.parameters()),
+        'prediction_time': float(np.median(times)),
+        'relative_l2': (torch.norm(error) / torch.norm(targets).clamp_min(1e-12)).item(),
+        'max_error': error.abs().max().item()
+    }
+
+
+def compress_model(teacher: nn.Module, train_data: Dict[str, Any], physics_fn: Callable, equation: str,
+                   validation_inputs: torch.Tensor, validation_targets: Optional[torch.Tensor] = None,
+                   prune_fractions: Sequence[float] = (0.25, 0.5, 0.75), fine_tune_epochs: int = 1000,
+                   student_hidden_dims: Optional[List[int]] = None, student_activation: Optional[str] = None,
+                   distill_epochs: int = 5000, learning_rate: float = 1e-3,
+                   weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Prune and distill a trained PINN and report the speed/accuracy trade-off.
+
+    Pruning is progressive: step k removes ``prune_fractions[k]`` of the
+    teacher's hidden neurons (per layer) from the previous, fine-tuned step.
+    The student is distilled from the unpruned teacher.
+
+    Args:
+        teacher (nn.Module): Trained model with a ``network`` layer stack (MLP, EfficiencyPINN).
+        train_data (Dict[str, Any]): Training data (fine-tuning and distillation).
+        physics_fn (Callable): Physics function.
+        equation (str): Equation type.
+        validation_inputs (torch.Tensor): Inputs for timing and accuracy (e.g. the results grid).
+        validation_targets (torch.Tensor, optional): Reference solution (default: teacher predictions).
+        prune_fractions (Sequence[float]): Fractions of hidden neurons removed, increasing.
+        fine_tune_epochs (int): Fine-tuning steps after each pruning step.
+        student_hidden_dims (List[int], optional): Student widths (default: a quarter of the teacher's).
+        student_activation (str, optional): Student activation (default: the teacher's); the
+            student has the teacher's class, see ``build_student``.
+        distill_epochs (int): Distillation steps (0 skips the student).
+        learning_rate (float): Adam learning rate for fine-tuning and distillation.
+        weights (Dict[str, float], optional): Loss weights.
+
+    Returns:
+        Dict[str, Any]: 'models' and 'report' keyed by step ('teacher', 'pruned_<percent>',
+        'student'); report entries also carry 'speedup' and 'relative_l2_teacher'.
+    """
+    with torch.no_grad():
+        teacher_outputs = teacher.eval()(validation_inputs)
+    targets = teacher_outputs if validation_targets is None else validation_targets
+    hidden_dims = [scores.numel() for scores in neuron_importance(teacher)]
+    student = None
+    if distill_epochs > 0:
+        student = build_student(teacher, student_hidden_dims or [max(1, width // 4) for width in hidden_dims],
+                                student_activation, validation_inputs.shape[1], teacher_outputs.shape[1])
+
+    models = {'teacher': teacher}
+    model = teacher
+    for fraction in prune_fractions:
+        widths = [max(1, int(round(width * (1.0 - fraction)))) for width in hidden_dims]
+        model = prune_neurons(model, widths)
+        if fine_tune_epochs > 0:
+            fine_tune(model.train(), train_data, physics_fn, equation, fine_tune_epochs, learning_rate, weights)
+        models[f"pruned_{int(round(100 * fraction))}"] = model
+
+    if student is not None:
+        distill(teacher, student, train_data, physics_fn, equation, distill_epochs, learning_rate,
+                weights=weights)
+        models['student'] = student
+
+    report = {}
+    for name, model in models.items():
+        report[name] = measure_model(model, validation_inputs, targets)
+        with torch.no_grad():
+            outputs = model(validation_inputs)
+        report[name]['relative_l2_teacher'] = (torch.norm(outputs - teacher_outputs) /
+                                               torch.norm(teacher_outputs).clamp_min(1e-12)).item()
+    for name in report:
+        report[name]['speedup'] = report['teacher']['prediction_time'] / max(report[name]['prediction_time'], 1e-12)
+
+    return {'models': models, 'report': report}
@@ -12,6 +12,17 @@ from typing import List, Tuple, Optional, Dict, Any
 import math
 
 from utils.loggers import get_purpose_logger
+from utils.models import init_linear_weights
+
+
+class SinActivation(nn.Module):
+    """Sine activation function for high-frequency problems."""
+    
+    def __init__(self):
+        super(SinActivation, self).__init__()
+    
+    def forward(self, x):
+        return torch.sin(x)
 
 
 class EfficiencyPINN(nn.Module):
@@ -45,14 +56,6 @@ class EfficiencyPINN(nn.Module):
         self.dropout_rate = dropout_rate
         self.use_fourier_features = use_fourier_features
         
-        # Build network (implement specific architecture for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        layers = []
-        prev_dim = input_dim
-        
-        # Initialize weights
-        self._init_weights(weight_init)
-        
         # Build network layers
         layers = []
         prev_dim = input_dim
@@ -91,6 +94,9 @@ class EfficiencyPINN(nn.Module):
         # linear activation (no activation) is default
         
         self.network = nn.Sequential(*layers)
+        
+        # Initialize weights
+        init_linear_weights(self, weight_init)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass.
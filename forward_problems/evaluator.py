@@ -14,6 +14,7 @@ import seaborn as sns
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from utils.loggers import get_purpose_logger
+from utils.inference import LastLayerLaplace, has_dropout, mc_dropout_predict, optimize_for_inference
 
 
 class ForwardProblemsEvaluator:
@@ -33,24 +34,164 @@ class ForwardProblemsEvaluator:
         self.logger = get_purpose_logger(purpose, equation)
         
         self.model.eval()  # Set model to evaluation mode
+        self.laplace = None
+        self.serving_model = None
         
         self.logger.log_purpose_specific_info("ForwardProblems Evaluator initialized")
 
-    def predict(self, x: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
+    def _inputs(self, x: torch.Tensor, t: torch.Tensor,
+                parameters: Optional[Dict[str, float]] = None) -> torch.Tensor:
+        """Assemble model inputs, appending coefficient columns for parametric models."""
+        inputs = torch.cat([x, t], dim=1)
+        parameter_names = getattr(self.model, 'parameter_names', None)
+        if parameter_names:
+            if parameters is None:
+                raise ValueError(f"Parametric model needs coefficient values for {parameter_names}")
+            theta = torch.tensor([parameters[name] for name in parameter_names], dtype=inputs.dtype)
+            inputs = torch.cat([inputs, theta.expand(inputs.shape[0], -1)], dim=1)
+        return inputs
+
+    def predict(self, x: torch.Tensor, t: torch.Tensor,
+                parameters: Optional[Dict[str, float]] = None) -> torch.Tensor:
         """Make predictions using the trained model.
 
         Args:
             x (torch.Tensor): Spatial coordinates.
             t (torch.Tensor): Temporal coordinates.
+            parameters (Dict[str, float], optional): Coefficient values for a parametric model.
 
         Returns:
             torch.Tensor: Predicted solution values.
         """
+        model = self.serving_model if self.serving_model is not None else self.model
         with torch.no_grad():
-            inputs = torch.cat([x, t], dim=1)
-            predictions = self.model(inputs)
+            inputs = self._inputs(x, t, parameters)
+            predictions = model(inputs)
         return predictions
 
+    @staticmethod
+    def _grid_axes(x_grid: np.ndarray, t_grid: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray, bool]]:
+        """Recover the axes of a tensor-product grid.
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray, bool]]: x axis, t axis and whether the
+            grid has x along its second dimension ('xy' indexing); None for other grids.
+        """
+        if x_grid.ndim != 2 or x_grid.shape != t_grid.shape:
+            return None
+        if np.all(x_grid == x_grid[:, :1]) and np.all(t_grid == t_grid[:1, :]):
+            return x_grid[:, 0], t_grid[0, :], False
+        if np.all(x_grid == x_grid[:1, :]) and np.all(t_grid == t_grid[:, :1]):
+            return x_grid[0, :], t_grid[:, 0], True
+        return None
+
+    def predict_on_grid(self, x_grid: np.ndarray, t_grid: np.ndarray) -> Optional[torch.Tensor]:
+        """Predict on a tensor-product grid with a separable model.
+
+        The axis networks are evaluated once per grid line (nx + nt calls)
+        and combined by an outer product.
+
+        Args:
+            x_grid (np.ndarray): Spatial grid (meshgrid, 'ij' or 'xy' indexing).
+            t_grid (np.ndarray): Temporal grid.
+
+        Returns:
+            Optional[torch.Tensor]: Predictions of shape (x_grid.size, outputs), or None
+            if the model is not separable or the grid is not a tensor product.
+        """
+        if not hasattr(self.model, 'forward_grid'):
+            return None
+        axes = self._grid_axes(x_grid, t_grid)
+        if axes is None:
+            return None
+
+        x_axis, t_axis, transposed = axes
+        with torch.no_grad():
+            u = self.model.forward_grid([torch.FloatTensor(x_axis), torch.FloatTensor(t_axis)])
+        if transposed:
+            u = u.transpose(0, 1)
+        return u.reshape(-1, u.shape[-1])
+
+    def optimize_for_serving(self, x_grid: np.ndarray, t_grid: np.ndarray, quantize: bool = False,
+                             tolerance: float = 1e-3,
+                             parameters: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Switch predictions to a frozen (optionally int8) inference graph.
+
+        The optimized graph is validated against the trained model on the
+        given grid and only used if it stays within the tolerance; otherwise
+        the evaluator keeps its current serving model (the trained model if
+        none was deployed before).
+
+        Args:
+            x_grid (np.ndarray): Spatial validation grid.
+            t_grid (np.ndarray): Temporal validation grid.
+            quantize (bool): Apply dynamic int8 quantization to the hidden layers.
+            tolerance (float): Maximum relative L2 error against the trained model.
+            parameters (Dict[str, float], optional): Coefficient values for a parametric model.
+
+        Returns:
+            Dict[str, Any]: Accuracy and timing report ('deployed' tells whether it is used).
+        """
+        inputs = self._inputs(torch.FloatTensor(x_grid.reshape(-1, 1)),
+                              torch.FloatTensor(t_grid.reshape(-1, 1)), parameters)
+        try:
+            self.serving_model, report = optimize_for_inference(self.model, inputs, quantize, tolerance)
+            report['deployed'] = True
+        except ValueError as e:
+            self.logger.log_error(e, "Optimized model not deployed; keeping the previous serving model")
+            report = {'quantized': quantize, 'tolerance': tolerance, 'deployed': False, 'error': str(e)}
+        return report
+
+    def fit_laplace(self, x: torch.Tensor, t: torch.Tensor, u: Optional[torch.Tensor] = None,
+                    noise_std: Optional[float] = None, prior_precision: float = 1.0,
+                    parameters: Optional[Dict[str, float]] = None) -> LastLayerLaplace:
+        """Fit a last-layer Laplace approximation for uncertainty-aware prediction.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates of the fitting points.
+            t (torch.Tensor): Temporal coordinates of the fitting points.
+            u (torch.Tensor, optional): Target values used to estimate the noise.
+            noise_std (float, optional): Observation noise standard deviation.
+            prior_precision (float): Prior precision of the last-layer weights.
+            parameters (Dict[str, float], optional): Coefficient values for a parametric model.
+
+        Returns:
+            LastLayerLaplace: Fitted Laplace approximation (cached on the evaluator).
+        """
+        self.laplace = LastLayerLaplace(self.model, prior_precision).fit(
+            self._inputs(x, t, parameters), u, noise_std
+        )
+        return self.laplace
+
+    def predict_with_uncertainty(self, x: torch.Tensor, t: torch.Tensor,
+                                 method: str = "mc_dropout", num_samples: int = 50,
+                                 parameters: Optional[Dict[str, float]] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Predict mean and standard deviation in one vectorized call.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates.
+            t (torch.Tensor): Temporal coordinates.
+            method (str): 'mc_dropout' (replicated single-pass dropout sampling) or
+                'laplace' (requires fit_laplace first).
+            num_samples (int): Number of dropout samples.
+            parameters (Dict[str, float], optional): Coefficient values for a parametric model.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Predictive mean and standard deviation.
+        """
+        inputs = self._inputs(x, t, parameters)
+        
+        if method.lower() == "mc_dropout":
+            if not has_dropout(self.model):
+                raise ValueError("MC dropout requires a model with dropout_rate > 0")
+            return mc_dropout_predict(self.model, inputs, num_samples)
+        elif method.lower() == "laplace":
+            if self.laplace is None:
+                raise ValueError("Call fit_laplace before predicting with method='laplace'")
+            return self.laplace.predict(inputs)
+        else:
+            raise ValueError(f"Unsupported uncertainty method: {method}")
+
     def compute_metrics(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
         """Compute evaluation metrics.
 
@@ -84,13 +225,18 @@ class ForwardProblemsEvaluator:
         return metrics
 
     def evaluate_on_grid(self, x_grid: np.ndarray, t_grid: np.ndarray,
-                        u_true: np.ndarray) -> Dict[str, Any]:
+                        u_true: np.ndarray, uncertainty_method: Optional[str] = None,
+                        num_samples: int = 50,
+                        parameters: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """Evaluate model on a regular grid.
 
         Args:
             x_grid (np.ndarray): Spatial grid.
             t_grid (np.ndarray): Temporal grid.
             u_true (np.ndarray): True solution on grid.
+            uncertainty_method (str, optional): 'mc_dropout' or 'laplace' to add error bars.
+            num_samples (int): Number of dropout samples.
+            parameters (Dict[str, float], optional): Coefficient values for a parametric model.
 
         Returns:
             Dict[str, Any]: Evaluation results.
@@ -100,7 +246,16 @@ class ForwardProblemsEvaluator:
         t_tensor = torch.FloatTensor(t_grid.flatten().reshape(-1, 1))
         
         # Make predictions
-        u_pred_tensor = self.predict(x_tensor, t_tensor)
+        u_std = None
+        if uncertainty_method is not None:
+            u_pred_tensor, u_std_tensor = self.predict_with_uncertainty(
+                x_tensor, t_tensor, uncertainty_method, num_samples, parameters
+            )
+            u_std = u_std_tensor.numpy().reshape(x_grid.shape)
+        else:
+            u_pred_tensor = self.predict_on_grid(x_grid, t_grid) if parameters is None else None
+            if u_pred_tensor is None:
+                u_pred_tensor = self.predict(x_tensor, t_tensor, parameters)
         u_pred = u_pred_tensor.numpy().reshape(x_grid.shape)
         
         # Compute metrics
@@ -114,6 +269,8 @@ class ForwardProblemsEvaluator:
             'x_grid': x_grid,
             't_grid': t_grid
         }
+        if u_std is not None:
+            results['uncertainty'] = u_std
         
         self.logger.log_equation_specific_info(f"Grid evaluation completed - R²: {metrics['r2']:.4f}")
         
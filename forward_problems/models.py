@@ -12,6 +12,8 @@ from typing import List, Tuple, Optional, Dict, Any
 import math
 
 from utils.loggers import get_purpose_logger
+from utils.models import ParametricPINN, init_linear_weights
+from utils.physics import get_coefficient_ranges
 
 
 
@@ -23,26 +25,7 @@ class SinActivation(nn.Module):
     
     def forward(self, x):
         return torch.sin(x)
-    
-    def __init__(self, weight_init: str = "xavier"):
-        """Initialize weights using specified method.
-        
-        Args:
-            weight_init (str): Weight initialization method.
-        """
-        for module in self.modules():
-            if isinstance(module, nn.Linear):
-                if weight_init.lower() == "xavier":
-                    nn.init.xavier_uniform_(module.weight)
-                elif weight_init.lower() == "normal":
-                    nn.init.normal_(module.weight, mean=0.0, std=0.1)
-                elif weight_init.lower() == "uniform":
-                    nn.init.uniform_(module.weight, -0.1, 0.1)
-                elif weight_init.lower() == "he":
-                    nn.init.kaiming_uniform_(module.weight)
-                
-                if module.bias is not None:
-                    nn.init.zeros_(module.bias)
+
 
 class ForwardProblemsPINN(nn.Module):
     """Physics-Informed Neural Network for forward problems."""
@@ -78,14 +61,6 @@ class ForwardProblemsPINN(nn.Module):
         self.dropout_rate = dropout_rate
         self.use_fourier_features = use_fourier_features
         
-        # Build network (implement specific architecture for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        layers = []
-        prev_dim = input_dim
-        
-        # Initialize weights
-        self._init_weights(weight_init)
-        
         # Build network layers
         layers = []
         prev_dim = input_dim
@@ -124,6 +99,9 @@ class ForwardProblemsPINN(nn.Module):
         # linear activation (no activation) is default
         
         self.network = nn.Sequential(*layers)
+        
+        # Initialize weights
+        init_linear_weights(self, weight_init)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass.
@@ -162,6 +140,16 @@ def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """
     if model_type.lower() == "standard":
         return ForwardProblemsPINN(**kwargs)
+    elif model_type.lower() == "parametric":
+        # Coefficient ranges either given directly or read from the equation parameter config
+        if 'parameter_ranges' not in kwargs:
+            kwargs['parameter_ranges'] = get_coefficient_ranges(
+                kwargs.pop('equation'), kwargs.pop('equation_parameters'), kwargs.pop('coefficients', None)
+            )
+        if 'hidden_activation' in kwargs:
+            kwargs['activation'] = kwargs.pop('hidden_activation')
+        kwargs.pop('input_dim', None)
+        return ParametricPINN(**kwargs)
     else:
         raise ValueError(f"Unsupported model type: {model_type}")
 
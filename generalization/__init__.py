@@ -4,12 +4,14 @@ Generalization Module for PINN Research Platform.
 Generalization capabilities of PINNs. Study how well PINNs generalize to unseen parameter regimes, geometries, and conditions.
 """
 
-from .trainer import GeneralizationTrainer
+from .trainer import GeneralizationTrainer, sample_initial_conditions
 from .evaluator import GeneralizationEvaluator
-from .models import GeneralizationPINN
+from .models import GeneralizationPINN, DeepONet
 
 __all__ = [
     'GeneralizationTrainer',
     'GeneralizationEvaluator', 
-    'GeneralizationPINN'
+    'GeneralizationPINN',
+    'DeepONet',
+    'sample_initial_conditions'
 ]
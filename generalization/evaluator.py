@@ -14,6 +14,7 @@ import seaborn as sns
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from utils.loggers import get_purpose_logger
+from .models import DeepONet
 
 
 class GeneralizationEvaluator:
@@ -33,24 +34,73 @@ class GeneralizationEvaluator:
         self.logger = get_purpose_logger(purpose, equation)
         
         self.model.eval()  # Set model to evaluation mode
+        self.trunk_cache = None
         
         self.logger.log_purpose_specific_info("Generalization Evaluator initialized")
 
-    def predict(self, x: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
+    def predict(self, x: torch.Tensor, t: torch.Tensor,
+                u_sensors: Optional[torch.Tensor] = None) -> torch.Tensor:
         """Make predictions using the trained model.
 
+        A DeepONet is evaluated through ``predict_operator`` for the single
+        input function given by ``u_sensors``.
+
         Args:
             x (torch.Tensor): Spatial coordinates.
             t (torch.Tensor): Temporal coordinates.
+            u_sensors (torch.Tensor, optional): Input function at the sensors, shape
+                (num_sensors,) or (1, num_sensors) (required for a DeepONet).
 
         Returns:
             torch.Tensor: Predicted solution values.
         """
+        if isinstance(self.model, DeepONet):
+            if u_sensors is None:
+                raise ValueError("A DeepONet needs the input function: pass u_sensors "
+                                 "or use predict_operator for a batch of functions")
+            return self.predict_operator(u_sensors.reshape(1, -1), x, t)[0]
+
         with torch.no_grad():
             inputs = torch.cat([x, t], dim=1)
             predictions = self.model(inputs)
         return predictions
 
+    def set_query_grid(self, x: torch.Tensor, t: torch.Tensor) -> None:
+        """Compute and cache the DeepONet trunk embedding of a query grid.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates of the grid points.
+            t (torch.Tensor): Temporal coordinates of the grid points.
+        """
+        with torch.no_grad():
+            self.trunk_cache = self.model.trunk_embedding(torch.cat([x, t], dim=1))
+        
+        self.logger.log_purpose_specific_info(f"Trunk embedding cached for {x.shape[0]} query points")
+
+    def predict_operator(self, u_sensors: torch.Tensor, x: Optional[torch.Tensor] = None,
+                         t: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """Predict solutions for a batch of input functions with a DeepONet.
+
+        Without coordinates the cached query grid is used, so a new batch of
+        input functions costs one branch pass and one batched matrix product.
+
+        Args:
+            u_sensors (torch.Tensor): Input functions at the sensors, shape (batch, num_sensors).
+            x (torch.Tensor, optional): Spatial coordinates (default: cached grid).
+            t (torch.Tensor, optional): Temporal coordinates (default: cached grid).
+
+        Returns:
+            torch.Tensor: Predicted solutions of shape (batch, n_points, output_dim).
+        """
+        with torch.no_grad():
+            if x is not None:
+                trunk = self.model.trunk_embedding(torch.cat([x, t], dim=1))
+            elif self.trunk_cache is not None:
+                trunk = self.trunk_cache
+            else:
+                raise ValueError("Call set_query_grid or pass coordinates to predict_operator")
+            return self.model.combine(self.model.branch_embedding(u_sensors), trunk)
+
     def compute_metrics(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
         """Compute evaluation metrics.
 
@@ -84,13 +134,15 @@ class GeneralizationEvaluator:
         return metrics
 
     def evaluate_on_grid(self, x_grid: np.ndarray, t_grid: np.ndarray,
-                        u_true: np.ndarray) -> Dict[str, Any]:
+                        u_true: np.ndarray, u_sensors: Optional[torch.Tensor] = None) -> Dict[str, Any]:
         """Evaluate model on a regular grid.
 
         Args:
             x_grid (np.ndarray): Spatial grid.
             t_grid (np.ndarray): Temporal grid.
             u_true (np.ndarray): True solution on grid.
+            u_sensors (torch.Tensor, optional): Input function of ``u_true`` at the sensors
+                (required for a DeepONet).
 
         Returns:
             Dict[str, Any]: Evaluation results.
@@ -100,7 +152,7 @@ class GeneralizationEvaluator:
         t_tensor = torch.FloatTensor(t_grid.flatten().reshape(-1, 1))
         
         # Make predictions
-        u_pred_tensor = self.predict(x_tensor, t_tensor)
+        u_pred_tensor = self.predict(x_tensor, t_tensor, u_sensors)
         u_pred = u_pred_tensor.numpy().reshape(x_grid.shape)
         
         # Compute metrics
@@ -115,7 +167,7 @@ class GeneralizationEvaluator:
             't_grid': t_grid
         }
         
-        self.logger.log_equation_specific_info(f"Grid evaluation completed - R: {metrics['r2']:.4f}")
+        self.logger.log_equation_specific_info(f"Grid evaluation completed - R²: {metrics['r2']:.4f}")
         
         return results
 
@@ -12,6 +12,17 @@ from typing import List, Tuple, Optional, Dict, Any
 import math
 
 from utils.loggers import get_purpose_logger
+from utils.models import MLP, init_linear_weights
+
+
+class SinActivation(nn.Module):
+    """Sine activation function for high-frequency problems."""
+    
+    def __init__(self):
+        super(SinActivation, self).__init__()
+    
+    def forward(self, x):
+        return torch.sin(x)
 
 
 class GeneralizationPINN(nn.Module):
@@ -45,14 +56,6 @@ class GeneralizationPINN(nn.Module):
         self.dropout_rate = dropout_rate
         self.use_fourier_features = use_fourier_features
         
-        # Build network (implement specific architecture for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        layers = []
-        prev_dim = input_dim
-        
-        # Initialize weights
-        self._init_weights(weight_init)
-        
         # Build network layers
         layers = []
         prev_dim = input_dim
@@ -91,6 +94,9 @@ class GeneralizationPINN(nn.Module):
         # linear activation (no activation) is default
         
         self.network = nn.Sequential(*layers)
+        
+        # Initialize weights
+        init_linear_weights(self, weight_init)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass.
@@ -117,6 +123,101 @@ class GeneralizationPINN(nn.Module):
         return self.forward(inputs)
 
 
+class DeepONet(nn.Module):
+    """Deep operator network mapping input functions to solution fields.
+
+    The branch net encodes an input function (e.g. an initial condition)
+    sampled at fixed sensor points, the trunk net encodes query coordinates,
+    and the solution is their inner product over a latent basis:
+    u(f)(y) = sum_k b_k(f) * tau_k(y) + bias. The trunk embedding of a query
+    grid does not depend on the input function, so it can be computed once
+    and reused; evaluating a batch of new input functions is then a branch
+    forward pass plus one batched matrix product.
+    """
+
+    def __init__(self, num_sensors: int = 100, coordinate_dim: int = 2, output_dim: int = 1,
+                 latent_dim: int = 100, branch_hidden_dims: List[int] = [100, 100],
+                 trunk_hidden_dims: List[int] = [100, 100, 100],
+                 activation: str = "tanh"):
+        """Initialize the DeepONet.
+
+        Args:
+            num_sensors (int): Number of sensor points the input function is sampled at.
+            coordinate_dim (int): Query coordinate dimension (x, t).
+            output_dim (int): Output dimension (u).
+            latent_dim (int): Number of latent basis functions per output.
+            branch_hidden_dims (List[int]): Hidden layer dimensions of the branch net.
+            trunk_hidden_dims (List[int]): Hidden layer dimensions of the trunk net.
+            activation (str): Activation function.
+        """
+        super(DeepONet, self).__init__()
+        
+        self.num_sensors = num_sensors
+        self.coordinate_dim = coordinate_dim
+        self.input_dim = coordinate_dim
+        self.output_dim = output_dim
+        self.latent_dim = latent_dim
+        self.hidden_dims = trunk_hidden_dims
+        
+        self.branch = MLP(num_sensors, latent_dim * output_dim, branch_hidden_dims, activation)
+        # The trunk output is activated as well, so its features are a nonlinear basis
+        self.trunk = MLP(coordinate_dim, latent_dim * output_dim, trunk_hidden_dims, activation,
+                         output_activation=activation)
+        self.bias = nn.Parameter(torch.zeros(output_dim))
+
+    def branch_embedding(self, u_sensors: torch.Tensor) -> torch.Tensor:
+        """Encode input functions.
+
+        Args:
+            u_sensors (torch.Tensor): Input functions at the sensors, shape (batch, num_sensors).
+
+        Returns:
+            torch.Tensor: Branch coefficients of shape (batch, latent_dim, output_dim).
+        """
+        return self.branch(u_sensors).reshape(u_sensors.shape[0], self.latent_dim, self.output_dim)
+
+    def trunk_embedding(self, coordinates: torch.Tensor) -> torch.Tensor:
+        """Encode query coordinates.
+
+        Args:
+            coordinates (torch.Tensor): Coordinates of shape (..., n_points, coordinate_dim).
+
+        Returns:
+            torch.Tensor: Trunk basis of shape (..., n_points, latent_dim, output_dim).
+        """
+        features = self.trunk(coordinates)
+        return features.reshape(*coordinates.shape[:-1], self.latent_dim, self.output_dim)
+
+    def combine(self, branch: torch.Tensor, trunk: torch.Tensor) -> torch.Tensor:
+        """Contract branch coefficients with a trunk basis.
+
+        Args:
+            branch (torch.Tensor): Branch coefficients of shape (batch, latent_dim, output_dim).
+            trunk (torch.Tensor): Trunk basis of shape (n_points, latent_dim, output_dim) shared by
+                the batch, or (batch, n_points, latent_dim, output_dim).
+
+        Returns:
+            torch.Tensor: Solution values of shape (batch, n_points, output_dim).
+        """
+        if trunk.dim() == 3:
+            # One (batch, latent) x (latent, points) product per output
+            return torch.einsum('bko,nko->bno', branch, trunk) + self.bias
+        return torch.einsum('bko,bnko->bno', branch, trunk) + self.bias
+
+    def forward(self, u_sensors: torch.Tensor, coordinates: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            u_sensors (torch.Tensor): Input functions at the sensors, shape (batch, num_sensors).
+            coordinates (torch.Tensor): Query coordinates of shape (n_points, coordinate_dim)
+                shared by the batch, or (batch, n_points, coordinate_dim).
+
+        Returns:
+            torch.Tensor: Solution values of shape (batch, n_points, output_dim).
+        """
+        return self.combine(self.branch_embedding(u_sensors), self.trunk_embedding(coordinates))
+
+
 def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """Factory function to create PINN models.
 
@@ -129,6 +230,8 @@ def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """
     if model_type.lower() == "standard":
         return GeneralizationPINN(**kwargs)
+    elif model_type.lower() == "deeponet":
+        return DeepONet(**kwargs)
     else:
         raise ValueError(f"Unsupported model type: {model_type}")
 
@@ -6,225 +6,105 @@ This module provides training functionality for generalization using PINNs.
 
 import torch
 import torch.nn as nn
-import torch.optim as optim
-import numpy as np
-from typing import Dict, Any, Tuple, Optional, Callable
-import time
-from pathlib import Path
-import json
-
-from utils.loggers import get_purpose_logger
-
-
-class GeneralizationTrainer:
-    """Trainer class for generalization using PINNs."""
-
-    def __init__(self, model: nn.Module, purpose: str, equation: str):
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.trainer import PINNTrainer
+from .models import DeepONet
+
+
+def sample_initial_conditions(x_sensors: torch.Tensor, x_ic: torch.Tensor, num_functions: int,
+                              length_scale: float = 0.2, variance: float = 1.0,
+                              boundary_envelope: bool = True,
+                              seed: Optional[int] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Sample random initial conditions from a Gaussian random field.
+
+    Each function is drawn jointly at the sensor points and the initial
+    condition points, so the branch input and the initial-condition targets
+    describe the same function.
+
+    Args:
+        x_sensors (torch.Tensor): Sensor locations of shape (num_sensors, 1).
+        x_ic (torch.Tensor): Initial condition points of shape (n_ic, 1).
+        num_functions (int): Number of functions to draw.
+        length_scale (float): Length scale of the squared-exponential kernel.
+        variance (float): Variance of the field.
+        boundary_envelope (bool): Multiply by sin(pi x) so the functions vanish at x = 0 and 1.
+        seed (int, optional): Random seed.
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: Sensor values of shape (num_functions, num_sensors)
+            and initial condition values of shape (num_functions, n_ic, 1).
+    """
+    points = torch.cat([x_sensors.reshape(-1), x_ic.reshape(-1)]).double()
+    covariance = variance * torch.exp(-0.5 * (points[:, None] - points[None, :]) ** 2 / length_scale ** 2)
+    covariance.diagonal().add_(1e-8 * variance)
+    cholesky = torch.linalg.cholesky(covariance)
+
+    generator = torch.Generator()
+    if seed is not None:
+        generator.manual_seed(seed)
+    else:
+        generator.seed()
+    z = torch.randn(points.shape[0], num_functions, generator=generator, dtype=torch.float64)
+    samples = (cholesky @ z).T
+    if boundary_envelope:
+        samples = samples * torch.sin(math.pi * points)
+
+    samples = samples.to(x_sensors.dtype)
+    num_sensors = x_sensors.shape[0]
+    return samples[:, :num_sensors], samples[:, num_sensors:].unsqueeze(-1)
+
+
+class GeneralizationTrainer(PINNTrainer):
+    """Trainer class for generalization using PINNs.
+
+    For a DeepONet the training data additionally holds 'u_sensors'
+    (batch, num_sensors) and the initial-condition targets 'u_ic' per
+    function (batch, n_ic, 1). Every function gets its own copy of the
+    collocation coordinates, so the physics residual is differentiated per
+    function while the loss terms stay the shared ones.
+    """
+
+    default_loss_terms = ['physics', 'boundary', 'initial']
+
+    def __init__(self, model: nn.Module, purpose: str, equation: str,
+                 loss_terms: Optional[List[Any]] = None):
         """Initialize the generalization trainer.
 
         Args:
             model (nn.Module): PINN model to train.
             purpose (str): PINN purpose (e.g., 'generalization').
             equation (str): Equation type (e.g., 'heat', 'wave', 'burgers').
+            loss_terms (List[Any], optional): Loss term names or LossTerm instances.
         """
-        self.model = model
-        self.purpose = purpose
-        self.equation = equation
-        self.logger = get_purpose_logger(purpose, equation)
-        
-        # Training state
-        self.optimizer = None
-        self.scheduler = None
-        self.training_history = {
-            'physics_loss': [],
-            'boundary_loss': [],
-            'initial_loss': [],
-            'total_loss': [],
-            'epochs': []
-        }
-        
-        self.logger.log_purpose_specific_info("Generalization Trainer initialized")
-
-    def setup_optimizer(self, learning_rate: float = 0.001, 
-                       optimizer_type: str = "adam") -> None:
-        """Setup optimizer for training.
-
-        Args:
-            learning_rate (float): Learning rate for optimization.
-            optimizer_type (str): Type of optimizer ('adam', 'sgd', 'adamw').
-        """
-        if optimizer_type.lower() == "adam":
-            self.optimizer = optim.Adam(self.model.parameters(), lr=learning_rate)
-        elif optimizer_type.lower() == "sgd":
-            self.optimizer = optim.SGD(self.model.parameters(), lr=learning_rate)
-        elif optimizer_type.lower() == "adamw":
-            self.optimizer = optim.AdamW(self.model.parameters(), lr=learning_rate)
-        else:
-            raise ValueError(f"Unsupported optimizer type: {optimizer_type}")
-        
-        self.logger.log_equation_specific_info(f"Optimizer {optimizer_type} setup with lr={learning_rate}")
-
-    def setup_scheduler(self, scheduler_type: str = "step", 
-                       step_size: int = 1000, gamma: float = 0.9) -> None:
-        """Setup learning rate scheduler.
+        super(GeneralizationTrainer, self).__init__(model, purpose, equation, loss_terms)
 
-        Args:
-            scheduler_type (str): Type of scheduler ('step', 'cosine', 'plateau').
-            step_size (int): Step size for step scheduler.
-            gamma (float): Gamma value for step scheduler.
-        """
-        if self.optimizer is None:
-            raise ValueError("Optimizer must be setup before scheduler")
-        
-        if scheduler_type.lower() == "step":
-            self.scheduler = optim.lr_scheduler.StepLR(
-                self.optimizer, step_size=step_size, gamma=gamma
-            )
-        elif scheduler_type.lower() == "cosine":
-            self.scheduler = optim.lr_scheduler.CosineAnnealingLR(
-                self.optimizer, T_max=step_size
-            )
-        elif scheduler_type.lower() == "plateau":
-            self.scheduler = optim.lr_scheduler.ReduceLROnPlateau(
-                self.optimizer, mode='min', factor=gamma, patience=step_size//10
-            )
-        
-        self.logger.log_equation_specific_info(f"Scheduler {scheduler_type} setup")
-
-    def train_step(self, train_data: Dict[str, torch.Tensor],
-                  physics_fn: Callable, weights: Dict[str, float]) -> Dict[str, float]:
-        """Perform a single training step.
+        self.logger.log_purpose_specific_info("Generalization Trainer initialized")
 
-        Args:
-            train_data (Dict[str, torch.Tensor]): Training data.
-            physics_fn (Callable): Physics function.
-            weights (Dict[str, float]): Loss weights.
-
-        Returns:
-            Dict[str, float]: Loss values for this step.
-        """
-        self.optimizer.zero_grad()
-        
-        # Compute losses (implement specific loss computation for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        total_loss = torch.tensor(0.0, requires_grad=True)
-        
-        # Backward pass
-        total_loss.backward()
-        self.optimizer.step()
-        
-        if self.scheduler is not None:
-            if isinstance(self.scheduler, optim.lr_scheduler.ReduceLROnPlateau):
-                self.scheduler.step(total_loss)
-            else:
-                self.scheduler.step()
-        
-        return {
-            'total_loss': total_loss.item()
-        }
-
-    def train(self, train_data: Dict[str, torch.Tensor], 
-              physics_fn: Callable, epochs: int = 10000,
-              weights: Optional[Dict[str, float]] = None,
-              save_interval: int = 1000, save_path: Optional[str] = None) -> Dict[str, list]:
-        """Train the PINN model.
+    def point_copies(self, train_data: Dict[str, Any]) -> Optional[int]:
+        """Get the number of per-copy coordinate sets (one per input function for a DeepONet).
 
         Args:
-            train_data (Dict[str, torch.Tensor]): Training data.
-            physics_fn (Callable): Physics function.
-            epochs (int): Number of training epochs.
-            weights (Dict[str, float], optional): Loss weights.
-            save_interval (int): Interval for saving checkpoints.
-            save_path (str, optional): Path to save checkpoints.
+            train_data (Dict[str, Any]): Training data ('u_sensors' required for a DeepONet).
 
         Returns:
-            Dict[str, list]: Training history.
+            Optional[int]: Number of input functions for a DeepONet, else the base count.
         """
-        if weights is None:
-            weights = {'physics': 1.0, 'boundary': 1.0, 'initial': 1.0}
-        
-        # Log training start
-        training_params = {
-            'epochs': epochs,
-            'weights': weights,
-            'save_interval': save_interval,
-            'equation': self.equation,
-            'purpose': self.purpose
-        }
-        self.logger.log_training_start(training_params)
-        
-        start_time = time.time()
-        
-        for epoch in range(epochs):
-            # Training step
-            losses = self.train_step(train_data, physics_fn, weights)
-            
-            # Store history
-            for key, value in losses.items():
-                self.training_history[key].append(value)
-            self.training_history['epochs'].append(epoch)
-            
-            # Log progress
-            if epoch % 100 == 0:
-                self.logger.log_training_progress(
-                    epoch, epochs, losses.get('physics_loss', 0.0), losses['total_loss']
-                )
-            
-            # Save checkpoint
-            if save_path and epoch % save_interval == 0:
-                self.save_checkpoint(save_path, epoch, losses)
-        
-        training_time = time.time() - start_time
-        self.logger.log_training_complete(losses['total_loss'], training_time)
-        
-        return self.training_history
-
-    def save_checkpoint(self, save_path: str, epoch: int, losses: Dict[str, float]) -> None:
-        """Save training checkpoint.
+        if isinstance(self.model, DeepONet):
+            return train_data['u_sensors'].shape[0]
+        return super(GeneralizationTrainer, self).point_copies(train_data)
 
-        Args:
-            save_path (str): Path to save checkpoint.
-            epoch (int): Current epoch.
-            losses (Dict[str, float]): Current loss values.
-        """
-        checkpoint = {
-            'epoch': epoch,
-            'model_state_dict': self.model.state_dict(),
-            'optimizer_state_dict': self.optimizer.state_dict(),
-            'losses': losses,
-            'training_history': self.training_history,
-            'purpose': self.purpose,
-            'equation': self.equation
-        }
-        
-        if self.scheduler is not None:
-            checkpoint['scheduler_state_dict'] = self.scheduler.state_dict()
-        
-        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
-        torch.save(checkpoint, f"{save_path}_epoch_{epoch}.pt")
-        
-        self.logger.log_equation_specific_info(f"Checkpoint saved at epoch {epoch}")
-
-    def load_checkpoint(self, checkpoint_path: str) -> int:
-        """Load training checkpoint.
+    def model_forward(self, train_data: Dict[str, Any], inputs: torch.Tensor) -> torch.Tensor:
+        """Evaluate the model, passing a DeepONet its input functions.
 
         Args:
-            checkpoint_path (str): Path to checkpoint file.
+            train_data (Dict[str, Any]): Training data ('u_sensors' required for a DeepONet).
+            inputs (torch.Tensor): Points of shape ([batch,] points, coordinate_dim).
 
         Returns:
-            int: Epoch number from checkpoint.
+            torch.Tensor: Predictions of shape ([batch,] points, outputs).
         """
-        checkpoint = torch.load(checkpoint_path)
-        
-        self.model.load_state_dict(checkpoint['model_state_dict'])
-        self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
-        
-        if 'scheduler_state_dict' in checkpoint and self.scheduler is not None:
-            self.scheduler.load_state_dict(checkpoint['scheduler_state_dict'])
-        
-        self.training_history = checkpoint['training_history']
-        
-        epoch = checkpoint['epoch']
-        self.logger.log_equation_specific_info(f"Checkpoint loaded from epoch {epoch}")
-        
-        return epoch
+        if isinstance(self.model, DeepONet):
+            return self.model(train_data['u_sensors'], inputs)
+        return super(GeneralizationTrainer, self).model_forward(train_data, inputs)
@@ -2,229 +2,395 @@
 InverseProblems Trainer for PINN Research Platform.
 
 This module provides training functionality for inverse problems using PINNs.
+Unknown PDE coefficients are trained alongside the network weights, and a
+multi-start search trains many candidate initializations as one vectorized
+batch of stacked networks.
 """
 
 import torch
 import torch.nn as nn
 import torch.optim as optim
 import numpy as np
-from typing import Dict, Any, Tuple, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
+import copy
+import functools
 import time
-from pathlib import Path
-import json
 
-from utils.loggers import get_purpose_logger
+from torch.func import functional_call, stack_module_state, vmap
 
+from utils.trainer import PINNTrainer
+from utils.physics import get_physics_function
 
-class InverseProblemsTrainer:
+
+class InverseProblemsTrainer(PINNTrainer):
     """Trainer class for inverse problems using PINNs."""
 
-    def __init__(self, model: nn.Module, purpose: str, equation: str):
+    default_loss_terms = ['physics', 'boundary', 'initial', 'data']
+
+    def __init__(self, model: nn.Module, purpose: str, equation: str,
+                 loss_terms: Optional[List[Any]] = None,
+                 unknown_parameters: Optional[Dict[str, float]] = None):
         """Initialize the inverse problems trainer.
 
         Args:
             model (nn.Module): PINN model to train.
             purpose (str): PINN purpose (e.g., 'inverse_problems').
             equation (str): Equation type (e.g., 'heat', 'wave', 'burgers').
+            loss_terms (List[Any], optional): Loss term names or LossTerm instances.
+            unknown_parameters (Dict[str, float], optional): Initial guesses for the
+                PDE coefficients to identify, keyed by the physics function's
+                keyword names (e.g. {'alpha': 0.5} for heat, {'nu': 0.05} for Burgers).
         """
-        self.model = model
-        self.purpose = purpose
-        self.equation = equation
-        self.logger = get_purpose_logger(purpose, equation)
-        
-        # Training state
-        self.optimizer = None
-        self.scheduler = None
-        self.training_history = {
-            'physics_loss': [],
-            'boundary_loss': [],
-            'initial_loss': [],
-            'total_loss': [],
-            'epochs': []
-        }
-        
+        super(InverseProblemsTrainer, self).__init__(model, purpose, equation, loss_terms)
+
+        self.pde_parameters = nn.ParameterDict({
+            name: nn.Parameter(torch.tensor(float(value)))
+            for name, value in (unknown_parameters or {}).items()
+        })
+        # Stacked starts of a running multi_start_search (see point_copies/model_forward)
+        self._search = None
+
         self.logger.log_purpose_specific_info("InverseProblems Trainer initialized")
+        if self.pde_parameters:
+            self.logger.log_equation_specific_info(
+                f"Identifying PDE parameters: {list(self.pde_parameters.keys())}"
+            )
+
+    def trainable_parameters(self) -> List[nn.Parameter]:
+        """Get network weights and unknown PDE coefficients.
+
+        Returns:
+            List[nn.Parameter]: Trainable parameters.
+        """
+        return super(InverseProblemsTrainer, self).trainable_parameters() + list(self.pde_parameters.values())
+
+    def get_identified_parameters(self) -> Dict[str, float]:
+        """Get the current estimates of the unknown PDE coefficients.
 
-    def setup_optimizer(self, learning_rate: float = 0.001, 
-                       optimizer_type: str = "adam") -> None:
-        """Setup optimizer for training.
+        Returns:
+            Dict[str, float]: Coefficient estimates.
+        """
+        return {name: param.item() for name, param in self.pde_parameters.items()}
+
+    def _resolve_physics_fn(self, physics_fn: Optional[Callable]) -> Callable:
+        """Use the raw residual function of the equation if none is given.
+
+        The physics function must accept the unknown coefficients as keyword
+        arguments, i.e. it must not already have them bound.
+        """
+        if physics_fn is None:
+            physics_fn = get_physics_function(self.equation)
+        return physics_fn
+
+    def bind_physics(self, train_data: Dict[str, Any], physics_fn: Callable) -> Callable:
+        """Bind the current coefficient estimates to the physics function.
 
         Args:
-            learning_rate (float): Learning rate for optimization.
-            optimizer_type (str): Type of optimizer ('adam', 'sgd', 'adamw').
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function accepting the coefficients as keywords.
+
+        Returns:
+            Callable: Physics function to evaluate.
         """
-        if optimizer_type.lower() == "adam":
-            self.optimizer = optim.Adam(self.model.parameters(), lr=learning_rate)
-        elif optimizer_type.lower() == "sgd":
-            self.optimizer = optim.SGD(self.model.parameters(), lr=learning_rate)
-        elif optimizer_type.lower() == "adamw":
-            self.optimizer = optim.AdamW(self.model.parameters(), lr=learning_rate)
-        else:
-            raise ValueError(f"Unsupported optimizer type: {optimizer_type}")
-        
-        self.logger.log_equation_specific_info(f"Optimizer {optimizer_type} setup with lr={learning_rate}")
-
-    def setup_scheduler(self, scheduler_type: str = "step", 
-                       step_size: int = 1000, gamma: float = 0.9) -> None:
-        """Setup learning rate scheduler.
+        return functools.partial(physics_fn, **self.pde_parameters)
+
+    def history_keys(self, train_data: Dict[str, Any]) -> List[str]:
+        """Record the coefficient estimates next to the losses."""
+        keys = super(InverseProblemsTrainer, self).history_keys(train_data)
+        return keys + [f"param_{name}" for name in self.pde_parameters]
+
+    def _step(self, train_data: Dict[str, Any], physics_fn: Callable,
+              weights: Dict[str, float]) -> Dict[str, torch.Tensor]:
+        """Perform one optimizer step and report losses and coefficients."""
+        losses = super(InverseProblemsTrainer, self)._step(train_data, physics_fn, weights)
+        for name, param in self.pde_parameters.items():
+            losses[f"param_{name}"] = param.detach().clone()
+        return losses
+
+    def point_copies(self, train_data: Dict[str, Any]) -> Optional[int]:
+        """Get the number of per-copy coordinate sets (one per start during a multi-start search).
 
         Args:
-            scheduler_type (str): Type of scheduler ('step', 'cosine', 'plateau').
-            step_size (int): Step size for step scheduler.
-            gamma (float): Gamma value for step scheduler.
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            Optional[int]: Number of active starts during a search, else the base count.
         """
-        if self.optimizer is None:
-            raise ValueError("Optimizer must be setup before scheduler")
-        
-        if scheduler_type.lower() == "step":
-            self.scheduler = optim.lr_scheduler.StepLR(
-                self.optimizer, step_size=step_size, gamma=gamma
-            )
-        elif scheduler_type.lower() == "cosine":
-            self.scheduler = optim.lr_scheduler.CosineAnnealingLR(
-                self.optimizer, T_max=step_size
-            )
-        elif scheduler_type.lower() == "plateau":
-            self.scheduler = optim.lr_scheduler.ReduceLROnPlateau(
-                self.optimizer, mode='min', factor=gamma, patience=step_size//10
-            )
-        
-        self.logger.log_equation_specific_info(f"Scheduler {scheduler_type} setup")
+        if self._search is not None:
+            return next(iter(self._search['params'].values())).shape[0]
+        return super(InverseProblemsTrainer, self).point_copies(train_data)
 
-    def train_step(self, train_data: Dict[str, torch.Tensor],
-                  physics_fn: Callable, weights: Dict[str, float]) -> Dict[str, float]:
-        """Perform a single training step.
+    def model_forward(self, train_data: Dict[str, Any], inputs: torch.Tensor) -> torch.Tensor:
+        """Evaluate the model, or every stacked start during a multi-start search.
 
         Args:
-            train_data (Dict[str, torch.Tensor]): Training data.
-            physics_fn (Callable): Physics function.
-            weights (Dict[str, float]): Loss weights.
+            train_data (Dict[str, Any]): Training data.
+            inputs (torch.Tensor): Points of shape ([starts,] points, input_dim).
 
         Returns:
-            Dict[str, float]: Loss values for this step.
+            torch.Tensor: Predictions of shape ([starts,] points, outputs).
         """
-        self.optimizer.zero_grad()
-        
-        # Compute losses (implement specific loss computation for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        total_loss = torch.tensor(0.0, requires_grad=True)
-        
-        # Backward pass
-        total_loss.backward()
-        self.optimizer.step()
-        
-        if self.scheduler is not None:
-            if isinstance(self.scheduler, optim.lr_scheduler.ReduceLROnPlateau):
-                self.scheduler.step(total_loss)
-            else:
-                self.scheduler.step()
-        
-        return {
-            'total_loss': total_loss.item()
-        }
+        if self._search is not None:
+            return self._search['forward'](self._search['params'], self._search['buffers'], inputs)
+        return super(InverseProblemsTrainer, self).model_forward(train_data, inputs)
 
-    def train(self, train_data: Dict[str, torch.Tensor], 
-              physics_fn: Callable, epochs: int = 10000,
+    def train(self, train_data: Dict[str, Any],
+              physics_fn: Optional[Callable] = None, epochs: int = 10000,
               weights: Optional[Dict[str, float]] = None,
-              save_interval: int = 1000, save_path: Optional[str] = None) -> Dict[str, list]:
-        """Train the PINN model.
+              save_interval: int = 1000, save_path: Optional[str] = None,
+              progress_callback: Optional[Callable] = None,
+              gradient_clipping: Optional[float] = None) -> Dict[str, list]:
+        """Train the network and the unknown PDE coefficients.
 
         Args:
-            train_data (Dict[str, torch.Tensor]): Training data.
-            physics_fn (Callable): Physics function.
+            train_data (Dict[str, Any]): Training data; 'x_data'/'u_data' observations drive identification.
+            physics_fn (Callable, optional): Residual function accepting the coefficients as keywords.
+                Defaults to the equation's residual from get_physics_function.
             epochs (int): Number of training epochs.
             weights (Dict[str, float], optional): Loss weights.
             save_interval (int): Interval for saving checkpoints.
             save_path (str, optional): Path to save checkpoints.
+            progress_callback (Callable, optional): Called as callback(epoch, losses) every epoch.
+            gradient_clipping (float, optional): Maximum gradient norm.
 
         Returns:
-            Dict[str, list]: Training history.
+            Dict[str, list]: Training history, including 'param_<name>' trajectories.
         """
-        if weights is None:
-            weights = {'physics': 1.0, 'boundary': 1.0, 'initial': 1.0}
-        
-        # Log training start
-        training_params = {
-            'epochs': epochs,
-            'weights': weights,
-            'save_interval': save_interval,
-            'equation': self.equation,
-            'purpose': self.purpose
-        }
-        self.logger.log_training_start(training_params)
-        
-        start_time = time.time()
-        
-        for epoch in range(epochs):
-            # Training step
-            losses = self.train_step(train_data, physics_fn, weights)
-            
-            # Store history
-            for key, value in losses.items():
-                self.training_history[key].append(value)
-            self.training_history['epochs'].append(epoch)
-            
-            # Log progress
-            if epoch % 100 == 0:
-                self.logger.log_training_progress(
-                    epoch, epochs, losses.get('physics_loss', 0.0), losses['total_loss']
-                )
-            
-            # Save checkpoint
-            if save_path and epoch % save_interval == 0:
-                self.save_checkpoint(save_path, epoch, losses)
-        
-        training_time = time.time() - start_time
-        self.logger.log_training_complete(losses['total_loss'], training_time)
-        
-        return self.training_history
+        if 'u_data' not in train_data:
+            self.logger.log_equation_specific_info(
+                "No observational data ('x_data'/'u_data') - coefficients are not identifiable"
+            )
+
+        history = super(InverseProblemsTrainer, self).train(
+            train_data, self._resolve_physics_fn(physics_fn), epochs, weights,
+            save_interval, save_path, progress_callback, gradient_clipping
+        )
+
+        if self.pde_parameters:
+            self.logger.log_equation_specific_info(
+                f"Identified parameters: {self.get_identified_parameters()}"
+            )
+
+        return history
 
     def save_checkpoint(self, save_path: str, epoch: int, losses: Dict[str, float]) -> None:
-        """Save training checkpoint.
+        """Save training checkpoint including the coefficient estimates.
 
         Args:
             save_path (str): Path to save checkpoint.
             epoch (int): Current epoch.
             losses (Dict[str, float]): Current loss values.
         """
-        checkpoint = {
-            'epoch': epoch,
-            'model_state_dict': self.model.state_dict(),
-            'optimizer_state_dict': self.optimizer.state_dict(),
-            'losses': losses,
-            'training_history': self.training_history,
-            'purpose': self.purpose,
-            'equation': self.equation
+        losses = dict(losses)
+        losses['identified_parameters'] = self.get_identified_parameters()
+        super(InverseProblemsTrainer, self).save_checkpoint(save_path, epoch, losses)
+
+    def _create_members(self, n_starts: int) -> List[nn.Module]:
+        """Create freshly initialized copies of the model for a multi-start search.
+
+        The first member keeps the current weights so that warm starts are preserved.
+        """
+        members = [copy.deepcopy(self.model)]
+        for _ in range(n_starts - 1):
+            member = copy.deepcopy(self.model)
+            initializers = [m for m in member.modules() if hasattr(m, '_initialize_weights')]
+            if initializers:
+                for module in initializers:
+                    module._initialize_weights()
+            else:
+                for module in member.modules():
+                    if isinstance(module, nn.Linear):
+                        module.reset_parameters()
+            members.append(member)
+        return members
+
+    def _sample_starts(self, n_starts: int,
+                       parameter_ranges: Dict[str, Tuple[float, float]],
+                       log_scale: bool) -> Dict[str, torch.Tensor]:
+        """Sample initial coefficient guesses for every start."""
+        starts = {}
+        for name in self.pde_parameters:
+            low, high = parameter_ranges.get(name, (self.pde_parameters[name].item(),) * 2)
+            u = torch.rand(n_starts)
+            if log_scale and low > 0 and high > 0:
+                values = torch.exp(np.log(low) + u * (np.log(high) - np.log(low)))
+            else:
+                values = low + u * (high - low)
+            # Keep the current estimate as the first start
+            values[0] = self.pde_parameters[name].item()
+            starts[name] = values
+        return starts
+
+    @staticmethod
+    def _select_members(tensors: Dict[str, torch.Tensor], keep: torch.Tensor) -> Dict[str, torch.Tensor]:
+        """Index stacked leaf tensors along the member axis, keeping them leaves."""
+        return {
+            name: tensor.detach()[keep].requires_grad_(tensor.requires_grad)
+            for name, tensor in tensors.items()
         }
-        
-        if self.scheduler is not None:
-            checkpoint['scheduler_state_dict'] = self.scheduler.state_dict()
-        
-        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
-        torch.save(checkpoint, f"{save_path}_epoch_{epoch}.pt")
-        
-        self.logger.log_equation_specific_info(f"Checkpoint saved at epoch {epoch}")
-
-    def load_checkpoint(self, checkpoint_path: str) -> int:
-        """Load training checkpoint.
+
+    def multi_start_search(self, train_data: Dict[str, Any],
+                           parameter_ranges: Dict[str, Tuple[float, float]],
+                           physics_fn: Optional[Callable] = None,
+                           n_starts: int = 16, epochs: int = 2000,
+                           learning_rate: float = 0.001,
+                           weights: Optional[Dict[str, float]] = None,
+                           prune_interval: int = 100, prune_factor: float = 10.0,
+                           min_starts: int = 1, log_scale: bool = False) -> Dict[str, Any]:
+        """Train several initializations at once and keep the best one.
+
+        All starts are stacked with ``torch.func.stack_module_state`` and
+        evaluated with ``vmap`` in a single forward pass; one Adam step updates
+        every start. Every ``prune_interval`` epochs, starts whose loss is
+        non-finite or above ``prune_factor`` times the median are dropped from
+        the stack. The best start is loaded into ``self.model`` and
+        ``self.pde_parameters`` afterwards, so :meth:`train` can refine it.
 
         Args:
-            checkpoint_path (str): Path to checkpoint file.
+            train_data (Dict[str, Any]): Training data.
+            parameter_ranges (Dict[str, Tuple[float, float]]): Sampling range of each unknown coefficient.
+            physics_fn (Callable, optional): Residual function accepting the coefficients as keywords.
+            n_starts (int): Number of candidate initializations.
+            epochs (int): Number of training epochs.
+            learning_rate (float): Adam learning rate.
+            weights (Dict[str, float], optional): Loss weights.
+            prune_interval (int): Epoch interval between pruning passes.
+            prune_factor (float): Starts with loss above prune_factor * median are dropped.
+            min_starts (int): Never prune below this many starts.
+            log_scale (bool): Sample coefficients log-uniformly.
 
         Returns:
-            int: Epoch number from checkpoint.
+            Dict[str, Any]: Search results with the best start's coefficients and
+            the final loss and coefficients of every surviving start.
         """
-        checkpoint = torch.load(checkpoint_path)
-        
-        self.model.load_state_dict(checkpoint['model_state_dict'])
-        self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
-        
-        if 'scheduler_state_dict' in checkpoint and self.scheduler is not None:
-            self.scheduler.load_state_dict(checkpoint['scheduler_state_dict'])
-        
-        self.training_history = checkpoint['training_history']
-        
-        epoch = checkpoint['epoch']
-        self.logger.log_equation_specific_info(f"Checkpoint loaded from epoch {epoch}")
-        
-        return epoch
+        physics_fn = self._resolve_physics_fn(physics_fn)
+        if weights is None:
+            weights = {'physics': 1.0, 'boundary': 1.0, 'initial': 1.0, 'data': 1.0}
+
+        # Regularizers without a point group act on a single model, not the stack
+        terms = [term for term in self.active_loss_terms(train_data) if term.group is not None]
+        groups = self.loss_groups(terms)
+
+        members = self._create_members(n_starts)
+        params, buffers = stack_module_state(members)
+        coefficients = {
+            name: values.requires_grad_(True)
+            for name, values in self._sample_starts(n_starts, parameter_ranges, log_scale).items()
+        }
+        start_ids = torch.arange(n_starts)
+
+        base = copy.deepcopy(self.model).to('meta')
+
+        def member_forward(member_params, member_buffers, inputs):
+            return functional_call(base, (member_params, member_buffers), (inputs,))
+
+        search = {'params': params, 'buffers': buffers,
+                  'forward': vmap(member_forward, randomness='different')}
+
+        optimizer = optim.Adam(list(params.values()) + list(coefficients.values()), lr=learning_rate)
+
+        self.logger.log_equation_specific_info(
+            f"Multi-start search with {n_starts} starts over {list(parameter_ranges.keys())}"
+        )
+        start_time = time.time()
+        pruned = []
+
+        for epoch in range(epochs):
+            n_active = start_ids.shape[0]
+            optimizer.zero_grad()
+
+            # forward_groups gives each start its own copy of the interior
+            # coordinates, so input derivatives stay per start
+            self._search = search
+            try:
+                outputs = self.forward_groups(train_data, groups)
+            finally:
+                self._search = None
+
+            bound_physics_fn = functools.partial(
+                physics_fn, **{name: values.view(-1, 1, 1) for name, values in coefficients.items()}
+            )
+            member_losses = 0.0
+            for term in terms:
+                member_losses = member_losses + weights.get(term.name, 1.0) * term.compute(
+                    self.model, outputs, train_data, bound_physics_fn
+                )
+
+            # Starts are independent, so the sum gives each its own gradient
+            torch.nan_to_num(member_losses, nan=0.0, posinf=0.0).sum().backward()
+            optimizer.step()
+
+            if (epoch + 1) % prune_interval == 0 and n_active > min_starts:
+                losses = member_losses.detach()
+                finite = torch.isfinite(losses)
+                median = losses[finite].median() if finite.any() else torch.tensor(float('inf'))
+                keep = finite & (losses <= prune_factor * median)
+                if keep.sum() < min_starts:
+                    keep = torch.zeros_like(keep)
+                    keep[torch.argsort(torch.nan_to_num(losses, nan=float('inf')))[:min_starts]] = True
+
+                if not keep.all():
+                    pruned.extend((epoch, int(i)) for i in start_ids[~keep])
+                    old_tensors = list(params.values()) + list(coefficients.values())
+                    params = self._select_members(params, keep)
+                    search['params'] = params
+                    search['buffers'] = self._select_members(search['buffers'], keep)
+                    coefficients = self._select_members(coefficients, keep)
+                    start_ids = start_ids[keep]
+                    # The final losses below must refer to the surviving starts
+                    member_losses = member_losses.detach()[keep]
+
+                    # Carry the Adam moments of the surviving starts over
+                    new_tensors = list(params.values()) + list(coefficients.values())
+                    new_optimizer = optim.Adam(new_tensors, lr=learning_rate)
+                    for old, new in zip(old_tensors, new_tensors):
+                        state = optimizer.state.get(old)
+                        if state:
+                            new_optimizer.state[new] = {
+                                key: value[keep] if torch.is_tensor(value) and value.dim() > 0 else value
+                                for key, value in state.items()
+                            }
+                    optimizer = new_optimizer
+
+                    self.logger.log_equation_specific_info(
+                        f"Epoch {epoch}: pruned to {start_ids.shape[0]} starts"
+                    )
+
+            if epoch % self.log_interval == 0:
+                self.logger.log_training_progress(
+                    epoch, epochs, 0.0, torch.nan_to_num(member_losses.detach(), nan=float('inf')).min().item()
+                )
+
+        final_losses = torch.nan_to_num(member_losses.detach(), nan=float('inf'))
+        best = int(torch.argmin(final_losses))
+
+        # Load the best start into the trainer's model and coefficients
+        with torch.no_grad():
+            self.model.load_state_dict(
+                {name: tensor[best] for name, tensor in list(params.items()) + list(search['buffers'].items())},
+                strict=False
+            )
+            for name, values in coefficients.items():
+                self.pde_parameters[name].copy_(values[best])
+
+        # Optimizers built before the search hold stale parameter references
+        if self.optimizer_type is not None:
+            self.setup_optimizer(self.learning_rate, self.optimizer_type, self.lbfgs_switch_fraction)
+
+        results = {
+            'best_start': int(start_ids[best]),
+            'best_loss': final_losses[best].item(),
+            'identified_parameters': self.get_identified_parameters(),
+            'start_ids': start_ids.tolist(),
+            'final_losses': final_losses.tolist(),
+            'final_parameters': {name: values.detach().tolist() for name, values in coefficients.items()},
+            'pruned': pruned,
+            'search_time': time.time() - start_time
+        }
+
+        self.logger.log_equation_specific_info(
+            f"Multi-start search finished: best start {results['best_start']} "
+            f"with loss {results['best_loss']:.6e}, parameters {results['identified_parameters']}"
+        )
+
+        return results
@@ -0,0 +1,14 @@
+"""
+Runtime Module for PINN Research Platform.
+
+Lightweight inference for trained models exported with
+``utils.export.export_numpy``. Only NumPy is imported, so prediction workers
+start in milliseconds and stay small.
+"""
+
+from .numpy_model import NumpyModel, load_model
+
+__all__ = [
+    'NumpyModel',
+    'load_model'
+]
@@ -0,0 +1,194 @@
+"""
+NumPy Inference Runtime for PINN Research Platform.
+
+This module evaluates models exported to ``.npz`` by
+``utils.export.export_numpy``. The layer graph is a list of ops (linear,
+activation, Fourier features, residual blocks, stacked scale mixtures);
+linear layers are single BLAS GEMMs on the whole batch and activations are
+applied in place. It deliberately imports nothing but NumPy.
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional, Union
+from pathlib import Path
+import json
+import math
+
+
+# Highest graph format version this runtime understands
+SUPPORTED_FORMAT_VERSION = 1
+
+
+def _erf(x: np.ndarray) -> np.ndarray:
+    """Error function (Abramowitz and Stegun 7.1.26, absolute error below 1.5e-7)."""
+    sign = np.sign(x)
+    a = np.abs(x)
+    t = 1.0 / (1.0 + 0.3275911 * a)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return sign * (1.0 - poly * np.exp(-a * a))
+
+
+def _sigmoid(h: np.ndarray) -> np.ndarray:
+    """Numerically stable logistic sigmoid, in place."""
+    h *= 0.5
+    np.tanh(h, out=h)
+    h += 1.0
+    h *= 0.5
+    return h
+
+
+def _silu(h: np.ndarray) -> np.ndarray:
+    return h * _sigmoid(h.copy())
+
+
+def _gelu(h: np.ndarray) -> np.ndarray:
+    return 0.5 * h * (1.0 + _erf(h / math.sqrt(2.0)))
+
+
+# Activations by runtime name; in-place where NumPy allows it
+ACTIVATIONS = {
+    'tanh': lambda h: np.tanh(h, out=h),
+    'relu': lambda h: np.maximum(h, 0.0, out=h),
+    'sigmoid': _sigmoid,
+    'silu': _silu,
+    'gelu': _gelu,
+    'softplus': lambda h: np.logaddexp(0.0, h, out=h),
+    'sin': lambda h: np.sin(h, out=h)
+}
+
+
+class NumpyModel:
+    """Exported PINN evaluated with NumPy only."""
+
+    def __init__(self, graph: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        """Initialize the model from an exported graph.
+
+        Args:
+            graph (Dict[str, Any]): Graph description ('ops', 'input_dim', 'output_dim', ...).
+            arrays (Dict[str, np.ndarray]): Weight arrays referenced by the ops.
+        """
+        if graph.get('version', 0) > SUPPORTED_FORMAT_VERSION:
+            raise ValueError(f"Unsupported export format version: {graph.get('version')}")
+
+        self.graph = graph
+        self.ops = graph['ops']
+        self.arrays = arrays
+        self.model_type = graph.get('model_type')
+        self.input_dim = graph.get('input_dim')
+        self.output_dim = graph.get('output_dim')
+        self.metadata = graph.get('metadata', {})
+        self.dtype = next(iter(arrays.values())).dtype if arrays else np.dtype(np.float32)
+
+        for op in self._walk(self.ops):
+            if op['op'] == 'activation' and op['name'] not in ACTIVATIONS:
+                raise ValueError(f"Unsupported activation: {op['name']}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'NumpyModel':
+        """Load an exported ``.npz`` file.
+
+        Args:
+            path (Union[str, Path]): File written by ``export_numpy``.
+
+        Returns:
+            NumpyModel: Loaded model.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            graph = json.loads(str(data['graph']))
+            arrays = {key: data[key] for key in data.files if key != 'graph'}
+        return cls(graph, arrays)
+
+    @staticmethod
+    def _walk(ops: List[Dict[str, Any]]):
+        """Iterate over ops, including nested ones."""
+        for op in ops:
+            yield op
+            if op['op'] == 'residual':
+                yield from NumpyModel._walk(op['body'])
+                yield from NumpyModel._walk(op['skip'])
+
+    def _linear(self, op: Dict[str, Any], h: np.ndarray) -> np.ndarray:
+        """Apply a linear layer (one GEMM)."""
+        out = h @ self.arrays[op['weight']]
+        if op['bias'] is not None:
+            out += self.arrays[op['bias']]
+        return out
+
+    def _run(self, ops: List[Dict[str, Any]], h: np.ndarray) -> np.ndarray:
+        """Apply a list of ops to a batch."""
+        for op in ops:
+            kind = op['op']
+            if kind == 'linear':
+                h = self._linear(op, h)
+            elif kind == 'activation':
+                h = ACTIVATIONS[op['name']](h)
+            elif kind == 'fourier':
+                h = h @ self.arrays[op['weight']]
+                h *= 2.0 * math.pi
+                np.cos(h, out=h)
+            elif kind == 'residual':
+                skip = self._run(op['skip'], h) if op['skip'] else h
+                out = self._run(op['body'], h)
+                out += skip
+                h = ACTIVATIONS[op['activation']](out)
+            elif kind == 'mixture':
+                # Scale networks as batched GEMMs over the stacked (K, in, out) weights
+                weights, biases = op['weights'], op['biases']
+                out = h[np.newaxis]
+                for index, (weight, bias) in enumerate(zip(weights, biases)):
+                    out = np.matmul(out, self.arrays[weight])
+                    out += self.arrays[bias]
+                    if index < len(weights) - 1:
+                        out = ACTIVATIONS[op['activation']](out)
+                h = np.tensordot(self.arrays[op['mixture']], out, axes=1)
+            else:
+                raise ValueError(f"Unsupported op: {kind}")
+        return h
+
+    def predict(self, inputs: np.ndarray, batch_size: Optional[int] = 65536) -> np.ndarray:
+        """Evaluate the model.
+
+        Args:
+            inputs (np.ndarray): Inputs of shape (n, input_dim).
+            batch_size (int, optional): Points per chunk (bounds the activation memory).
+
+        Returns:
+            np.ndarray: Predictions of shape (n, output_dim).
+        """
+        inputs = np.asarray(inputs, dtype=self.dtype)
+        if inputs.ndim == 1:
+            inputs = inputs.reshape(-1, 1)
+        if batch_size is None or inputs.shape[0] <= batch_size:
+            return self._run(self.ops, inputs)
+
+        return np.concatenate([
+            self._run(self.ops, inputs[start:start + batch_size])
+            for start in range(0, inputs.shape[0], batch_size)
+        ])
+
+    def predict_xt(self, x: np.ndarray, t: np.ndarray, batch_size: Optional[int] = 65536) -> np.ndarray:
+        """Evaluate at spatial and temporal coordinates.
+
+        Args:
+            x (np.ndarray): Spatial coordinates.
+            t (np.ndarray): Temporal coordinates (same number of points).
+
+        Returns:
+            np.ndarray: Predictions of shape (n, output_dim).
+        """
+        inputs = np.column_stack([np.ravel(x), np.ravel(t)])
+        return self.predict(inputs, batch_size)
+
+    __call__ = predict
+
+
+def load_model(path: Union[str, Path]) -> NumpyModel:
+    """Load an exported model.
+
+    Args:
+        path (Union[str, Path]): File written by ``export_numpy``.
+
+    Returns:
+        NumpyModel: Loaded model.
+    """
+    return NumpyModel.load(path)
@@ -0,0 +1,34 @@
+"""
+Shared test fixtures for PINN Research Platform.
+
+The tests run from the repository root (``python -m pytest tests``); the
+root is also put on the path so plain ``pytest`` finds the packages.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    """Make every test deterministic."""
+    torch.manual_seed(0)
+
+
+@pytest.fixture
+def heat_data():
+    """Small heat-equation training set on [0, 1] x [0, 1] with u(x, 0) = sin(pi x)."""
+    x_ic = torch.rand(32, 1)
+    t_bc = torch.rand(32, 1)
+    return {
+        'x': torch.rand(64, 2),
+        'x_bc': torch.cat([torch.cat([torch.zeros(16, 1), torch.ones(16, 1)]), t_bc], dim=1),
+        'u_bc': torch.zeros(32, 1),
+        'x_ic': torch.cat([x_ic, torch.zeros_like(x_ic)], dim=1),
+        'u_ic': torch.sin(torch.pi * x_ic)
+    }
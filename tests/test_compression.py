@@ -0,0 +1,33 @@
+"""Tests for building distillation students in efficiency.compression."""
+
+import pytest
+
+from efficiency.compression import build_student
+from efficiency.models import EfficiencyPINN
+from utils.models import MLP
+
+
+def test_student_keeps_teacher_class_and_activation():
+    student = build_student(EfficiencyPINN(2, 1, [16, 16], hidden_activation='sin'), [4, 4])
+
+    assert isinstance(student, EfficiencyPINN)
+    assert student.hidden_activation == 'sin'
+    assert student.hidden_dims == [4, 4]
+
+
+def test_mlp_teacher_gets_mlp_student():
+    student = build_student(MLP(2, 1, [8], 'gelu'), [2])
+
+    assert isinstance(student, MLP)
+    assert student.activation_name == 'gelu'
+
+
+def test_unsupported_student_activation_raises():
+    with pytest.raises(ValueError, match="Unsupported activation"):
+        build_student(EfficiencyPINN(2, 1, [16]), [4], activation='swish')
+
+
+def test_explicit_student_dimensions_take_precedence():
+    student = build_student(EfficiencyPINN(2, 1, [16]), [4], input_dim=3, output_dim=2)
+
+    assert (student.input_dim, student.output_dim) == (3, 2)
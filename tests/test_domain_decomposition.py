@@ -0,0 +1,16 @@
+"""Tests for argument checks of the domain-decomposition trainer."""
+
+import functools
+
+import pytest
+
+from utils.domain_decomposition import DomainDecompositionTrainer
+from utils.models import DomainDecompositionPINN
+from utils.physics import get_physics_function
+
+
+@pytest.mark.parametrize("options", [{'epochs': 0}, {'epochs': 10, 'exchange_interval': 0}])
+def test_train_rejects_empty_schedules(options, heat_data):
+    trainer = DomainDecompositionTrainer(DomainDecompositionPINN(), 'forward_problems', 'heat')
+    with pytest.raises(ValueError):
+        trainer.train(heat_data, functools.partial(get_physics_function('heat'), alpha=0.1), **options)
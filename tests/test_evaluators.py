@@ -0,0 +1,58 @@
+"""Tests for prediction with uncertainty and optimized serving in the evaluators."""
+
+import numpy as np
+import pytest
+import torch
+
+from forward_problems.evaluator import ForwardProblemsEvaluator
+from uncertainty.evaluator import UncertaintyEvaluator
+from utils.models import MLP, ParametricPINN, StackedEnsemble
+
+
+@pytest.fixture
+def grid():
+    return np.meshgrid(np.linspace(0, 1, 10), np.linspace(0, 1, 10))
+
+
+def test_parametric_grid_evaluation_with_laplace(grid):
+    x_grid, t_grid = grid
+    evaluator = ForwardProblemsEvaluator(ParametricPINN({'alpha': (0.01, 1.0)}, hidden_dims=[16, 16]),
+                                         'forward_problems', 'heat')
+    evaluator.fit_laplace(torch.rand(50, 1), torch.rand(50, 1), torch.zeros(50, 1),
+                          parameters={'alpha': 0.1})
+
+    results = evaluator.evaluate_on_grid(x_grid, t_grid, np.zeros_like(x_grid),
+                                         uncertainty_method='laplace', parameters={'alpha': 0.1})
+    assert results['predictions'].shape == x_grid.shape
+    assert results['uncertainty'].shape == x_grid.shape
+    assert np.all(results['uncertainty'] > 0)
+
+
+def test_uncertainty_evaluator_returns_standard_deviation(grid):
+    x_grid, t_grid = grid
+    ensemble = StackedEnsemble([MLP(2, 1, [8]) for _ in range(4)])
+    evaluator = UncertaintyEvaluator(ensemble, 'uncertainty', 'heat')
+
+    x, t = torch.rand(20, 1), torch.rand(20, 1)
+    mean, std = evaluator.predict_with_uncertainty(x, t)
+    with torch.no_grad():
+        expected_mean, variance = ensemble.predict_mean_var(torch.cat([x, t], dim=1))
+    assert torch.allclose(mean, expected_mean)
+    assert torch.allclose(std, variance.sqrt())
+
+    results = evaluator.evaluate_on_grid(x_grid, t_grid, np.zeros_like(x_grid))
+    assert np.allclose(results['variance'], results['uncertainty'] ** 2)
+
+
+def test_failed_serving_optimization_keeps_previous_model(grid):
+    x_grid, t_grid = grid
+    evaluator = ForwardProblemsEvaluator(MLP(2, 1, [16, 16]), 'forward_problems', 'heat')
+    fusion = torch.jit.onednn_fusion_enabled()
+
+    assert evaluator.optimize_for_serving(x_grid, t_grid)['deployed']
+    serving_model = evaluator.serving_model
+    assert torch.jit.onednn_fusion_enabled() == fusion
+
+    report = evaluator.optimize_for_serving(x_grid, t_grid, tolerance=-1.0)
+    assert not report['deployed']
+    assert evaluator.serving_model is serving_model
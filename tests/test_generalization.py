@@ -0,0 +1,43 @@
+"""Tests for DeepONet training and evaluation in the generalization package."""
+
+import numpy as np
+import pytest
+import torch
+
+from generalization import DeepONet, GeneralizationEvaluator, GeneralizationTrainer
+from generalization.trainer import sample_initial_conditions
+
+
+@pytest.fixture
+def deeponet():
+    return DeepONet(num_sensors=20, latent_dim=10, branch_hidden_dims=[16], trunk_hidden_dims=[16])
+
+
+@pytest.fixture
+def u_sensors():
+    x_sensors = torch.linspace(0, 1, 20).reshape(-1, 1)
+    return sample_initial_conditions(x_sensors, torch.rand(8, 1), 3, seed=1)[0]
+
+
+def test_deeponet_forward_groups_per_function(deeponet, u_sensors, heat_data):
+    trainer = GeneralizationTrainer(deeponet, 'generalization', 'heat')
+    outputs = trainer.forward_groups(dict(heat_data, u_sensors=u_sensors), ['interior', 'boundary'])
+
+    assert outputs['interior'].shape == (3, 64, 1)
+    assert outputs['boundary'].shape == (3, 32, 1)
+    assert outputs['x_interior'].shape == (3, 64, 1)
+    assert outputs['x_interior'].requires_grad
+
+
+def test_deeponet_prediction_needs_input_function(deeponet, u_sensors):
+    evaluator = GeneralizationEvaluator(deeponet, 'generalization', 'heat')
+    x_grid, t_grid = np.meshgrid(np.linspace(0, 1, 5), np.linspace(0, 1, 5))
+
+    with pytest.raises(ValueError, match="u_sensors"):
+        evaluator.evaluate_on_grid(x_grid, t_grid, np.ones_like(x_grid))
+
+    results = evaluator.evaluate_on_grid(x_grid, t_grid, np.ones_like(x_grid), u_sensors[1])
+    x = torch.FloatTensor(x_grid.reshape(-1, 1))
+    t = torch.FloatTensor(t_grid.reshape(-1, 1))
+    expected = evaluator.predict_operator(u_sensors, x, t)[1].numpy().reshape(x_grid.shape)
+    assert np.allclose(results['predictions'], expected)
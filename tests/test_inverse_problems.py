@@ -0,0 +1,41 @@
+"""Tests for coefficient identification in the inverse-problems trainer."""
+
+import pytest
+import torch
+
+from inverse_problems.trainer import InverseProblemsTrainer
+from utils.models import MLP
+
+
+@pytest.fixture
+def observed_heat_data(heat_data):
+    x_data = torch.rand(16, 2)
+    u_data = torch.exp(-0.1 * torch.pi ** 2 * x_data[:, 1:2]) * torch.sin(torch.pi * x_data[:, 0:1])
+    return dict(heat_data, x_data=x_data, u_data=u_data)
+
+
+def test_multi_start_search_pruned_on_last_epoch(observed_heat_data):
+    trainer = InverseProblemsTrainer(MLP(2, 1, [8]), 'inverse_problems', 'heat',
+                                     unknown_parameters={'alpha': 0.5})
+    results = trainer.multi_start_search(observed_heat_data, {'alpha': (0.01, 1.0)}, n_starts=8,
+                                         epochs=4, prune_interval=4, prune_factor=1.0)
+
+    # The last epoch pruned, so the reported arrays must all refer to the survivors
+    assert len(results['start_ids']) < 8
+    assert len(results['final_losses']) == len(results['start_ids'])
+    assert len(results['final_parameters']['alpha']) == len(results['start_ids'])
+
+    best = min(range(len(results['final_losses'])), key=results['final_losses'].__getitem__)
+    assert results['best_start'] == results['start_ids'][best]
+    assert results['best_loss'] == results['final_losses'][best]
+    assert results['identified_parameters']['alpha'] == pytest.approx(results['final_parameters']['alpha'][best])
+
+
+def test_multi_start_search_keeps_all_starts_without_pruning(observed_heat_data):
+    trainer = InverseProblemsTrainer(MLP(2, 1, [8]), 'inverse_problems', 'heat',
+                                     unknown_parameters={'alpha': 0.5})
+    results = trainer.multi_start_search(observed_heat_data, {'alpha': (0.01, 1.0)}, n_starts=4,
+                                         epochs=3, prune_interval=100)
+
+    assert results['start_ids'] == [0, 1, 2, 3]
+    assert trainer._search is None
@@ -0,0 +1,35 @@
+"""Tests for Levenberg-Marquardt training with bound equation coefficients."""
+
+import functools
+
+import pytest
+import torch
+
+from utils.models import MLP
+from utils.physics import get_physics_function
+from utils.trainer import PINNTrainer
+
+
+def train_lm(train_data, physics_fn, epochs=5):
+    torch.manual_seed(0)
+    trainer = PINNTrainer(MLP(2, 1, [10, 10]), 'forward_problems', 'heat')
+    trainer.setup_optimizer(1e-3, 'lm')
+    return trainer.train(train_data, physics_fn, epochs=epochs, save_interval=epochs)
+
+
+def test_lm_reduces_loss_with_partial(heat_data):
+    history = train_lm(heat_data, functools.partial(get_physics_function('heat'), alpha=0.1))
+    assert history['total_loss'][-1] < history['total_loss'][0]
+
+
+def test_lm_explicit_coefficients_match_partial(heat_data):
+    heat = get_physics_function('heat')
+    bound = train_lm(heat_data, functools.partial(heat, alpha=0.1))
+    explicit = train_lm(dict(heat_data, coefficients={'alpha': 0.1}), lambda x, t, u: heat(x, t, u, alpha=0.1))
+    assert explicit['total_loss'] == pytest.approx(bound['total_loss'])
+
+
+def test_lm_unknown_coefficients_raise(heat_data):
+    heat = get_physics_function('heat')
+    with pytest.raises(ValueError, match="coefficients are unknown"):
+        train_lm(heat_data, lambda x, t, u: heat(x, t, u, alpha=0.1), epochs=1)
@@ -0,0 +1,49 @@
+"""Tests for the shared model helpers in utils.models and the purpose models built on them."""
+
+import pytest
+import torch
+import torch.nn as nn
+
+from data_assimilation.models import DataAssimilationPINN
+from efficiency.models import EfficiencyPINN
+from forward_problems.models import ForwardProblemsPINN
+from generalization.models import GeneralizationPINN
+from uncertainty.models import UncertaintyPINN
+from utils.models import create_pinn_model, init_linear_weights
+
+
+@pytest.mark.parametrize("model_class", [DataAssimilationPINN, UncertaintyPINN, ForwardProblemsPINN, EfficiencyPINN,
+                                         GeneralizationPINN])
+def test_purpose_models_use_zero_biases(model_class):
+    model = model_class(hidden_dims=[8, 8])
+    for module in model.modules():
+        if isinstance(module, nn.Linear):
+            assert torch.count_nonzero(module.bias) == 0
+    assert model(torch.rand(5, 2)).shape == (5, 1)
+
+
+@pytest.mark.parametrize("weight_init", ["xavier", "normal", "uniform", "he"])
+def test_init_linear_weights(weight_init):
+    model = nn.Sequential(nn.Linear(2, 8), nn.Tanh(), nn.Linear(8, 1))
+    with torch.no_grad():
+        for param in model.parameters():
+            param.fill_(1.0)
+
+    init_linear_weights(model, weight_init)
+    assert torch.count_nonzero(model[0].bias) == 0
+    assert model[0].weight.std() > 0
+
+
+def test_init_linear_weights_unknown_scheme_raises():
+    with pytest.raises(ValueError, match="Unsupported weight initialization"):
+        init_linear_weights(nn.Linear(2, 1), 'orthogonal')
+
+
+def test_hash_grid_bounds_from_domain():
+    model = create_pinn_model('hash_grid', input_dim=2, output_dim=1, hidden_dims=[8],
+                              x_range=(-1.0, 1.0), t_range=(0.0, 2.0))
+    assert model.encoding.lower.tolist() == [-1.0, 0.0]
+    assert model.encoding.upper.tolist() == [1.0, 2.0]
+
+    with pytest.raises(ValueError, match="input domain"):
+        create_pinn_model('hash_grid', input_dim=2, output_dim=1, hidden_dims=[8])
@@ -0,0 +1,53 @@
+"""Tests for utils.physics: equation coefficients and periodic embeddings."""
+
+import functools
+
+import pytest
+import torch
+
+from utils.models import create_pinn_model
+from utils.physics import PeriodicEmbedding, get_physics_function, physics_coefficients
+
+
+def test_physics_coefficients_from_partial():
+    physics_fn = functools.partial(get_physics_function('heat'), alpha=0.1)
+    assert physics_coefficients(physics_fn) == {'alpha': 0.1}
+
+
+def test_physics_coefficients_partial_overrides_explicit():
+    physics_fn = functools.partial(get_physics_function('heat'), alpha=0.1)
+    assert physics_coefficients(physics_fn, {'alpha': 0.5}) == {'alpha': 0.1}
+
+
+def test_physics_coefficients_explicit_for_plain_function():
+    heat = get_physics_function('heat')
+    assert physics_coefficients(lambda x, t, u: heat(x, t, u, alpha=0.1), {'alpha': 0.1}) == {'alpha': 0.1}
+
+
+def test_physics_coefficients_unknown_raises():
+    heat = get_physics_function('heat')
+    with pytest.raises(ValueError, match="coefficients are unknown"):
+        physics_coefficients(lambda x, t, u: heat(x, t, u, alpha=0.1))
+
+
+def test_periodic_embedding_requires_period():
+    with pytest.raises(TypeError):
+        PeriodicEmbedding()
+    with pytest.raises(ValueError):
+        PeriodicEmbedding(0.0)
+
+
+def test_periodic_model_period_from_x_range():
+    model = create_pinn_model('standard', input_dim=2, output_dim=1, hidden_dims=[8],
+                              boundary_condition='periodic', x_range=(0.0, 1.0))
+    assert model.embedding.period == 1.0
+
+    inputs = torch.rand(16, 2)
+    shifted = inputs + torch.tensor([1.0, 0.0])
+    assert torch.allclose(model(inputs), model(shifted), atol=1e-5)
+
+
+def test_periodic_model_without_period_raises():
+    with pytest.raises(ValueError, match="period"):
+        create_pinn_model('standard', input_dim=2, output_dim=1, hidden_dims=[8],
+                          boundary_condition='periodic')
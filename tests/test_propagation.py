@@ -0,0 +1,64 @@
+"""Tests for Monte Carlo coefficient uncertainty propagation."""
+
+import pytest
+import torch
+import torch.nn as nn
+
+from uncertainty.propagation import ParameterDistribution, ParameterUncertaintyPropagator
+
+
+class LinearInAlpha(nn.Module):
+    """u(x, t; alpha) = (x + 1) alpha on inputs (x, t, alpha)."""
+
+    def forward(self, inputs: torch.Tensor) -> torch.Tensor:
+        return (inputs[:, 0:1] + 1) * inputs[:, 2:3]
+
+
+def propagate(max_batch_rows):
+    propagator = ParameterUncertaintyPropagator(
+        LinearInAlpha(), {'alpha': ParameterDistribution('uniform', low=0.0, high=1.0)},
+        max_batch_rows=max_batch_rows
+    )
+    return propagator.propagate(torch.tensor([[0.0], [1.0]]), torch.zeros(2, 1), n_samples=2000,
+                                method='random', seed=0)
+
+
+def test_quantiles_do_not_depend_on_batch_size():
+    small = propagate(max_batch_rows=5)
+    large = propagate(max_batch_rows=2 ** 20)
+
+    assert small['quantiles'].keys() == large['quantiles'].keys()
+    for level in small['quantiles']:
+        assert torch.allclose(small['quantiles'][level], large['quantiles'][level])
+    assert torch.allclose(small['mean'], large['mean'])
+
+
+def test_quantiles_match_uniform_coefficient():
+    results = propagate(max_batch_rows=5)
+    for level, values in results['quantiles'].items():
+        expected = torch.tensor([1.0, 2.0], dtype=values.dtype) * float(level)
+        assert torch.allclose(values, expected, atol=0.05)
+
+
+class RecordingModel(LinearInAlpha):
+    """LinearInAlpha that records the number of rows of every forward pass."""
+
+    def __init__(self):
+        super(RecordingModel, self).__init__()
+        self.rows = []
+
+    def forward(self, inputs: torch.Tensor) -> torch.Tensor:
+        self.rows.append(inputs.shape[0])
+        return super(RecordingModel, self).forward(inputs)
+
+
+def test_polynomial_chaos_respects_max_batch_rows():
+    model = RecordingModel()
+    propagator = ParameterUncertaintyPropagator(
+        model, {'alpha': ParameterDistribution('uniform', low=0.0, high=1.0)}, max_batch_rows=40
+    )
+    pce = propagator.fit_pce(torch.rand(10, 1), torch.zeros(10, 1), degree=2, n_samples=32, seed=0)
+
+    assert max(model.rows) <= 40
+    assert sum(model.rows) == 32 * 10
+    assert pce is not None
@@ -0,0 +1,128 @@
+"""Tests for the shared PINNTrainer engine."""
+
+import functools
+
+import pytest
+import torch
+
+from utils.model_store import ModelStore
+from utils.models import MLP, SeparablePINN
+from utils.physics import get_physics_function
+from utils.trainer import PINNTrainer
+
+
+@pytest.fixture
+def heat_physics():
+    return functools.partial(get_physics_function('heat'), alpha=0.1)
+
+
+def test_compute_losses_covers_default_terms(heat_data, heat_physics):
+    trainer = PINNTrainer(MLP(2, 1, [8, 8]), 'forward_problems', 'heat')
+    losses = trainer.compute_losses(heat_data, heat_physics, {'boundary': 2.0})
+
+    assert set(losses) == {'physics_loss', 'boundary_loss', 'initial_loss', 'total_loss'}
+    expected = losses['physics_loss'] + 2.0 * losses['boundary_loss'] + losses['initial_loss']
+    assert losses['total_loss'].item() == pytest.approx(expected.item())
+
+
+def test_forward_groups_differentiates_interior(heat_data):
+    trainer = PINNTrainer(MLP(2, 1, [8, 8]), 'forward_problems', 'heat')
+    outputs = trainer.forward_groups(heat_data, ['interior', 'boundary'])
+
+    assert outputs['interior'].shape == (64, 1)
+    assert outputs['boundary'].shape == (32, 1)
+    assert outputs['x_interior'].requires_grad and outputs['t_interior'].requires_grad
+    u_x = torch.autograd.grad(outputs['interior'].sum(), outputs['x_interior'])[0]
+    assert u_x.shape == (64, 1)
+
+
+def test_train_reduces_loss(heat_data, heat_physics):
+    trainer = PINNTrainer(MLP(2, 1, [8, 8]), 'forward_problems', 'heat')
+    trainer.setup_optimizer(1e-2)
+    history = trainer.train(heat_data, heat_physics, epochs=50, save_interval=50)
+
+    assert len(history['total_loss']) == 50
+    assert history['total_loss'][-1] < history['total_loss'][0]
+
+
+def test_unknown_loss_term_raises():
+    with pytest.raises(ValueError, match="Unsupported loss term"):
+        PINNTrainer(MLP(2, 1, [8]), 'forward_problems', 'heat', loss_terms=['unknown'])
+
+
+def test_warm_start_drops_scheduler(tmp_path):
+    store = ModelStore(str(tmp_path))
+    store.add(MLP(2, 1, [8, 8]), 'forward_problems', 'heat', {'alpha': 0.1})
+
+    trainer = PINNTrainer(MLP(2, 1, [8, 8]), 'forward_problems', 'heat')
+    trainer.setup_optimizer(1e-3)
+    trainer.setup_scheduler('step', step_size=10)
+    old_optimizer = trainer.optimizer
+
+    assert trainer.warm_start(store, {'alpha': 0.2}, freeze=1) is not None
+    assert trainer.optimizer is not old_optimizer
+    assert trainer.scheduler is None
+
+
+def test_cached_trunk_drops_scheduler(heat_data, heat_physics):
+    trainer = PINNTrainer(MLP(2, 1, [8, 8, 8]), 'forward_problems', 'heat')
+    trainer.setup_optimizer(1e-3)
+    trainer.setup_scheduler('step', step_size=10)
+
+    trainer.enable_cached_trunk(heat_data, num_frozen=1)
+    assert trainer.scheduler is None
+    trainer.train(heat_data, heat_physics, epochs=2, save_interval=2)
+
+    trainer.setup_scheduler('step', step_size=10)
+    trainer.disable_cached_trunk()
+    assert trainer.scheduler is None
+    trained = {id(p) for group in trainer.optimizer.param_groups for p in group['params']}
+    assert trained == {id(p) for p in trainer.model.parameters() if p.requires_grad}
+
+
+def test_time_marching_restarts_schedule_per_window(heat_data, heat_physics):
+    trainer = PINNTrainer(MLP(2, 1, [8]), 'forward_problems', 'heat')
+    trainer.setup_optimizer(1e-2)
+    trainer.setup_scheduler('step', step_size=2, gamma=0.5)
+
+    trainer.train_time_marching(heat_data, heat_physics, num_windows=2, epochs_per_window=4)
+    assert trainer.scheduler.optimizer is trainer.optimizer
+    # The last window's schedule starts from the initial learning rate
+    assert trainer.optimizer.param_groups[0]['lr'] == pytest.approx(1e-2 * 0.5 ** 2)
+
+
+@pytest.fixture
+def grid_data():
+    return {'x_axis': torch.linspace(0, 1, 16), 't_axis': torch.linspace(0, 1, 16)}
+
+
+def test_grid_physics_by_name_takes_trainer_equation(grid_data):
+    trainer = PINNTrainer(SeparablePINN(), 'forward_problems', 'heat', loss_terms=['grid_physics'])
+    assert trainer.loss_terms[0].equation == 'heat'
+
+    losses = trainer.compute_losses(grid_data, functools.partial(get_physics_function('heat'), alpha=0.1), {})
+    assert torch.isfinite(losses['physics_loss'])
+
+
+def test_grid_physics_explicit_coefficients_match_partial(grid_data):
+    heat = get_physics_function('heat')
+    trainer = PINNTrainer(SeparablePINN(), 'forward_problems', 'heat', loss_terms=['grid_physics'])
+
+    bound = trainer.compute_losses(grid_data, functools.partial(heat, alpha=0.1), {})
+    explicit = trainer.compute_losses(dict(grid_data, coefficients={'alpha': 0.1}),
+                                      lambda x, t, u: heat(x, t, u, alpha=0.1), {})
+    assert explicit['physics_loss'].item() == pytest.approx(bound['physics_loss'].item())
+
+    with pytest.raises(ValueError, match="coefficients are unknown"):
+        trainer.compute_losses(grid_data, lambda x, t, u: heat(x, t, u, alpha=0.1), {})
+
+
+def test_enable_lora_drops_scheduler():
+    trainer = PINNTrainer(MLP(2, 1, [8, 8]), 'forward_problems', 'heat')
+    trainer.setup_optimizer(1e-3)
+    trainer.setup_scheduler('step', step_size=10)
+
+    trainer.enable_lora(rank=2)
+    assert trainer.scheduler is None
+    trained = {id(p) for group in trainer.optimizer.param_groups for p in group['params']}
+    assert trained == {id(p) for p in trainer.model.parameters() if p.requires_grad}
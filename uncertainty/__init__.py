@@ -6,10 +6,21 @@ Uncertainty quantification using PINNs. Quantify and propagate uncertainties in
 
 from .trainer import UncertaintyTrainer
 from .evaluator import UncertaintyEvaluator
-from .models import UncertaintyPINN
+from .models import UncertaintyPINN, UncertaintyEnsemble
+from .propagation import (
+    ParameterDistribution,
+    ParameterUncertaintyPropagator,
+    PolynomialChaosExpansion,
+    distributions_from_config
+)
 
 __all__ = [
     'UncertaintyTrainer',
     'UncertaintyEvaluator', 
-    'UncertaintyPINN'
+    'UncertaintyPINN',
+    'UncertaintyEnsemble',
+    'ParameterDistribution',
+    'ParameterUncertaintyPropagator',
+    'PolynomialChaosExpansion',
+    'distributions_from_config'
 ]
@@ -14,6 +14,9 @@ import seaborn as sns
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from utils.loggers import get_purpose_logger
+from utils.models import StackedEnsemble
+from utils.inference import LastLayerLaplace, has_dropout, mc_dropout_predict
+from .propagation import ParameterDistribution, ParameterUncertaintyPropagator
 
 
 class UncertaintyEvaluator:
@@ -33,6 +36,7 @@ class UncertaintyEvaluator:
         self.logger = get_purpose_logger(purpose, equation)
         
         self.model.eval()  # Set model to evaluation mode
+        self.laplace = None
         
         self.logger.log_purpose_specific_info("Uncertainty Evaluator initialized")
 
@@ -48,9 +52,106 @@ class UncertaintyEvaluator:
         """
         with torch.no_grad():
             inputs = torch.cat([x, t], dim=1)
-            predictions = self.model(inputs)
+            if isinstance(self.model, StackedEnsemble):
+                predictions = self.model(inputs).mean(dim=0)
+            else:
+                predictions = self.model(inputs)
         return predictions
 
+    def fit_laplace(self, x: torch.Tensor, t: torch.Tensor, u: Optional[torch.Tensor] = None,
+                    noise_std: Optional[float] = None, prior_precision: float = 1.0) -> LastLayerLaplace:
+        """Fit a last-layer Laplace approximation for a single (non-ensemble) model.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates of the fitting points.
+            t (torch.Tensor): Temporal coordinates of the fitting points.
+            u (torch.Tensor, optional): Target values used to estimate the noise.
+            noise_std (float, optional): Observation noise standard deviation.
+            prior_precision (float): Prior precision of the last-layer weights.
+
+        Returns:
+            LastLayerLaplace: Fitted Laplace approximation (cached on the evaluator).
+        """
+        self.laplace = LastLayerLaplace(self.model, prior_precision).fit(
+            torch.cat([x, t], dim=1), u, noise_std
+        )
+        return self.laplace
+
+    def predict_with_uncertainty(self, x: torch.Tensor, t: torch.Tensor,
+                                 method: str = "auto",
+                                 num_samples: int = 50) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Predict the predictive mean and standard deviation in one vectorized pass.
+
+        Like the other evaluators' ``predict_with_uncertainty``, this returns the
+        standard deviation (in the units of u), not the variance.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates.
+            t (torch.Tensor): Temporal coordinates.
+            method (str): 'ensemble', 'mc_dropout', 'laplace' or 'auto' (ensemble for
+                stacked ensembles, then a fitted Laplace approximation, then MC dropout).
+            num_samples (int): Number of dropout samples.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Predictive mean and standard deviation
+            (zero if no method applies).
+        """
+        inputs = torch.cat([x, t], dim=1)
+        
+        method = method.lower()
+        if method == "auto":
+            if isinstance(self.model, StackedEnsemble):
+                method = "ensemble"
+            elif self.laplace is not None:
+                method = "laplace"
+            elif has_dropout(self.model):
+                method = "mc_dropout"
+        
+        if method == "ensemble":
+            with torch.no_grad():
+                mean, variance = self.model.predict_mean_var(inputs)
+            return mean, variance.sqrt()
+        elif method == "mc_dropout":
+            return mc_dropout_predict(self.model, inputs, num_samples)
+        elif method == "laplace":
+            if self.laplace is None:
+                raise ValueError("Call fit_laplace before predicting with method='laplace'")
+            return self.laplace.predict(inputs)
+        elif method != "auto":
+            raise ValueError(f"Unsupported uncertainty method: {method}")
+        
+        with torch.no_grad():
+            predictions = self.model(inputs)
+        return predictions, torch.zeros_like(predictions)
+
+    def propagate_parameter_uncertainty(self, x: torch.Tensor, t: torch.Tensor,
+                                        distributions: Dict[str, ParameterDistribution],
+                                        n_samples: int = 1000, method: str = "sobol",
+                                        confidence_interval: float = 0.95) -> Dict[str, Any]:
+        """Propagate coefficient uncertainty through a parametric model.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates.
+            t (torch.Tensor): Temporal coordinates.
+            distributions (Dict[str, ParameterDistribution]): Coefficient distributions.
+            n_samples (int): Number of Monte Carlo samples.
+            method (str): Sampling method ('sobol', 'lhs', 'random').
+            confidence_interval (float): Width of the reported central interval.
+
+        Returns:
+            Dict[str, Any]: Mean, variance, std, interval bounds and quantiles per point.
+        """
+        alpha = 0.5 * (1.0 - confidence_interval)
+        propagator = ParameterUncertaintyPropagator(self.model, distributions)
+        results = propagator.propagate(x, t, n_samples, method, quantiles=(alpha, 0.5, 1.0 - alpha))
+        results['lower'] = results['quantiles'][alpha]
+        results['upper'] = results['quantiles'][1.0 - alpha]
+        
+        self.logger.log_equation_specific_info(
+            f"Parameter uncertainty propagated with {n_samples} samples - mean std: {results['std'].mean():.4e}"
+        )
+        return results
+
     def compute_metrics(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
         """Compute evaluation metrics.
 
@@ -100,8 +201,9 @@ class UncertaintyEvaluator:
         t_tensor = torch.FloatTensor(t_grid.flatten().reshape(-1, 1))
         
         # Make predictions
-        u_pred_tensor = self.predict(x_tensor, t_tensor)
+        u_pred_tensor, u_std_tensor = self.predict_with_uncertainty(x_tensor, t_tensor)
         u_pred = u_pred_tensor.numpy().reshape(x_grid.shape)
+        u_std = u_std_tensor.numpy().reshape(x_grid.shape)
         
         # Compute metrics
         metrics = self.compute_metrics(u_true.flatten(), u_pred.flatten())
@@ -112,7 +214,9 @@ class UncertaintyEvaluator:
             'true_values': u_true,
             'metrics': metrics,
             'x_grid': x_grid,
-            't_grid': t_grid
+            't_grid': t_grid,
+            'variance': u_std**2,
+            'uncertainty': u_std
         }
         
         self.logger.log_equation_specific_info(f"Grid evaluation completed - R\u00b2: {metrics['r2']:.4f}")
@@ -8,10 +8,11 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable
 import math
 
 from utils.loggers import get_purpose_logger
+from utils.models import StackedEnsemble, init_linear_weights
 
 
 class UncertaintyPINN(nn.Module):
@@ -45,14 +46,6 @@ class UncertaintyPINN(nn.Module):
         self.dropout_rate = dropout_rate
         self.use_fourier_features = use_fourier_features
         
-        # Build network (implement specific architecture for this purpose)
-        # This is a placeholder - implement specific logic for each purpose
-        layers = []
-        prev_dim = input_dim
-        
-        # Initialize weights
-        self._init_weights(weight_init)
-        
         # Build network layers
         layers = []
         prev_dim = input_dim
@@ -91,6 +84,9 @@ class UncertaintyPINN(nn.Module):
         # linear activation (no activation) is default
         
         self.network = nn.Sequential(*layers)
+        
+        # Initialize weights
+        init_linear_weights(self, weight_init)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass.
@@ -117,6 +113,29 @@ class UncertaintyPINN(nn.Module):
         return self.forward(inputs)
 
 
+class UncertaintyEnsemble(StackedEnsemble):
+    """Deep ensemble of independently initialized PINNs trained as one stacked model.
+
+    Members are stacked and evaluated with ``vmap``, so the whole ensemble is
+    trained by the regular trainer with one batched optimizer step and its
+    predictive mean and variance come from one vectorized forward pass.
+    """
+
+    @classmethod
+    def from_factory(cls, model_fn: Callable[[], nn.Module],
+                     num_members: int = 10) -> 'UncertaintyEnsemble':
+        """Create an ensemble from a model constructor.
+
+        Args:
+            model_fn (Callable[[], nn.Module]): Returns a freshly initialized member.
+            num_members (int): Number of ensemble members.
+
+        Returns:
+            UncertaintyEnsemble: Ensemble of independently initialized members.
+        """
+        return cls([model_fn() for _ in range(num_members)])
+
+
 def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """Factory function to create PINN models.
 
@@ -129,6 +148,9 @@ def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """
     if model_type.lower() == "standard":
         return UncertaintyPINN(**kwargs)
+    elif model_type.lower() == "ensemble":
+        num_members = kwargs.pop('num_members', 10)
+        return UncertaintyEnsemble.from_factory(lambda: UncertaintyPINN(**kwargs), num_members)
     else:
         raise ValueError(f"Unsupported model type: {model_type}")
 
@@ -0,0 +1,598 @@
+"""
+Uncertainty Propagation for PINN Research Platform.
+
+This module propagates uncertainty in PDE coefficients through a parametric
+PINN (coefficients as extra network inputs). Monte Carlo samples are drawn
+with Sobol or Latin hypercube designs and cost one batched forward pass each;
+moments and quantiles are accumulated in a streaming fashion, and a sparse
+polynomial-chaos expansion can be fitted for instant repeat queries.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+import itertools
+import math
+
+from utils.loggers import get_general_logger
+
+
+class ParameterDistribution:
+    """Probability distribution of one PDE coefficient.
+
+    Every distribution is written as a transform of a standard germ variable:
+    a standard normal germ (Hermite chaos) for 'normal' and 'lognormal', and a
+    uniform germ on [-1, 1] (Legendre chaos) for 'uniform' and 'weibull'.
+    """
+
+    GERMS = {'normal': 'hermite', 'lognormal': 'hermite', 'uniform': 'legendre', 'weibull': 'legendre'}
+
+    def __init__(self, distribution: str = "normal", mean: Optional[float] = None,
+                 std: Optional[float] = None, low: Optional[float] = None,
+                 high: Optional[float] = None, shape: Optional[float] = None,
+                 scale: Optional[float] = None):
+        """Initialize the distribution.
+
+        Args:
+            distribution (str): 'normal', 'uniform', 'lognormal' or 'weibull'.
+            mean (float, optional): Mean (normal, lognormal).
+            std (float, optional): Standard deviation (normal, lognormal).
+            low (float, optional): Lower bound (uniform).
+            high (float, optional): Upper bound (uniform).
+            shape (float, optional): Shape parameter k (weibull).
+            scale (float, optional): Scale parameter lambda (weibull).
+        """
+        self.distribution = distribution.lower()
+        if self.distribution not in self.GERMS:
+            raise ValueError(f"Unsupported distribution: {distribution}")
+
+        if self.distribution in ('normal', 'lognormal') and (mean is None or std is None):
+            raise ValueError(f"{self.distribution} distribution needs mean and std")
+        if self.distribution == 'uniform' and (low is None or high is None):
+            raise ValueError("uniform distribution needs low and high")
+        if self.distribution == 'weibull' and (shape is None or scale is None):
+            raise ValueError("weibull distribution needs shape and scale")
+
+        self.mean = mean
+        self.std = std
+        self.low = low
+        self.high = high
+        self.shape = shape
+        self.scale = scale
+        self.germ = self.GERMS[self.distribution]
+
+        if self.distribution == 'lognormal':
+            # Parameters of the underlying normal for the given mean and std
+            sigma2 = math.log(1.0 + (std / mean) ** 2)
+            self._log_mu = math.log(mean) - 0.5 * sigma2
+            self._log_sigma = math.sqrt(sigma2)
+
+    def germ_from_uniform(self, u: torch.Tensor) -> torch.Tensor:
+        """Map uniform samples on (0, 1) to the germ variable.
+
+        Args:
+            u (torch.Tensor): Uniform samples.
+
+        Returns:
+            torch.Tensor: Germ samples.
+        """
+        if self.germ == 'hermite':
+            return torch.special.ndtri(u.clamp(1e-12, 1.0 - 1e-12))
+        return 2.0 * u - 1.0
+
+    def from_germ(self, xi: torch.Tensor) -> torch.Tensor:
+        """Map germ samples to coefficient values.
+
+        Args:
+            xi (torch.Tensor): Germ samples.
+
+        Returns:
+            torch.Tensor: Coefficient values.
+        """
+        if self.distribution == 'normal':
+            return self.mean + self.std * xi
+        elif self.distribution == 'lognormal':
+            return torch.exp(self._log_mu + self._log_sigma * xi)
+        elif self.distribution == 'uniform':
+            return self.low + 0.5 * (xi + 1.0) * (self.high - self.low)
+        else:
+            u = (0.5 * (xi + 1.0)).clamp(0.0, 1.0 - 1e-12)
+            return self.scale * (-torch.log1p(-u)) ** (1.0 / self.shape)
+
+    def __repr__(self) -> str:
+        return f"ParameterDistribution({self.distribution})"
+
+
+def _config_value(entry: Any) -> Any:
+    """Read a value from a config entry that is either a plain value or a parameter dict."""
+    if isinstance(entry, dict):
+        return entry.get('value', entry.get('default'))
+    return entry
+
+
+def distributions_from_config(nominal_values: Dict[str, float],
+                              uncertainty_config: Optional[Dict[str, Any]] = None) -> Dict[str, ParameterDistribution]:
+    """Build coefficient distributions from the uncertainty parameter config.
+
+    Uses 'uncertainty_distribution' for the family and 'coefficient_of_variation'
+    (falling back to 'parameter_uncertainty') for the relative spread around
+    each nominal value. Entries may be plain values or parameter dicts with a
+    'default' as in ``UNCERTAINTY_PARAMETERS_DICT``.
+
+    Args:
+        nominal_values (Dict[str, float]): Coefficient name to nominal value.
+        uncertainty_config (Dict[str, Any], optional): Uncertainty parameters.
+
+    Returns:
+        Dict[str, ParameterDistribution]: Distribution per coefficient.
+    """
+    config = uncertainty_config or {}
+    family = str(_config_value(config.get('uncertainty_distribution', 'normal'))).lower()
+    cv = _config_value(config.get('coefficient_of_variation', config.get('parameter_uncertainty', 0.1)))
+
+    distributions = {}
+    for name, value in nominal_values.items():
+        spread = abs(value) * cv
+        if family == 'normal':
+            distributions[name] = ParameterDistribution('normal', mean=value, std=spread)
+        elif family == 'lognormal':
+            distributions[name] = ParameterDistribution('lognormal', mean=value, std=spread)
+        elif family == 'uniform':
+            # Same standard deviation as the normal case
+            half_width = math.sqrt(3.0) * spread
+            distributions[name] = ParameterDistribution('uniform', low=value - half_width, high=value + half_width)
+        elif family == 'weibull':
+            # Shape from the coefficient of variation (approximation k ~ cv^-1.086), scale from the mean
+            shape = max(cv, 1e-3) ** -1.086
+            scale = value / math.gamma(1.0 + 1.0 / shape)
+            distributions[name] = ParameterDistribution('weibull', shape=shape, scale=scale)
+        else:
+            raise ValueError(f"Unsupported distribution: {family}")
+
+    return distributions
+
+
+def _orthonormal_polynomials(xi: torch.Tensor, degree: int, family: str) -> torch.Tensor:
+    """Evaluate orthonormal polynomials up to a degree.
+
+    Args:
+        xi (torch.Tensor): Germ samples of shape (n,).
+        degree (int): Maximum degree.
+        family (str): 'hermite' (standard normal) or 'legendre' (uniform on [-1, 1]).
+
+    Returns:
+        torch.Tensor: Values of shape (n, degree + 1).
+    """
+    values = [torch.ones_like(xi)]
+    if degree >= 1:
+        values.append(xi)
+    for n in range(1, degree):
+        if family == 'hermite':
+            values.append(xi * values[n] - n * values[n - 1])
+        else:
+            values.append(((2 * n + 1) * xi * values[n] - n * values[n - 1]) / (n + 1))
+    values = torch.stack(values, dim=1)
+
+    orders = torch.arange(degree + 1, dtype=xi.dtype, device=xi.device)
+    if family == 'hermite':
+        norms = torch.exp(0.5 * torch.lgamma(orders + 1.0))
+    else:
+        norms = 1.0 / torch.sqrt(2.0 * orders + 1.0)
+    return values / norms
+
+
+class PolynomialChaosExpansion:
+    """Polynomial-chaos surrogate of a PINN prediction field.
+
+    Holds one coefficient vector per prediction point over a shared sparse
+    multi-index basis. Mean, variance and Sobol indices are read directly off
+    the coefficients; new coefficient values are evaluated with one small
+    matrix product.
+    """
+
+    def __init__(self, distributions: Dict[str, ParameterDistribution],
+                 multi_indices: torch.Tensor, coefficients: torch.Tensor,
+                 loo_error: Optional[float] = None):
+        """Initialize the expansion.
+
+        Args:
+            distributions (Dict[str, ParameterDistribution]): Coefficient distributions.
+            multi_indices (torch.Tensor): Basis multi-indices of shape (n_basis, n_parameters).
+            coefficients (torch.Tensor): Expansion coefficients of shape (n_basis, n_points).
+            loo_error (float, optional): Relative leave-one-out error of the fit.
+        """
+        self.distributions = distributions
+        self.parameter_names = list(distributions.keys())
+        self.multi_indices = multi_indices
+        self.coefficients = coefficients
+        self.loo_error = loo_error
+
+    def basis(self, xi: torch.Tensor) -> torch.Tensor:
+        """Evaluate the basis at germ samples.
+
+        Args:
+            xi (torch.Tensor): Germ samples of shape (n, n_parameters).
+
+        Returns:
+            torch.Tensor: Basis matrix of shape (n, n_basis).
+        """
+        return pce_basis(xi, self.multi_indices, [d.germ for d in self.distributions.values()])
+
+    def mean(self) -> torch.Tensor:
+        """Mean of the prediction field.
+
+        Returns:
+            torch.Tensor: Mean of shape (n_points,).
+        """
+        constant = (self.multi_indices.sum(dim=1) == 0)
+        return self.coefficients[constant].sum(dim=0)
+
+    def variance(self) -> torch.Tensor:
+        """Variance of the prediction field.
+
+        Returns:
+            torch.Tensor: Variance of shape (n_points,).
+        """
+        nonconstant = (self.multi_indices.sum(dim=1) > 0)
+        return (self.coefficients[nonconstant] ** 2).sum(dim=0)
+
+    def sobol_indices(self) -> Dict[str, Dict[str, torch.Tensor]]:
+        """First-order and total Sobol sensitivity indices per coefficient.
+
+        Returns:
+            Dict[str, Dict[str, torch.Tensor]]: 'first_order' and 'total' indices per point.
+        """
+        variance = self.variance().clamp_min(1e-30)
+        squared = self.coefficients ** 2
+        active = self.multi_indices > 0
+        first_order, total = {}, {}
+        for i, name in enumerate(self.parameter_names):
+            only_i = active[:, i] & (active.sum(dim=1) == 1)
+            first_order[name] = squared[only_i].sum(dim=0) / variance
+            total[name] = squared[active[:, i]].sum(dim=0) / variance
+        return {'first_order': first_order, 'total': total}
+
+    def predict(self, theta: Union[torch.Tensor, Dict[str, float]]) -> torch.Tensor:
+        """Evaluate the surrogate for given coefficient values.
+
+        Args:
+            theta (Union[torch.Tensor, Dict[str, float]]): Values of shape (n, n_parameters)
+                or a dict of single values.
+
+        Returns:
+            torch.Tensor: Predictions of shape (n, n_points).
+        """
+        if isinstance(theta, dict):
+            theta = torch.tensor([[theta[name] for name in self.parameter_names]],
+                                 dtype=self.coefficients.dtype)
+        theta = theta.to(self.coefficients)
+        xi = torch.stack([_germ_from_value(d, theta[:, i]) for i, d in enumerate(self.distributions.values())], dim=1)
+        return self.basis(xi) @ self.coefficients
+
+    def predict_samples(self, xi: torch.Tensor) -> torch.Tensor:
+        """Evaluate the surrogate at germ samples.
+
+        Args:
+            xi (torch.Tensor): Germ samples of shape (n, n_parameters).
+
+        Returns:
+            torch.Tensor: Predictions of shape (n, n_points).
+        """
+        return self.basis(xi.to(self.coefficients)) @ self.coefficients
+
+
+def _germ_from_value(distribution: ParameterDistribution, value: torch.Tensor) -> torch.Tensor:
+    """Invert ParameterDistribution.from_germ."""
+    if distribution.distribution == 'normal':
+        return (value - distribution.mean) / distribution.std
+    elif distribution.distribution == 'lognormal':
+        return (torch.log(value) - distribution._log_mu) / distribution._log_sigma
+    elif distribution.distribution == 'uniform':
+        return 2.0 * (value - distribution.low) / (distribution.high - distribution.low) - 1.0
+    else:
+        u = -torch.expm1(-(value / distribution.scale) ** distribution.shape)
+        return 2.0 * u - 1.0
+
+
+def pce_basis(xi: torch.Tensor, multi_indices: torch.Tensor, germs: Sequence[str]) -> torch.Tensor:
+    """Evaluate a tensor-product orthonormal basis.
+
+    Args:
+        xi (torch.Tensor): Germ samples of shape (n, n_parameters).
+        multi_indices (torch.Tensor): Multi-indices of shape (n_basis, n_parameters).
+        germs (Sequence[str]): Germ family per parameter.
+
+    Returns:
+        torch.Tensor: Basis matrix of shape (n, n_basis).
+    """
+    degree = int(multi_indices.max().item()) if multi_indices.numel() else 0
+    basis = torch.ones(xi.shape[0], multi_indices.shape[0], dtype=xi.dtype, device=xi.device)
+    for i, germ in enumerate(germs):
+        univariate = _orthonormal_polynomials(xi[:, i], degree, germ)
+        basis = basis * univariate[:, multi_indices[:, i].to(xi.device)]
+    return basis
+
+
+def hyperbolic_multi_indices(n_parameters: int, degree: int, q_norm: float = 0.75) -> torch.Tensor:
+    """Multi-indices of a hyperbolically truncated total-degree basis.
+
+    Keeps indices with (sum alpha_i^q)^(1/q) <= degree; q < 1 drops most
+    high-order interaction terms, which gives a sparse basis.
+
+    Args:
+        n_parameters (int): Number of coefficients.
+        degree (int): Maximum total degree.
+        q_norm (float): Truncation norm in (0, 1].
+
+    Returns:
+        torch.Tensor: Multi-indices of shape (n_basis, n_parameters), constant term first.
+    """
+    indices = [alpha for alpha in itertools.product(range(degree + 1), repeat=n_parameters)
+               if sum(a ** q_norm for a in alpha) ** (1.0 / q_norm) <= degree + 1e-9]
+    indices.sort(key=lambda alpha: (sum(alpha), alpha[::-1]))
+    return torch.tensor(indices, dtype=torch.long)
+
+
+class ParameterUncertaintyPropagator:
+    """Propagate coefficient uncertainty through a parametric PINN.
+
+    The model must take inputs ``[coordinates..., coefficients...]`` (e.g. a
+    ``ParametricPINN``). Each Monte Carlo sample is a forward pass: samples
+    are evaluated in large batches of (sample, point) rows, and statistics are
+    accumulated in a streaming fashion so memory does not grow with the
+    number of samples.
+    """
+
+    def __init__(self, model: nn.Module, distributions: Dict[str, ParameterDistribution],
+                 max_batch_rows: int = 2**20):
+        """Initialize the propagator.
+
+        Args:
+            model (nn.Module): Parametric PINN.
+            distributions (Dict[str, ParameterDistribution]): Distributions in the model's
+                coefficient input order.
+            max_batch_rows (int): Maximum rows per forward pass.
+        """
+        self.model = model
+        self.distributions = distributions
+        self.parameter_names = list(distributions.keys())
+        self.max_batch_rows = max_batch_rows
+        self.logger = get_general_logger("propagation")
+
+        model_names = getattr(model, 'parameter_names', None)
+        if model_names is not None and list(model_names) != self.parameter_names:
+            raise ValueError(f"Distributions {self.parameter_names} do not match model coefficients {model_names}")
+
+    def sample(self, n_samples: int, method: str = "sobol",
+               seed: Optional[int] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Draw coefficient samples.
+
+        Args:
+            n_samples (int): Number of samples.
+            method (str): 'sobol' (scrambled Sobol sequence), 'lhs' (Latin hypercube) or 'random'.
+            seed (int, optional): Random seed.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Coefficient values and germ samples,
+                both of shape (n_samples, n_parameters).
+        """
+        n_parameters = len(self.parameter_names)
+        generator = torch.Generator()
+        if seed is not None:
+            generator.manual_seed(seed)
+        else:
+            generator.seed()
+
+        if method.lower() == "sobol":
+            engine = torch.quasirandom.SobolEngine(n_parameters, scramble=True,
+                                                   seed=int(torch.randint(2**31 - 1, (1,), generator=generator)))
+            u = engine.draw(n_samples, dtype=torch.float64)
+        elif method.lower() == "lhs":
+            strata = torch.stack([torch.randperm(n_samples, generator=generator) for _ in range(n_parameters)], dim=1)
+            u = (strata + torch.rand(n_samples, n_parameters, generator=generator, dtype=torch.float64)) / n_samples
+        elif method.lower() == "random":
+            u = torch.rand(n_samples, n_parameters, generator=generator, dtype=torch.float64)
+        else:
+            raise ValueError(f"Unsupported sampling method: {method}")
+
+        xi = torch.stack([d.germ_from_uniform(u[:, i]) for i, d in enumerate(self.distributions.values())], dim=1)
+        theta = torch.stack([d.from_germ(xi[:, i]) for i, d in enumerate(self.distributions.values())], dim=1)
+        return theta, xi
+
+    def evaluate(self, coordinates: torch.Tensor, theta: torch.Tensor) -> torch.Tensor:
+        """Evaluate the model for every (sample, point) pair.
+
+        Args:
+            coordinates (torch.Tensor): Points of shape (n_points, coordinate_dim).
+            theta (torch.Tensor): Coefficients of shape (n_samples, n_parameters).
+
+        Returns:
+            torch.Tensor: Predictions of shape (n_samples, n_points).
+        """
+        outputs = []
+        for batch in self._sample_batches(theta, coordinates.shape[0]):
+            outputs.append(self._forward(coordinates, batch))
+        return torch.cat(outputs, dim=0)
+
+    def _sample_batches(self, theta: torch.Tensor, n_points: int):
+        """Split samples into chunks that keep forward passes under max_batch_rows."""
+        chunk = max(1, self.max_batch_rows // max(n_points, 1))
+        for start in range(0, theta.shape[0], chunk):
+            yield theta[start:start + chunk]
+
+    def _forward(self, coordinates: torch.Tensor, theta: torch.Tensor) -> torch.Tensor:
+        """One batched forward pass over all (sample, point) rows."""
+        n_samples, n_points = theta.shape[0], coordinates.shape[0]
+        theta = theta.to(coordinates)
+        inputs = torch.cat([
+            coordinates.unsqueeze(0).expand(n_samples, -1, -1),
+            theta.unsqueeze(1).expand(-1, n_points, -1)
+        ], dim=2).reshape(n_samples * n_points, -1)
+        with torch.no_grad():
+            outputs = self.model(inputs)
+        return outputs[:, 0].reshape(n_samples, n_points)
+
+    def propagate(self, x: torch.Tensor, t: torch.Tensor, n_samples: int = 1000,
+                  method: str = "sobol", quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+                  num_bins: int = 256, seed: Optional[int] = None,
+                  pilot_samples: int = 64) -> Dict[str, Any]:
+        """Monte Carlo propagation with streaming moments and quantiles.
+
+        Moments are merged batch by batch (Chan's parallel update in float64).
+        Quantiles come from a per-point histogram whose range is set from a
+        pilot of the first ``pilot_samples`` draws (however they are batched)
+        with a margin; later values outside it fall into the edge bins, and
+        the exact per-point extremes are tracked separately.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates of shape (n_points, 1).
+            t (torch.Tensor): Temporal coordinates of shape (n_points, 1).
+            n_samples (int): Number of coefficient samples.
+            method (str): Sampling method ('sobol', 'lhs', 'random').
+            quantiles (Sequence[float]): Quantile levels to estimate (empty to skip).
+            num_bins (int): Histogram bins per point for the quantile estimates.
+            seed (int, optional): Random seed.
+            pilot_samples (int): Draws used to set the histogram range (at least 2).
+
+        Returns:
+            Dict[str, Any]: 'mean', 'variance', 'std', 'min', 'max' of shape (n_points,),
+                'quantiles' keyed by level, and 'n_samples'.
+        """
+        if pilot_samples < 2:
+            raise ValueError("At least 2 pilot samples are needed to set the histogram range")
+
+        coordinates = torch.cat([x, t], dim=1)
+        n_points = coordinates.shape[0]
+        theta, _ = self.sample(n_samples, method, seed)
+
+        count = 0
+        mean = torch.zeros(n_points, dtype=torch.float64, device=coordinates.device)
+        m2 = torch.zeros_like(mean)
+        minimum = torch.full_like(mean, float('inf'))
+        maximum = torch.full_like(mean, float('-inf'))
+        histogram = None
+        point_offsets = torch.arange(n_points, device=coordinates.device) * num_bins
+
+        # The pilot draws are kept until the histogram range is fixed
+        n_pilot = min(pilot_samples, theta.shape[0]) if quantiles else 0
+        pilot = [self._forward(coordinates, batch).double()
+                 for batch in self._sample_batches(theta[:n_pilot], n_points)]
+        if pilot:
+            pilot_values = torch.cat(pilot, dim=0)
+            pilot_min, pilot_max = pilot_values.min(dim=0).values, pilot_values.max(dim=0).values
+            margin = 0.5 * (pilot_max - pilot_min) + 1e-6 * (pilot_max.abs() + pilot_min.abs()) + 1e-12
+            low, high = pilot_min - margin, pilot_max + margin
+            width = (high - low) / num_bins
+            histogram = torch.zeros(n_points * num_bins, dtype=torch.float64, device=coordinates.device)
+
+        remaining = (self._forward(coordinates, batch).double()
+                     for batch in self._sample_batches(theta[n_pilot:], n_points))
+        for values in itertools.chain(pilot, remaining):
+            n_batch = values.shape[0]
+
+            batch_mean = values.mean(dim=0)
+            batch_m2 = ((values - batch_mean) ** 2).sum(dim=0)
+            delta = batch_mean - mean
+            total = count + n_batch
+            mean = mean + delta * n_batch / total
+            m2 = m2 + batch_m2 + delta ** 2 * count * n_batch / total
+            count = total
+
+            minimum = torch.minimum(minimum, values.min(dim=0).values)
+            maximum = torch.maximum(maximum, values.max(dim=0).values)
+
+            if histogram is not None:
+                bins = ((values - low) / width).long().clamp(0, num_bins - 1)
+                histogram.scatter_add_(0, (bins + point_offsets).reshape(-1),
+                                       torch.ones(bins.numel(), dtype=torch.float64, device=coordinates.device))
+
+        variance = m2 / max(count - 1, 1)
+        results = {
+            'mean': mean.float(),
+            'variance': variance.float(),
+            'std': variance.sqrt().float(),
+            'min': minimum.float(),
+            'max': maximum.float(),
+            'n_samples': count,
+            'quantiles': {}
+        }
+
+        if quantiles:
+            cdf = histogram.reshape(n_points, num_bins).cumsum(dim=1) / count
+            for level in quantiles:
+                # First bin whose cumulative count reaches the level, interpolated inside the bin
+                index = torch.searchsorted(cdf, torch.full((n_points, 1), level, dtype=cdf.dtype,
+                                                           device=cdf.device)).clamp(max=num_bins - 1)
+                upper_cdf = cdf.gather(1, index).squeeze(1)
+                lower_cdf = torch.where(index.squeeze(1) > 0,
+                                        cdf.gather(1, (index - 1).clamp(min=0)).squeeze(1),
+                                        torch.zeros_like(upper_cdf))
+                fraction = ((level - lower_cdf) / (upper_cdf - lower_cdf).clamp_min(1e-12)).clamp(0.0, 1.0)
+                estimate = low + (index.squeeze(1).double() + fraction) * width
+                results['quantiles'][level] = torch.minimum(torch.maximum(estimate, minimum), maximum).float()
+
+        self.logger.info(f"Propagated {count} coefficient samples ({method}) over {n_points} points")
+        return results
+
+    def fit_pce(self, x: torch.Tensor, t: torch.Tensor, degree: int = 3,
+                n_samples: Optional[int] = None, method: str = "sobol",
+                q_norm: float = 0.75, threshold: float = 1e-4,
+                seed: Optional[int] = None) -> PolynomialChaosExpansion:
+        """Fit a sparse polynomial-chaos expansion of the prediction field.
+
+        The basis is a hyperbolically truncated total-degree basis; after a
+        least-squares fit, terms whose coefficients are below ``threshold``
+        times the largest non-constant coefficient at every point are dropped
+        and the remaining basis is refitted.
+
+        Args:
+            x (torch.Tensor): Spatial coordinates of shape (n_points, 1).
+            t (torch.Tensor): Temporal coordinates of shape (n_points, 1).
+            degree (int): Maximum polynomial degree.
+            n_samples (int, optional): Number of model evaluations (default: 3x the basis size).
+            method (str): Sampling method ('sobol', 'lhs', 'random').
+            q_norm (float): Hyperbolic truncation norm in (0, 1].
+            threshold (float): Relative coefficient threshold for sparsification.
+            seed (int, optional): Random seed.
+
+        Returns:
+            PolynomialChaosExpansion: Fitted surrogate.
+        """
+        coordinates = torch.cat([x, t], dim=1)
+        germs = [d.germ for d in self.distributions.values()]
+        multi_indices = hyperbolic_multi_indices(len(self.parameter_names), degree, q_norm)
+        if n_samples is None:
+            n_samples = 3 * multi_indices.shape[0]
+
+        theta, xi = self.sample(n_samples, method, seed)
+        values = self.evaluate(coordinates, theta).double()
+        xi = xi.to(values)
+
+        def solve(indices):
+            basis = pce_basis(xi, indices, germs)
+            q, r = torch.linalg.qr(basis)
+            coefficients = torch.linalg.solve_triangular(r, q.T @ values, upper=True)
+            # Leave-one-out residuals from the hat-matrix diagonal
+            leverage = (q ** 2).sum(dim=1, keepdim=True).clamp(max=1.0 - 1e-10)
+            residuals = (values - basis @ coefficients) / (1.0 - leverage)
+            loo = (residuals ** 2).mean() / values.var(dim=0).mean().clamp_min(1e-30)
+            return coefficients, loo.item()
+
+        coefficients, loo_error = solve(multi_indices)
+
+        nonconstant = multi_indices.sum(dim=1) > 0
+        if threshold > 0 and nonconstant.any():
+            magnitude = coefficients.abs()
+            reference = magnitude[nonconstant].max(dim=0).values.clamp_min(1e-30)
+            keep = (magnitude / reference >= threshold).any(dim=1) | ~nonconstant
+            if not keep.all():
+                multi_indices = multi_indices[keep]
+                coefficients, loo_error = solve(multi_indices)
+
+        self.logger.info(
+            f"Polynomial chaos fitted: degree {degree}, {multi_indices.shape[0]} basis terms, "
+            f"{n_samples} samples, relative LOO error {loo_error:.3e}"
+        )
+        return PolynomialChaosExpansion(self.distributions, multi_indices,
+                                        coefficients.to(coordinates.dtype), loo_error)
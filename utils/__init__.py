@@ -12,7 +12,19 @@ from .loggers import (
 )
 from .models import (
     MLP, 
+    StackedMLP,
     FourierFeatureMLP, 
+    HashGridEncoding,
+    HashGridPINN,
+    ParametricPINN,
+    HardConstraintPINN,
+    PeriodicPINN,
+    TimeMarchingPINN,
+    DomainDecompositionPINN,
+    SeparablePINN,
+    CachedTrunkPINN,
+    StackedEnsemble,
+    init_linear_weights,
     create_pinn_model, 
     get_model_summary
 )
@@ -20,11 +32,50 @@ from .physics import (
     PhysicsFunctions, 
     BoundaryConditions, 
     InitialConditions,
+    PeriodicEmbedding,
     get_physics_function, 
+    get_coefficient_ranges,
+    get_pointwise_residual,
     get_boundary_condition, 
     get_initial_condition
 )
 from .data_generator import DataGenerator
+from .trainer import (
+    PINNTrainer,
+    LossTerm,
+    get_loss_term
+)
+from .model_store import (
+    ModelStore,
+    architecture_key,
+    freeze_layers
+)
+from .least_squares import (
+    LeastSquaresSolver,
+    get_linear_operator
+)
+from .levenberg_marquardt import LevenbergMarquardt
+from .export import export_numpy
+from .adapters import (
+    LoRALinear,
+    AdapterBank,
+    add_lora_adapters,
+    adapter_state_dict,
+    load_adapter_state
+)
+from .domain_decomposition import DomainDecompositionTrainer
+from .loss_balancing import (
+    LossBalancer,
+    LearningRateAnnealing,
+    GradNorm,
+    NTKWeighting,
+    get_loss_balancer
+)
+from .inference import (
+    LastLayerLaplace,
+    mc_dropout_predict,
+    optimize_for_inference
+)
 
 __all__ = [
     # Loggers
@@ -35,7 +86,19 @@ __all__ = [
     
     # Models
     'MLP',
+    'StackedMLP',
     'FourierFeatureMLP',
+    'HashGridEncoding',
+    'HashGridPINN',
+    'ParametricPINN',
+    'HardConstraintPINN',
+    'PeriodicPINN',
+    'TimeMarchingPINN',
+    'DomainDecompositionPINN',
+    'SeparablePINN',
+    'CachedTrunkPINN',
+    'StackedEnsemble',
+    'init_linear_weights',
     'create_pinn_model',
     'get_model_summary',
     
@@ -43,10 +106,55 @@ __all__ = [
     'PhysicsFunctions',
     'BoundaryConditions',
     'InitialConditions',
+    'PeriodicEmbedding',
     'get_physics_function',
+    'get_coefficient_ranges',
+    'get_pointwise_residual',
     'get_boundary_condition',
     'get_initial_condition',
     
     # Data
-    'DataGenerator'
+    'DataGenerator',
+    
+    # Training
+    'PINNTrainer',
+    'LossTerm',
+    'get_loss_term',
+    
+    # Model store
+    'ModelStore',
+    'architecture_key',
+    'freeze_layers',
+    
+    # Least squares
+    'LeastSquaresSolver',
+    'get_linear_operator',
+    
+    # Second-order optimization
+    'LevenbergMarquardt',
+    
+    # Export
+    'export_numpy',
+    
+    # Adapters
+    'LoRALinear',
+    'AdapterBank',
+    'add_lora_adapters',
+    'adapter_state_dict',
+    'load_adapter_state',
+    
+    # Domain decomposition
+    'DomainDecompositionTrainer',
+    
+    # Loss balancing
+    'LossBalancer',
+    'LearningRateAnnealing',
+    'GradNorm',
+    'NTKWeighting',
+    'get_loss_balancer',
+    
+    # Inference
+    'LastLayerLaplace',
+    'mc_dropout_predict',
+    'optimize_for_inference'
 ]
@@ -0,0 +1,274 @@
+"""
+Shared Adapters Module for PINN Research Platform.
+
+This module adds low-rank (LoRA) adapters to the linear layers of a trained
+PINN, so a variant for another coefficient value is the shared base model
+plus a few KB of adapter weights. Only the adapters are trained, and a
+resident base model switches variants by copying adapter weights in place.
+"""
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+import json
+import math
+import threading
+
+from utils.loggers import get_general_logger
+
+
+class LoRALinear(nn.Linear):
+    """Linear layer with a low-rank adapter.
+
+    The effective weight is W + (alpha / rank) B A with A of shape
+    (rank, in_features) and B of shape (out_features, rank). B starts at zero,
+    so a fresh adapter leaves the layer unchanged. The adapted weight is
+    formed once per call (a rank-r product, cheap next to the batch GEMM), so
+    the layer costs the same as a plain nn.Linear. The base weight and bias
+    keep their names, so base state dicts load unchanged.
+    """
+
+    def __init__(self, in_features: int, out_features: int, rank: int = 4,
+                 alpha: Optional[float] = None, bias: bool = True,
+                 device: Optional[torch.device] = None, dtype: Optional[torch.dtype] = None):
+        """Initialize the adapted linear layer.
+
+        Args:
+            in_features (int): Input dimension.
+            out_features (int): Output dimension.
+            rank (int): Adapter rank.
+            alpha (float, optional): Adapter scale numerator (default: rank, i.e. scale 1).
+            bias (bool): Whether the base layer has a bias.
+            device (torch.device, optional): Parameter device.
+            dtype (torch.dtype, optional): Parameter dtype.
+        """
+        super(LoRALinear, self).__init__(in_features, out_features, bias, device=device, dtype=dtype)
+
+        self.rank = rank
+        self.scaling = (alpha if alpha is not None else rank) / rank
+        self.lora_A = nn.Parameter(torch.empty(rank, in_features, device=device, dtype=dtype))
+        self.lora_B = nn.Parameter(torch.empty(out_features, rank, device=device, dtype=dtype))
+        self.reset_adapter()
+
+    @classmethod
+    def from_linear(cls, layer: nn.Linear, rank: int = 4, alpha: Optional[float] = None) -> 'LoRALinear':
+        """Wrap an existing linear layer, sharing its weight and bias.
+
+        Args:
+            layer (nn.Linear): Base layer.
+            rank (int): Adapter rank.
+            alpha (float, optional): Adapter scale numerator.
+
+        Returns:
+            LoRALinear: Adapted layer.
+        """
+        adapted = cls(layer.in_features, layer.out_features, rank, alpha, layer.bias is not None,
+                      device=layer.weight.device, dtype=layer.weight.dtype)
+        adapted.weight = layer.weight
+        adapted.bias = layer.bias
+        return adapted
+
+    def reset_adapter(self) -> None:
+        """Reinitialize the adapter to the identity update (B = 0)."""
+        nn.init.kaiming_uniform_(self.lora_A, a=math.sqrt(5))
+        nn.init.zeros_(self.lora_B)
+
+    def merged_weight(self) -> torch.Tensor:
+        """Effective weight W + scaling * B A."""
+        return self.weight + self.scaling * (self.lora_B @ self.lora_A)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (..., in_features).
+
+        Returns:
+            torch.Tensor: Output tensor of shape (..., out_features).
+        """
+        return F.linear(x, self.merged_weight(), self.bias)
+
+    def extra_repr(self) -> str:
+        return f"{super(LoRALinear, self).extra_repr()}, rank={self.rank}, scaling={self.scaling}"
+
+
+def is_adapter_parameter(name: str) -> bool:
+    """Check whether a parameter or state dict key belongs to an adapter."""
+    return name.rsplit('.', 1)[-1] in ('lora_A', 'lora_B')
+
+
+def add_lora_adapters(model: nn.Module, rank: int = 4, alpha: Optional[float] = None,
+                      layers: Optional[List[str]] = None) -> List[str]:
+    """Replace linear layers by adapted layers and freeze the base model.
+
+    Afterwards only the adapter weights require gradients, so any trainer
+    that optimizes the parameters with ``requires_grad`` (e.g. PINNTrainer)
+    trains the adapters alone.
+
+    Args:
+        model (nn.Module): Trained base model (MLP, ForwardProblemsPINN, ...), modified in place.
+        rank (int): Adapter rank.
+        alpha (float, optional): Adapter scale numerator (default: rank).
+        layers (List[str], optional): Names of the linear layers to adapt (default: all).
+
+    Returns:
+        List[str]: Names of the adapted layers.
+    """
+    targets = [(name, module) for name, module in model.named_modules()
+               if isinstance(module, nn.Linear) and not isinstance(module, LoRALinear)
+               and (layers is None or name in layers)]
+    if not targets:
+        raise ValueError("No nn.Linear layers to adapt")
+
+    for name, module in targets:
+        parent_name, _, child_name = name.rpartition('.')
+        parent = model.get_submodule(parent_name) if parent_name else model
+        setattr(parent, child_name, LoRALinear.from_linear(module, rank, alpha))
+
+    for name, param in model.named_parameters():
+        param.requires_grad_(is_adapter_parameter(name))
+
+    adapted = [name for name, _ in targets]
+    get_general_logger("adapters").info(
+        f"Added rank-{rank} adapters to {len(adapted)} layers "
+        f"({sum(p.numel() for p in adapter_parameters(model))} trainable parameters)"
+    )
+    return adapted
+
+
+def adapter_parameters(model: nn.Module) -> List[nn.Parameter]:
+    """Get the adapter parameters of a model."""
+    return [param for name, param in model.named_parameters() if is_adapter_parameter(name)]
+
+
+def adapter_state_dict(model: nn.Module) -> Dict[str, torch.Tensor]:
+    """Copy the adapter weights of a model.
+
+    Args:
+        model (nn.Module): Model with adapters.
+
+    Returns:
+        Dict[str, torch.Tensor]: Adapter weights keyed like the model's state dict.
+    """
+    return {name: tensor.detach().clone() for name, tensor in model.state_dict().items()
+            if is_adapter_parameter(name)}
+
+
+def load_adapter_state(model: nn.Module, state: Dict[str, torch.Tensor]) -> None:
+    """Copy adapter weights into a model in place (no reallocation).
+
+    Args:
+        model (nn.Module): Model with adapters.
+        state (Dict[str, torch.Tensor]): Adapter weights from ``adapter_state_dict``.
+    """
+    params = {name: param for name, param in model.named_parameters() if is_adapter_parameter(name)}
+    if set(params) != set(state):
+        raise ValueError(f"Adapter keys do not match the model: missing {sorted(set(params) - set(state))}, "
+                         f"unexpected {sorted(set(state) - set(params))}")
+
+    with torch.no_grad():
+        for name, param in params.items():
+            param.copy_(state[name])
+
+
+def variant_key(coefficients: Dict[str, float]) -> str:
+    """Canonical key of a coefficient vector, e.g. '{"nu": 0.01}'."""
+    return json.dumps({name: float(value) for name, value in sorted(coefficients.items())})
+
+
+class AdapterBank:
+    """Adapters of one resident base model, keyed by equation coefficients.
+
+    The base model stays loaded; :meth:`activate` switches variants by
+    copying a few KB of adapter weights into it. Switching and prediction
+    hold a lock, so concurrent requests for different variants do not mix.
+    """
+
+    def __init__(self, model: nn.Module):
+        """Initialize the adapter bank.
+
+        Args:
+            model (nn.Module): Base model with adapters (see ``add_lora_adapters``).
+        """
+        if not adapter_parameters(model):
+            raise ValueError("Model has no adapters; call add_lora_adapters first")
+
+        self.model = model
+        self.variants = {}
+        self.active = None
+        self.logger = get_general_logger("adapters")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.variants)
+
+    def __contains__(self, coefficients: Dict[str, float]) -> bool:
+        return variant_key(coefficients) in self.variants
+
+    def add(self, coefficients: Dict[str, float], state: Optional[Dict[str, torch.Tensor]] = None) -> None:
+        """Store the adapters of a variant.
+
+        Args:
+            coefficients (Dict[str, float]): Equation coefficients of the variant.
+            state (Dict[str, torch.Tensor], optional): Adapter weights (default: the model's current ones).
+        """
+        state = adapter_state_dict(self.model) if state is None else state
+        self.variants[variant_key(coefficients)] = {'coefficients': dict(coefficients), 'adapters': state}
+
+    def activate(self, coefficients: Dict[str, float]) -> None:
+        """Switch the resident model to a stored variant.
+
+        Args:
+            coefficients (Dict[str, float]): Equation coefficients of the variant.
+        """
+        key = variant_key(coefficients)
+        if key not in self.variants:
+            raise ValueError(f"No adapters stored for {coefficients}")
+        with self._lock:
+            if key != self.active:
+                load_adapter_state(self.model, self.variants[key]['adapters'])
+                self.active = key
+
+    def predict(self, coefficients: Dict[str, float], inputs: torch.Tensor) -> torch.Tensor:
+        """Predict with one variant.
+
+        Args:
+            coefficients (Dict[str, float]): Equation coefficients of the variant.
+            inputs (torch.Tensor): Inputs of shape (n, input_dim).
+
+        Returns:
+            torch.Tensor: Predictions of shape (n, output_dim).
+        """
+        key = variant_key(coefficients)
+        if key not in self.variants:
+            raise ValueError(f"No adapters stored for {coefficients}")
+        with self._lock:
+            if key != self.active:
+                load_adapter_state(self.model, self.variants[key]['adapters'])
+                self.active = key
+            with torch.no_grad():
+                return self.model(inputs)
+
+    def save(self, path: str) -> None:
+        """Save all variants' adapters (not the base model) to one file.
+
+        Args:
+            path (str): Output file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        torch.save(list(self.variants.values()), path)
+        self.logger.info(f"Saved adapters of {len(self.variants)} variants to {path}")
+
+    def load(self, path: str) -> None:
+        """Add the variants saved in a file.
+
+        Args:
+            path (str): File written by :meth:`save`.
+        """
+        device = next(self.model.parameters()).device
+        for variant in torch.load(path, map_location=device):
+            self.add(variant['coefficients'], variant['adapters'])
+        self.logger.info(f"Loaded adapters from {path} ({len(self.variants)} variants)")
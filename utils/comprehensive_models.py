@@ -58,6 +58,9 @@ class ComprehensiveTrainingRequest(BaseModel):
     # Time Domain Parameters
     time_duration: float = Field(default=1.0, ge=0.1, le=10.0, description="Time duration")
     time_points: int = Field(default=100, ge=20, le=500, description="Time sampling points")
+    temporal_training: str = Field(default="none", description="Temporal training mode ('none', 'causal', 'time_marching')")
+    causal_epsilon: float = Field(default=1.0, ge=0.0, le=100.0, description="Causality parameter for causal training")
+    time_windows: int = Field(default=4, ge=1, le=64, description="Time windows for causal training or time marching")
     
     # Boundary and Initial Conditions
     initial_condition: InitialConditionType = Field(default=InitialConditionType.SINUSOIDAL, description="Initial condition type")
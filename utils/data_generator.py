@@ -9,11 +9,18 @@ import torch
 import numpy as np
 from typing import Dict, Tuple, Optional, List, Any
 from pathlib import Path
+import functools
 import json
 
 from utils.loggers import get_general_logger
 from utils.physics import get_physics_function, get_initial_condition, get_boundary_condition
-from utils.data_loader import PINNDataLoader, load_training_data
+
+try:
+    from utils.data_loader import PINNDataLoader, load_training_data
+except ImportError:
+    # Pre-generated data support is optional; data is then generated on the fly
+    PINNDataLoader = None
+    load_training_data = None
 
 
 class DataGenerator:
@@ -29,7 +36,10 @@ class DataGenerator:
         self.logger = get_general_logger(logger_name)
         self.use_pre_generated = use_pre_generated
         
-        if self.use_pre_generated:
+        if self.use_pre_generated and PINNDataLoader is None:
+            self.logger.warning("Data loader not available. Falling back to on-the-fly generation.")
+            self.use_pre_generated = False
+        elif self.use_pre_generated:
             try:
                 self.data_loader = PINNDataLoader()
                 self.logger.info("Data Generator initialized with pre-generated data support")
@@ -74,6 +84,34 @@ class DataGenerator:
         self.logger.info(f"Generated grid data: {nx}x{nt} points")
         return data
 
+    def generate_grid_axes(self, x_range: Tuple[float, float], t_range: Tuple[float, float],
+                           nx: int = 256, nt: int = 256, random: bool = True) -> Dict[str, torch.Tensor]:
+        """Generate the axes of a tensor-product collocation grid for separable models.
+
+        The grid has nx * nt points but only nx + nt coordinates, used by the
+        'grid_physics' loss term.
+
+        Args:
+            x_range (Tuple[float, float]): Spatial domain range.
+            t_range (Tuple[float, float]): Temporal domain range.
+            nx (int): Number of spatial grid lines.
+            nt (int): Number of temporal grid lines.
+            random (bool): Draw the coordinates uniformly instead of evenly spaced.
+
+        Returns:
+            Dict[str, torch.Tensor]: 'x_axis' (nx, 1) and 't_axis' (nt, 1).
+        """
+        axes = {}
+        for key, (low, high), n in (('x_axis', x_range, nx), ('t_axis', t_range, nt)):
+            if random:
+                coordinates = torch.rand(n, 1) * (high - low) + low
+            else:
+                coordinates = torch.linspace(low, high, n).reshape(-1, 1)
+            axes[key] = coordinates
+
+        self.logger.info(f"Generated grid axes: {nx}x{nt} points")
+        return axes
+
     def load_pre_generated_data(self, purpose: str, equation: str) -> Dict[str, torch.Tensor]:
         """
         Load pre-generated training data from the data/ folder.
@@ -117,12 +155,8 @@ class DataGenerator:
             # Get physics function for the equation
             physics_fn = get_physics_function(equation)
             
-            # Create physics function with parameters from metadata
-            def physics_function(x, t, u):
-                params = data['metadata'].get('parameters', {})
-                return physics_fn(x, t, u, **params)
-            
-            training_data['physics_fn'] = physics_function
+            # Bind parameters from metadata (a partial keeps them readable for pointwise residuals)
+            training_data['physics_fn'] = functools.partial(physics_fn, **data['metadata'].get('parameters', {}))
             
             self.logger.info(f"Loaded pre-generated data for {purpose}/{equation}")
             return training_data
@@ -174,9 +208,8 @@ class DataGenerator:
         # Get physics function
         physics_fn = get_physics_function(equation)
         
-        # Create physics function with parameters
-        def physics_function(x, t, u):
-            return physics_fn(x, t, u, **kwargs)
+        # Bind parameters (a partial keeps them readable for pointwise residuals)
+        physics_function = functools.partial(physics_fn, **kwargs)
         
         training_data = {
             'x': torch.cat([x_interior, t_interior], dim=1),
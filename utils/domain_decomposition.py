@@ -0,0 +1,325 @@
+"""
+Shared Domain Decomposition Module for PINN Research Platform.
+
+This module trains a DomainDecompositionPINN with one worker process per
+subdomain. Each worker only holds the points of its subdomain and trains its
+own small network; every few steps the workers exchange state through
+shared-memory tensors: network weights for window (FBPINN) coupling, so
+neighbouring contributions in the overlaps stay current, and interface
+values, first derivatives and PDE residuals for interface (XPINN) coupling.
+"""
+
+import torch
+import torch.nn as nn
+import torch.multiprocessing as mp
+import numpy as np
+from typing import Dict, Any, List, Optional, Callable, Tuple
+import time
+
+from utils.loggers import get_purpose_logger
+from utils.models import DomainDecompositionPINN
+from utils.trainer import PINNTrainer, InterfaceLoss, POINT_GROUPS
+
+
+# Shared interface buffers and the training-data targets derived from them
+INTERFACE_STATE = ('interface_values', 'interface_derivatives', 'interface_residuals')
+INTERFACE_TARGETS = ('u_interface', 'du_interface', 'r_interface')
+
+
+def interface_points(model: DomainDecompositionPINN,
+                     points_per_interface: int = 50) -> Tuple[torch.Tensor, List[Tuple[int, int, torch.Tensor]]]:
+    """Sample points on the interfaces between adjacent core boxes.
+
+    Args:
+        model (DomainDecompositionPINN): Decomposed model.
+        points_per_interface (int): Points per shared face.
+
+    Returns:
+        Tuple[torch.Tensor, List[Tuple[int, int, torch.Tensor]]]: All interface points (M, 2) and
+        (i, j, indices) for every ordered pair of neighbours sharing a face.
+    """
+    lower, upper = model.core_lower, model.core_upper
+    points, pairs = [], []
+    offset = 0
+    for i in range(model.num_subdomains):
+        for j in range(i + 1, model.num_subdomains):
+            for axis in range(2):
+                other = 1 - axis
+                if not (torch.isclose(upper[i, axis], lower[j, axis]) or torch.isclose(upper[j, axis], lower[i, axis])):
+                    continue
+                low = torch.maximum(lower[i, other], lower[j, other])
+                high = torch.minimum(upper[i, other], upper[j, other])
+                if high <= low:
+                    continue
+                face = torch.empty(points_per_interface, 2)
+                face[:, axis] = upper[i, axis] if torch.isclose(upper[i, axis], lower[j, axis]) else lower[i, axis]
+                face[:, other] = torch.linspace(float(low), float(high), points_per_interface + 2)[1:-1]
+                index = torch.arange(offset, offset + points_per_interface)
+                points.append(face)
+                pairs.extend([(i, j, index), (j, i, index)])
+                offset += points_per_interface
+
+    if not points:
+        return torch.zeros(0, 2), []
+    return torch.cat(points), pairs
+
+
+def _flat_parameters(module: nn.Module) -> torch.Tensor:
+    """Flatten the parameters of a module."""
+    return nn.utils.parameters_to_vector(module.parameters()).detach()
+
+
+def interface_state(trainer: PINNTrainer, points: torch.Tensor, train_data: Dict[str, Any],
+                    physics_fn: Callable) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Prediction, first derivatives and PDE residual of a subdomain network on interface points.
+
+    Args:
+        trainer (PINNTrainer): Trainer of the subdomain network.
+        points (torch.Tensor): Interface points of shape (M, 2).
+        train_data (Dict[str, Any]): Training data of the subdomain (binds the physics).
+        physics_fn (Callable): Physics function.
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor, torch.Tensor]: Detached predictions, derivatives and residuals.
+    """
+    physics_fn = trainer.bind_physics(train_data, physics_fn)
+    outputs = trainer.forward_groups({'x_interface': points}, ['interface'])
+    derivatives = InterfaceLoss.derivatives(outputs)
+    residual = physics_fn(outputs['x_interface'], outputs['t_interface'], outputs['interface'])
+    return outputs['interface'].detach(), derivatives.detach(), residual.detach()
+
+
+def _train_subdomain(rank: int, model: DomainDecompositionPINN, purpose: str, equation: str,
+                     loss_terms: List[Any], data: Dict[str, Any], physics_fn: Callable,
+                     settings: Dict[str, Any], shared: Dict[str, Any]) -> None:
+    """Worker: train the network of one subdomain (runs in its own process)."""
+    barrier = shared['barrier']
+    try:
+        torch.set_num_threads(settings['threads_per_worker'])
+        torch.manual_seed(settings['seed'] + rank)
+
+        window = model.coupling == 'window'
+        if window:
+            # Train the full blended model with only this subdomain's network unfrozen
+            local_model = model
+            for j, network in enumerate(model.networks):
+                network.requires_grad_(j == rank)
+        else:
+            local_model = model.networks[rank]
+
+        trainer = PINNTrainer(local_model, purpose, equation, loss_terms)
+        trainer.log_interval = settings['epochs'] + 1
+        trainer.setup_optimizer(settings['learning_rate'], settings['optimizer_type'])
+
+        own_points = shared.get('own_points')
+        neighbour_points = shared.get('neighbour_points')
+        own_network = model.networks[rank]
+        epoch = 0
+        while epoch < settings['epochs']:
+            # Publish this subdomain's state, then read the neighbours'
+            shared['parameters'][rank].copy_(_flat_parameters(own_network))
+            if not window and own_points is not None:
+                state = interface_state(trainer, shared['interface_points'][own_points], data, physics_fn)
+                for key, value in zip(INTERFACE_STATE, state):
+                    shared[key][rank, own_points] = value
+            barrier.wait()
+            if window:
+                for j in settings['neighbours'][rank]:
+                    nn.utils.vector_to_parameters(shared['parameters'][j].clone(), model.networks[j].parameters())
+            elif neighbour_points is not None:
+                # Targets are the averages of both sides, as in XPINNs
+                other = (neighbour_points[:, 0], neighbour_points[:, 1])
+                for key, target in zip(INTERFACE_STATE, INTERFACE_TARGETS):
+                    data[target] = 0.5 * (shared[key][rank, own_points] + shared[key][other])
+            barrier.wait()
+
+            steps = min(settings['exchange_interval'], settings['epochs'] - epoch)
+            for _ in range(steps):
+                losses = trainer._step(data, physics_fn, settings['weights'])
+            epoch += steps
+
+        shared['parameters'][rank].copy_(_flat_parameters(own_network))
+        shared['losses'][rank] = losses['total_loss'].item()
+    except Exception:
+        barrier.abort()
+        raise
+
+
+class DomainDecompositionTrainer:
+    """Trainer running one process per subdomain of a DomainDecompositionPINN.
+
+    Workers only see the training points of their own subdomain (support box
+    for window coupling, core box for interface coupling) and synchronize
+    every ``exchange_interval`` steps; between exchanges they train
+    independently, so wall-clock time scales with the number of cores.
+    Window coupling exchanges weights every step by default: networks that
+    share an overlap correct the same error, and with stale neighbours they
+    overshoot each other.
+    """
+
+    def __init__(self, model: DomainDecompositionPINN, purpose: str, equation: str,
+                 loss_terms: Optional[List[Any]] = None, start_method: str = "spawn"):
+        """Initialize the domain-decomposition trainer.
+
+        Args:
+            model (DomainDecompositionPINN): Decomposed model.
+            purpose (str): PINN purpose.
+            equation (str): Equation type.
+            loss_terms (List[Any], optional): Loss term names (default physics, boundary, initial,
+                plus 'interface' for interface coupling).
+            start_method (str): Multiprocessing start method ('spawn', 'fork', 'forkserver').
+        """
+        if not isinstance(model, DomainDecompositionPINN):
+            raise ValueError("DomainDecompositionTrainer requires a DomainDecompositionPINN")
+
+        self.model = model
+        self.purpose = purpose
+        self.equation = equation
+        if loss_terms is None:
+            loss_terms = ['physics', 'boundary', 'initial']
+            if model.coupling == 'interface':
+                loss_terms.append('interface')
+        self.loss_terms = loss_terms
+        self.start_method = start_method
+        self.logger = get_purpose_logger(purpose, equation)
+        self.training_history = {}
+
+    def subdomain_data(self, train_data: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Select the training points of one subdomain.
+
+        Args:
+            train_data (Dict[str, Any]): Training data over the whole domain.
+            index (int): Subdomain index.
+
+        Returns:
+            Dict[str, Any]: Training data of the subdomain.
+        """
+        if self.model.coupling == 'window':
+            lower, upper = self.model.support_lower, self.model.support_upper
+        else:
+            lower, upper = self.model.core_lower, self.model.core_upper
+
+        data = {}
+        targets = {'x_bc': 'u_bc', 'x_ic': 'u_ic', 'x_data': 'u_data'}
+        for group, x_key in POINT_GROUPS.items():
+            points = train_data.get(x_key)
+            if points is None or group in ('interface', 'distillation'):
+                continue
+            mask = self.model.inside(points, lower, upper, index)
+            if not mask.any():
+                # Groups without points here (e.g. initial points of later time slabs) are dropped
+                continue
+            data[x_key] = points[mask].clone()
+            if x_key in targets and targets[x_key] in train_data:
+                data[targets[x_key]] = train_data[targets[x_key]][mask].clone()
+        return data
+
+    def neighbours(self) -> List[List[int]]:
+        """Subdomains whose supports overlap, per subdomain."""
+        lower, upper = self.model.support_lower, self.model.support_upper
+        result = []
+        for i in range(self.model.num_subdomains):
+            overlapping = (lower[i] < upper) & (lower < upper[i])
+            result.append([j for j in range(self.model.num_subdomains) if j != i and bool(overlapping[j].all())])
+        return result
+
+    def train(self, train_data: Dict[str, Any], physics_fn: Callable, epochs: int = 5000,
+              weights: Optional[Dict[str, float]] = None, learning_rate: float = 1e-3,
+              optimizer_type: str = "adam", exchange_interval: Optional[int] = None,
+              points_per_interface: int = 50, threads_per_worker: int = 1,
+              seed: int = 0) -> Dict[str, Any]:
+        """Train all subdomains concurrently in worker processes.
+
+        Args:
+            train_data (Dict[str, Any]): Training data over the whole domain.
+            physics_fn (Callable): Physics function (must be picklable, e.g. a functools.partial).
+            epochs (int): Training steps per subdomain.
+            weights (Dict[str, float], optional): Loss weights.
+            learning_rate (float): Learning rate.
+            optimizer_type (str): Optimizer type.
+            exchange_interval (int, optional): Steps between shared-memory exchanges
+                (default 1 for window and 50 for interface coupling).
+            points_per_interface (int): Interface points per shared face (interface coupling).
+            threads_per_worker (int): Torch threads per worker process.
+            seed (int): Base random seed.
+
+        Returns:
+            Dict[str, Any]: 'subdomain_losses' (final total loss per subdomain) and 'training_time'.
+        """
+        if epochs < 1:
+            raise ValueError(f"Domain decomposition training needs at least one epoch, got {epochs}")
+        if exchange_interval is not None and exchange_interval < 1:
+            raise ValueError(f"Exchange interval must be at least 1, got {exchange_interval}")
+        if weights is None:
+            weights = {'physics': 1.0, 'boundary': 1.0, 'initial': 1.0, 'interface': 1.0}
+        if exchange_interval is None:
+            exchange_interval = 1 if self.model.coupling == 'window' else 50
+        num = self.model.num_subdomains
+        context = mp.get_context(self.start_method)
+
+        num_parameters = _flat_parameters(self.model.networks[0]).numel()
+        shared = {
+            'parameters': torch.stack([_flat_parameters(net) for net in self.model.networks]).share_memory_(),
+            'losses': torch.zeros(num, dtype=torch.float64).share_memory_(),
+            'barrier': context.Barrier(num)
+        }
+
+        datasets = [self.subdomain_data(train_data, i) for i in range(num)]
+        worker_shared = [dict(shared) for _ in range(num)]
+        if self.model.coupling == 'interface':
+            points, pairs = interface_points(self.model, points_per_interface)
+            # Probe one point for the widths of the derivative and residual buffers
+            probe = PINNTrainer(self.model.networks[0], self.purpose, self.equation, self.loss_terms)
+            state = interface_state(probe, points[:1], datasets[0], physics_fn)
+            buffers = {key: torch.zeros(num, points.shape[0], value.shape[-1]).share_memory_()
+                       for key, value in zip(INTERFACE_STATE, state)}
+            for i in range(num):
+                own = [index for a, _, index in pairs if a == i]
+                neighbour = [torch.stack([torch.full_like(index, b), index], dim=1) for a, b, index in pairs if a == i]
+                if not own:
+                    continue
+                worker_shared[i].update({
+                    'interface_points': points, **buffers,
+                    'own_points': torch.cat(own), 'neighbour_points': torch.cat(neighbour)
+                })
+                datasets[i]['x_interface'] = points[torch.cat(own)]
+                datasets[i]['u_interface'] = torch.zeros(datasets[i]['x_interface'].shape[0], self.model.output_dim)
+
+        settings = {
+            'epochs': epochs, 'learning_rate': learning_rate, 'optimizer_type': optimizer_type,
+            'exchange_interval': exchange_interval, 'threads_per_worker': threads_per_worker,
+            'weights': weights, 'seed': seed, 'neighbours': self.neighbours()
+        }
+
+        self.logger.log_purpose_specific_info(
+            f"Domain decomposition: {num} subdomains ({self.model.coupling} coupling, "
+            f"{num_parameters} parameters each), exchange every {exchange_interval} steps"
+        )
+
+        start_time = time.time()
+        processes = []
+        for rank in range(num):
+            process = context.Process(
+                target=_train_subdomain,
+                args=(rank, self.model, self.purpose, self.equation, self.loss_terms,
+                      datasets[rank], physics_fn, settings, worker_shared[rank])
+            )
+            process.start()
+            processes.append(process)
+        for process in processes:
+            process.join()
+        training_time = time.time() - start_time
+
+        failed = [rank for rank, process in enumerate(processes) if process.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Subdomain workers failed: {failed}")
+
+        for network, parameters in zip(self.model.networks, shared['parameters']):
+            nn.utils.vector_to_parameters(parameters.clone(), network.parameters())
+
+        self.training_history = {
+            'subdomain_losses': shared['losses'].tolist(),
+            'training_time': training_time
+        }
+        self.logger.log_training_complete(float(np.mean(self.training_history['subdomain_losses'])), training_time)
+        return self.training_history
@@ -0,0 +1,142 @@
+"""
+Shared Export Module for PINN Research Platform.
+
+This module exports trained models to a flat ``.npz`` file: the weight
+arrays plus a JSON description of the layer graph. The file is evaluated by
+the NumPy-only runtime in ``runtime.numpy_model``, so prediction workers do
+not need to import torch.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+import json
+
+from utils.loggers import get_general_logger
+from utils.models import MLP, FourierFeatureMLP, MultiScalePINN, ResNetPINN, ResidualBlock
+from utils.adapters import LoRALinear
+
+
+# Graph format version, stored with the weights
+EXPORT_FORMAT_VERSION = 1
+
+# Activation modules by class name and their runtime names
+ACTIVATIONS = {
+    'Tanh': 'tanh',
+    'ReLU': 'relu',
+    'Sigmoid': 'sigmoid',
+    'SiLU': 'silu',
+    'GELU': 'gelu',
+    'Softplus': 'softplus',
+    'SinActivation': 'sin'
+}
+
+
+class _GraphBuilder:
+    """Collects weight arrays and layer ops while walking a model."""
+
+    def __init__(self, dtype: np.dtype):
+        self.dtype = dtype
+        self.arrays = {}
+
+    def array(self, tensor: torch.Tensor) -> str:
+        """Store a tensor and return its key."""
+        key = f"a{len(self.arrays)}"
+        self.arrays[key] = np.ascontiguousarray(tensor.detach().cpu().numpy().astype(self.dtype))
+        return key
+
+    def linear(self, layer: nn.Linear) -> Dict[str, Any]:
+        """Op of a linear layer."""
+        # Weights are stored transposed, (in, out), so the runtime computes x @ W;
+        # adapters are merged into the weight
+        weight = layer.merged_weight() if isinstance(layer, LoRALinear) else layer.weight
+        return {'op': 'linear', 'weight': self.array(weight.t()),
+                'bias': self.array(layer.bias) if layer.bias is not None else None}
+
+    def activation(self, module: nn.Module) -> Dict[str, Any]:
+        """Op of an activation module."""
+        name = ACTIVATIONS[module.__class__.__name__]
+        if name == 'softplus' and (module.beta != 1 or module.threshold != 20):
+            raise ValueError("Only the default Softplus (beta=1, threshold=20) can be exported")
+        if name == 'gelu' and module.approximate != 'none':
+            raise ValueError("Only the exact GELU can be exported")
+        return {'op': 'activation', 'name': name}
+
+    def module(self, module: nn.Module) -> List[Dict[str, Any]]:
+        """Translate a module into a list of ops."""
+        if isinstance(module, nn.Sequential):
+            return [op for child in module for op in self.module(child)]
+        if isinstance(module, nn.Linear):
+            return [self.linear(module)]
+        if isinstance(module, (nn.Dropout, nn.Identity)):
+            return []
+        if module.__class__.__name__ in ACTIVATIONS:
+            return [self.activation(module)]
+        if isinstance(module, MLP):
+            return self.module(module.network)
+        if isinstance(module, FourierFeatureMLP):
+            return [{'op': 'fourier', 'weight': self.array(module.fourier_projection.weight.t())}] + \
+                self.module(module.mlp)
+        if isinstance(module, ResidualBlock):
+            return [{'op': 'residual',
+                     'body': [self.linear(module.layer1), self.activation(module.activation), self.linear(module.layer2)],
+                     'skip': self.module(module.skip_connection),
+                     'activation': ACTIVATIONS[module.activation.__class__.__name__]}]
+        if isinstance(module, ResNetPINN):
+            ops = [self.linear(module.input_layer), self.activation(module.activation_fn)]
+            for block in module.residual_blocks:
+                ops.extend(self.module(block))
+            return ops + [self.linear(module.output_layer)]
+        if isinstance(module, MultiScalePINN):
+            networks = module.scale_networks
+            return [{'op': 'mixture',
+                     'weights': [self.array(w) for w in networks.weights],
+                     'biases': [self.array(b) for b in networks.biases],
+                     'activation': ACTIVATIONS[networks.activation_fn.__class__.__name__],
+                     'mixture': self.array(torch.softmax(module.scale_weights, dim=0))}]
+        network = getattr(module, 'network', None)
+        if isinstance(network, nn.Sequential) and \
+                sum(1 for _ in module.parameters()) == sum(1 for _ in network.parameters()):
+            # Purpose models: a layer stack whose forward is ``self.network(x)``
+            return self.module(network)
+        raise ValueError(f"Unsupported module for NumPy export: {module.__class__.__name__}")
+
+
+def export_numpy(model: nn.Module, path: str, dtype: str = "float32",
+                 metadata: Optional[Dict[str, Any]] = None) -> Path:
+    """Export a model to a ``.npz`` file for the NumPy runtime.
+
+    Supports MLP, FourierFeatureMLP, ResNetPINN, MultiScalePINN and the
+    purpose models built as a single ``network`` layer stack.
+
+    Args:
+        model (nn.Module): Trained model.
+        path (str): Output file.
+        dtype (str): Stored weight dtype ('float32' or 'float64').
+        metadata (Dict[str, Any], optional): Extra JSON-serializable information
+            (e.g. purpose, equation, coefficients).
+
+    Returns:
+        Path: Written file.
+    """
+    builder = _GraphBuilder(np.dtype(dtype))
+    graph = {
+        'version': EXPORT_FORMAT_VERSION,
+        'model_type': model.__class__.__name__,
+        'input_dim': getattr(model, 'input_dim', None),
+        'output_dim': getattr(model, 'output_dim', None),
+        'ops': builder.module(model),
+        'metadata': metadata or {}
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        np.savez(f, graph=np.array(json.dumps(graph)), **builder.arrays)
+
+    logger = get_general_logger("export")
+    logger.info(f"Exported {graph['model_type']} ({len(graph['ops'])} ops, "
+                f"{sum(a.size for a in builder.arrays.values())} weights) to {path}")
+    return path
@@ -0,0 +1,264 @@
+"""
+Shared Inference Module for PINN Research Platform.
+
+This module provides uncertainty-aware prediction for trained PINNs
+(single-pass Monte Carlo dropout and a last-layer Laplace approximation) and
+an inference-optimization pipeline for serving: frozen TorchScript graphs,
+oneDNN fusion and dynamic int8 quantization behind an accuracy guard.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Tuple, Optional, Dict, Any
+import copy
+import math
+import time
+
+from utils.loggers import get_general_logger
+
+
+def has_dropout(model: nn.Module) -> bool:
+    """Check whether a model contains active dropout layers.
+
+    Args:
+        model (nn.Module): PINN model.
+
+    Returns:
+        bool: True if the model has dropout with a positive rate.
+    """
+    return any(isinstance(m, nn.modules.dropout._DropoutNd) and m.p > 0 for m in model.modules())
+
+
+def mc_dropout_predict(model: nn.Module, inputs: torch.Tensor, num_samples: int = 50,
+                       max_batch_rows: int = 2**20) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Monte Carlo dropout prediction in one vectorized forward pass.
+
+    The input batch is replicated ``num_samples`` times and evaluated with
+    dropout active (all other layers stay in eval mode), so every replica
+    sees an independent dropout mask. The replicas are then reduced to mean
+    and standard deviation. Inputs are processed in chunks so that at most
+    ``max_batch_rows`` rows go through the network at once.
+
+    Args:
+        model (nn.Module): Model with dropout layers.
+        inputs (torch.Tensor): Inputs of shape (n, input_dim).
+        num_samples (int): Number of dropout samples.
+        max_batch_rows (int): Maximum rows per forward pass.
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: Mean and standard deviation of shape (n, output_dim).
+    """
+    dropout_layers = [m for m in model.modules() if isinstance(m, nn.modules.dropout._DropoutNd)]
+    previous_modes = [m.training for m in dropout_layers]
+    for layer in dropout_layers:
+        layer.train()
+
+    chunk = max(1, max_batch_rows // num_samples)
+    means, stds = [], []
+    try:
+        with torch.no_grad():
+            for start in range(0, inputs.shape[0], chunk):
+                points = inputs[start:start + chunk]
+                replicated = points.unsqueeze(0).expand(num_samples, -1, -1).reshape(-1, points.shape[1])
+                samples = model(replicated).reshape(num_samples, points.shape[0], -1)
+                means.append(samples.mean(dim=0))
+                stds.append(samples.std(dim=0, unbiased=num_samples > 1))
+    finally:
+        for layer, mode in zip(dropout_layers, previous_modes):
+            layer.train(mode)
+
+    return torch.cat(means, dim=0), torch.cat(stds, dim=0)
+
+
+class LastLayerLaplace:
+    """Last-layer Laplace approximation for regression PINNs.
+
+    The network up to its final ``nn.Linear`` layer is treated as a fixed
+    feature map and a Gaussian posterior is placed on the final layer's
+    weights. The posterior precision (the generalized Gauss-Newton Hessian
+    plus the prior precision) is factorized once with Cholesky in
+    :meth:`fit`; predictive variances are then a triangular solve per batch.
+    The final ``nn.Linear`` must produce the model output directly (linear
+    output activation).
+    """
+
+    def __init__(self, model: nn.Module, prior_precision: float = 1.0):
+        """Initialize the Laplace approximation.
+
+        Args:
+            model (nn.Module): Trained PINN model.
+            prior_precision (float): Precision of the isotropic Gaussian prior.
+        """
+        self.model = model
+        self.prior_precision = prior_precision
+        self.logger = get_general_logger("laplace")
+
+        linear_layers = [m for m in model.modules() if isinstance(m, nn.Linear)]
+        if not linear_layers:
+            raise ValueError("Laplace approximation requires a model with an nn.Linear output layer")
+        self.last_layer = linear_layers[-1]
+
+        self.noise_std = None
+        self.cholesky_factor = None
+
+    def features(self, inputs: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Compute last-layer features (with a bias column) and model outputs.
+
+        Args:
+            inputs (torch.Tensor): Inputs of shape (n, input_dim).
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Features of shape (n, hidden + 1) and outputs.
+        """
+        captured = {}
+
+        def hook(module, module_inputs, output):
+            captured['features'] = module_inputs[0]
+
+        handle = self.last_layer.register_forward_hook(hook)
+        try:
+            with torch.no_grad():
+                outputs = self.model(inputs)
+        finally:
+            handle.remove()
+
+        phi = captured['features']
+        if self.last_layer.bias is not None:
+            phi = torch.cat([phi, torch.ones_like(phi[:, :1])], dim=1)
+        return phi, outputs
+
+    def fit(self, inputs: torch.Tensor, targets: Optional[torch.Tensor] = None,
+            noise_std: Optional[float] = None) -> 'LastLayerLaplace':
+        """Fit the posterior and cache its Cholesky factor.
+
+        Args:
+            inputs (torch.Tensor): Training inputs (e.g. data, boundary and initial points).
+            targets (torch.Tensor, optional): Training targets, used to estimate the noise.
+            noise_std (float, optional): Observation noise; estimated from the residuals if omitted.
+
+        Returns:
+            LastLayerLaplace: Self, for chaining.
+        """
+        self.model.eval()
+        phi, outputs = self.features(inputs)
+
+        if noise_std is None:
+            if targets is None:
+                raise ValueError("Either targets or noise_std must be given")
+            noise_std = max(torch.sqrt(torch.mean((outputs - targets) ** 2)).item(), 1e-8)
+        self.noise_std = noise_std
+
+        # Posterior precision, shared by all output dimensions
+        precision = phi.T @ phi / noise_std**2
+        precision.diagonal().add_(self.prior_precision)
+        self.cholesky_factor = torch.linalg.cholesky(precision)
+
+        self.logger.info(f"Laplace posterior fitted on {inputs.shape[0]} points (noise std {noise_std:.3e})")
+        return self
+
+    def predict(self, inputs: torch.Tensor, include_noise: bool = False) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Predictive mean and standard deviation.
+
+        Args:
+            inputs (torch.Tensor): Inputs of shape (n, input_dim).
+            include_noise (bool): Add the observation noise to the predictive variance.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Mean and standard deviation of shape (n, output_dim).
+        """
+        if self.cholesky_factor is None:
+            raise ValueError("Laplace approximation must be fitted before prediction")
+
+        phi, outputs = self.features(inputs)
+        # phi^T H^{-1} phi = ||L^{-1} phi||^2
+        z = torch.linalg.solve_triangular(self.cholesky_factor, phi.T, upper=False)
+        variance = torch.sum(z**2, dim=0, keepdim=True).T
+        if include_noise:
+            variance = variance + self.noise_std**2
+
+        return outputs, torch.sqrt(variance).expand_as(outputs)
+
+
+def _timed_predict(model: nn.Module, inputs: torch.Tensor, repeats: int = 3) -> Tuple[torch.Tensor, float]:
+    """Run a model a few times (JIT warm-up included) and return the last output and its time."""
+    with torch.no_grad():
+        for _ in range(repeats):
+            start = time.perf_counter()
+            outputs = model(inputs)
+            elapsed = time.perf_counter() - start
+    return outputs, elapsed
+
+
+def optimize_for_inference(model: nn.Module, validation_inputs: torch.Tensor,
+                           quantize: bool = False, tolerance: float = 1e-3,
+                           onednn_fusion: bool = False) -> Tuple[torch.jit.ScriptModule, Dict[str, Any]]:
+    """Build a frozen fp32 (optionally int8) inference graph of a trained PINN.
+
+    A float32 copy of the model is traced and frozen with ``torch.jit.freeze``
+    (weights become constants, so the JIT can fold and fuse them). With
+    ``quantize`` the hidden ``nn.Linear`` layers are first replaced by dynamic
+    int8 layers; the input and output layers stay in float32 because they see
+    the raw coordinates and produce the solution values. The original model is
+    left untouched.
+
+    The accuracy guard evaluates both the original and the optimized model on
+    ``validation_inputs`` (e.g. the 200x200 grid of the results page) and
+    raises if the relative L2 error exceeds ``tolerance``, so a degraded graph
+    is never deployed.
+
+    Args:
+        model (nn.Module): Trained PINN model (float32 or float64).
+        validation_inputs (torch.Tensor): Validation inputs of shape (n, input_dim).
+        quantize (bool): Apply dynamic int8 quantization to the hidden linear layers.
+        tolerance (float): Maximum relative L2 error against the original model.
+        onednn_fusion (bool): Enable the oneDNN graph fuser while the graph is traced and
+            profiled; the previous process-wide setting is restored afterwards.
+
+    Returns:
+        Tuple[torch.jit.ScriptModule, Dict[str, Any]]: Optimized module and accuracy/timing report.
+    """
+    logger = get_general_logger("inference")
+    model.eval()
+
+    inputs = validation_inputs.detach().float()
+    reference, reference_time = _timed_predict(model, validation_inputs.to(next(model.parameters()).dtype))
+
+    serving = copy.deepcopy(model).float().eval()
+    if quantize:
+        linear_layers = [name for name, module in serving.named_modules() if isinstance(module, nn.Linear)]
+        hidden_layers = set(linear_layers[1:-1])
+        if not hidden_layers:
+            raise ValueError("Quantization needs at least one hidden nn.Linear layer")
+        serving = torch.ao.quantization.quantize_dynamic(serving, hidden_layers, dtype=torch.qint8)
+
+    previous_fusion = torch.jit.onednn_fusion_enabled()
+    torch.jit.enable_onednn_fusion(onednn_fusion)
+    try:
+        with torch.no_grad():
+            traced = torch.jit.trace(serving, inputs[:16])
+        optimized = torch.jit.freeze(traced)
+        outputs, optimized_time = _timed_predict(optimized, inputs)
+    finally:
+        torch.jit.enable_onednn_fusion(previous_fusion)
+
+    reference = reference.double()
+    error = outputs.double() - reference
+    relative_l2 = (torch.norm(error) / torch.norm(reference).clamp_min(1e-12)).item()
+
+    report = {
+        'quantized': quantize,
+        'relative_l2': relative_l2,
+        'max_error': error.abs().max().item(),
+        'tolerance': tolerance,
+        'reference_time': reference_time,
+        'optimized_time': optimized_time,
+        'speedup': reference_time / max(optimized_time, 1e-12)
+    }
+    if not relative_l2 <= tolerance:
+        raise ValueError(f"Optimized model exceeds accuracy tolerance: relative L2 error "
+                         f"{relative_l2:.3e} > {tolerance:.3e}")
+
+    logger.info(f"Optimized {'int8' if quantize else 'fp32'} model: relative L2 error {relative_l2:.3e}, "
+                f"{report['speedup']:.2f}x speedup on {inputs.shape[0]} points")
+    return optimized, report
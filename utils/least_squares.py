@@ -0,0 +1,228 @@
+"""
+Shared Least-Squares Solver Module for PINN Research Platform.
+
+This module solves linear PDEs with random-feature (extreme learning
+machine) PINNs: the hidden layers stay fixed and the output layer is found
+from one regularized linear least-squares problem over residual, boundary,
+initial and data rows, instead of thousands of gradient steps.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Dict, Any, Callable, Optional, Tuple
+import math
+import time
+
+from utils.loggers import get_general_logger
+from utils.models import MLP, FourierFeatureMLP, input_derivatives
+
+
+# Linear operators as {derivative: coefficient}. Derivatives are named after
+# the input columns (x, t); for steady 2D problems (Poisson, Helmholtz) the
+# second column is the second spatial coordinate y and 'u_tt' is u_yy.
+LINEAR_OPERATORS = {
+    'heat': lambda alpha=1.0: {'u_t': 1.0, 'u_xx': -alpha},
+    'advection': lambda c=1.0: {'u_t': 1.0, 'u_x': c},
+    'wave': lambda c=1.0: {'u_tt': 1.0, 'u_xx': -c**2},
+    'reaction_diffusion': lambda D=1.0, k=1.0: {'u_t': 1.0, 'u_xx': -D, 'u': k},
+    'poisson': lambda: {'u_xx': -1.0, 'u_tt': -1.0},
+    'helmholtz': lambda k=1.0: {'u_xx': 1.0, 'u_tt': 1.0, 'u': k**2}
+}
+
+
+def get_linear_operator(equation_type: str, **coefficients) -> Dict[str, float]:
+    """Get the linear differential operator of an equation.
+
+    Args:
+        equation_type (str): 'heat', 'advection', 'wave', 'reaction_diffusion', 'poisson' or 'helmholtz'.
+        **coefficients: Equation coefficients (same names as the physics functions).
+
+    Returns:
+        Dict[str, float]: Coefficient per derivative term.
+    """
+    if equation_type.lower() not in LINEAR_OPERATORS:
+        raise ValueError(f"Unsupported linear equation type: {equation_type}")
+    return LINEAR_OPERATORS[equation_type.lower()](**coefficients)
+
+
+def _feature_map(model: nn.Module) -> Tuple[Callable[[torch.Tensor], torch.Tensor], nn.Linear]:
+    """Split a model into its fixed feature map and its linear output layer."""
+    if isinstance(model, FourierFeatureMLP):
+        hidden = model.mlp.network[:-1]
+        output_layer = model.mlp.network[-1]
+
+        def features(x):
+            return hidden(torch.cos(2 * math.pi * model.fourier_projection(x)))
+    elif isinstance(model, MLP):
+        features = model.network[:-1]
+        output_layer = model.network[-1]
+    else:
+        raise ValueError(f"Unsupported model for least-squares solve: {model.__class__.__name__}")
+
+    if not isinstance(output_layer, nn.Linear):
+        raise ValueError("Least-squares solve requires a linear output activation")
+    return features, output_layer
+
+
+class LeastSquaresSolver:
+    """Random-feature least-squares solver for linear PDEs.
+
+    With fixed hidden layers, u(x) = phi(x) w + b is linear in the output
+    layer, and so is any linear operator applied to it. The features and
+    their exact input derivatives (forward mode) give one row block per
+    constraint; the weighted, ridge-regularized system is solved once with
+    QR-based least squares in float64, and the result is written into the
+    model's output layer, so the model is used exactly as after training.
+    """
+
+    def __init__(self, model: nn.Module, equation: str, coefficients: Optional[Dict[str, float]] = None,
+                 source_fn: Optional[Callable[[torch.Tensor, torch.Tensor], torch.Tensor]] = None):
+        """Initialize the solver.
+
+        Args:
+            model (nn.Module): MLP or FourierFeatureMLP with a single output.
+            equation (str): Linear equation type (see LINEAR_OPERATORS).
+            coefficients (Dict[str, float], optional): Equation coefficients.
+            source_fn (Callable, optional): Right-hand side f(x, t) of L[u] = f (default 0).
+        """
+        self.model = model
+        self.equation = equation
+        self.operator = get_linear_operator(equation, **(coefficients or {}))
+        self.source_fn = source_fn
+        self.logger = get_general_logger("least_squares")
+
+        self.features, self.output_layer = _feature_map(model)
+        if self.output_layer.out_features != 1:
+            raise ValueError("Least-squares solve supports a single output")
+
+    def reinitialize_features(self, scale: float = 1.0, seed: Optional[int] = None) -> None:
+        """Resample the hidden weights and biases uniformly in [-scale, scale].
+
+        Random-feature methods need features that vary on the scale of the
+        solution; default (Xavier) initialization of a wide layer is often too
+        smooth. For a FourierFeatureMLP only the layers after the Fourier
+        projection are resampled.
+
+        Args:
+            scale (float): Half-width of the uniform distribution.
+            seed (int, optional): Random seed.
+        """
+        if seed is not None:
+            torch.manual_seed(seed)
+        # The Fourier projection keeps its own frequency scale (sigma)
+        hidden = self.model.mlp if isinstance(self.model, FourierFeatureMLP) else self.model
+        with torch.no_grad():
+            for module in hidden.modules():
+                if isinstance(module, nn.Linear) and module is not self.output_layer:
+                    module.weight.uniform_(-scale, scale)
+                    if module.bias is not None:
+                        module.bias.uniform_(-scale, scale)
+
+    def operator_rows(self, points: torch.Tensor) -> torch.Tensor:
+        """Rows of the linear operator applied to the features (plus bias column).
+
+        Args:
+            points (torch.Tensor): Collocation points of shape (n, 2).
+
+        Returns:
+            torch.Tensor: Matrix of shape (n, num_features [+ 1 for the bias]).
+        """
+        features, first, second = input_derivatives(self.features, points)
+        terms = {
+            'u': features, 'u_x': first[0], 'u_t': first[1],
+            'u_xx': second[(0, 0)], 'u_xt': second[(0, 1)], 'u_tt': second[(1, 1)]
+        }
+
+        rows = torch.zeros_like(features)
+        for name, coefficient in self.operator.items():
+            rows = rows + coefficient * terms[name]
+        if self.output_layer.bias is None:
+            return rows
+        # The output bias only contributes through the zeroth-order term
+        bias = torch.full_like(features[:, :1], self.operator.get('u', 0.0))
+        return torch.cat([rows, bias], dim=1)
+
+    def value_rows(self, points: torch.Tensor) -> torch.Tensor:
+        """Rows evaluating u at points (features plus bias column).
+
+        Args:
+            points (torch.Tensor): Points of shape (n, 2).
+
+        Returns:
+            torch.Tensor: Matrix of shape (n, num_features [+ 1 for the bias]).
+        """
+        with torch.no_grad():
+            features = self.features(points)
+        if self.output_layer.bias is None:
+            return features
+        return torch.cat([features, torch.ones_like(features[:, :1])], dim=1)
+
+    def solve(self, train_data: Dict[str, Any], weights: Optional[Dict[str, float]] = None,
+              regularization: float = 1e-8) -> Dict[str, float]:
+        """Assemble and solve the least-squares system, updating the output layer.
+
+        Args:
+            train_data (Dict[str, Any]): Training data with 'x' and any of ('x_bc', 'u_bc'),
+                ('x_ic', 'u_ic'), ('x_data', 'u_data').
+            weights (Dict[str, float], optional): Row-block weights keyed 'physics',
+                'boundary', 'initial', 'data' (default 1.0).
+            regularization (float): Ridge parameter.
+
+        Returns:
+            Dict[str, float]: Mean squared residual per block, 'total_loss' and 'solve_time'.
+        """
+        weights = weights or {}
+        start_time = time.perf_counter()
+
+        blocks = []
+        points = train_data['x'].detach()
+        if self.source_fn is not None:
+            rhs = self.source_fn(points[:, 0:1], points[:, 1:2])
+        else:
+            rhs = torch.zeros(points.shape[0], 1, dtype=points.dtype, device=points.device)
+        blocks.append(('physics', self.operator_rows(points), rhs))
+
+        for name, x_key, u_key in (('boundary', 'x_bc', 'u_bc'), ('initial', 'x_ic', 'u_ic'),
+                                   ('data', 'x_data', 'u_data')):
+            if train_data.get(x_key) is not None and train_data.get(u_key) is not None:
+                blocks.append((name, self.value_rows(train_data[x_key].detach()), train_data[u_key].detach()))
+
+        # Weight each block by sqrt(weight / rows) so it matches the mean-squared loss terms
+        matrices, targets = [], []
+        for name, rows, target in blocks:
+            scale = math.sqrt(weights.get(name, 1.0) / rows.shape[0])
+            matrices.append(scale * rows.double())
+            targets.append(scale * target.double())
+        A = torch.cat(matrices, dim=0)
+        b = torch.cat(targets, dim=0)
+
+        # Ridge regularization as extra rows keeps the solve a single QR least squares
+        n_unknowns = A.shape[1]
+        if regularization > 0:
+            A = torch.cat([A, math.sqrt(regularization) * torch.eye(n_unknowns, dtype=A.dtype, device=A.device)])
+            b = torch.cat([b, torch.zeros(n_unknowns, 1, dtype=b.dtype, device=b.device)])
+
+        # Column-pivoted QR least squares (LAPACK gelsy)
+        solution = torch.linalg.lstsq(A.cpu(), b.cpu(), driver='gelsy').solution.to(A.device)
+
+        num_features = self.output_layer.in_features
+        with torch.no_grad():
+            self.output_layer.weight.copy_(solution[:num_features].T.to(self.output_layer.weight))
+            if self.output_layer.bias is not None:
+                self.output_layer.bias.copy_(solution[num_features].to(self.output_layer.bias))
+
+        losses = {}
+        total = 0.0
+        for name, rows, target in blocks:
+            residual = rows.double() @ solution - target.double()
+            losses[f"{name}_loss"] = (residual ** 2).mean().item()
+            total += weights.get(name, 1.0) * losses[f"{name}_loss"]
+        losses['total_loss'] = total
+        losses['solve_time'] = time.perf_counter() - start_time
+
+        self.logger.info(
+            f"Least-squares solve for {self.equation}: {A.shape[0]} rows x {n_unknowns} unknowns, "
+            f"total loss {total:.3e} in {losses['solve_time']:.3f} s"
+        )
+        return losses
@@ -0,0 +1,300 @@
+"""
+Shared Loss Balancing Module for PINN Research Platform.
+
+This module recomputes the loss weights during training from gradient
+statistics of the individual loss terms: learning-rate annealing (max or
+mean gradient ratios), GradNorm and NTK-trace weighting. Statistics are
+taken every few steps on a random subsample of the training points, with one
+backward pass per loss term, and smoothed with a moving average.
+"""
+
+import torch
+import torch.nn as nn
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from utils.loggers import get_general_logger
+
+
+class LossBalancer:
+    """Base class for adaptive loss weighting.
+
+    Subclasses implement :meth:`target_weights`; the base class handles the
+    update schedule, subsampling and smoothing,
+    ``w <- smoothing * w + (1 - smoothing) * w_target``.
+    """
+
+    name: str = "balancer"
+
+    def __init__(self, update_interval: int = 100, smoothing: float = 0.9,
+                 subsample: Optional[int] = 512, terms: Optional[List[str]] = None):
+        """Initialize the loss balancer.
+
+        Args:
+            update_interval (int): Recompute the weights every this many steps.
+            smoothing (float): Moving-average factor of the weights (0 uses the targets directly).
+            subsample (int, optional): Points per group used for the statistics (None for all).
+            terms (List[str], optional): Loss terms to balance (default: all active terms except 'l2').
+        """
+        self.update_interval = update_interval
+        self.smoothing = smoothing
+        self.subsample = subsample
+        self.terms = terms
+        self.history = []
+        self.logger = get_general_logger("loss_balancing")
+
+    def subsample_data(self, trainer: Any, train_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Draw a random subset of every point group and its targets.
+
+        Args:
+            trainer (PINNTrainer): Trainer (defines the point groups).
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            Dict[str, Any]: Subsampled training data.
+        """
+        if self.subsample is None:
+            return train_data
+
+        data = dict(train_data)
+        for term in trainer.loss_terms:
+            keys = [key for key in term.required_keys if torch.is_tensor(train_data.get(key))]
+            if not keys:
+                continue
+            n = train_data[keys[0]].shape[-2]
+            if n <= self.subsample:
+                continue
+            index = torch.randperm(n, device=train_data[keys[0]].device)[:self.subsample]
+            for key in keys:
+                data[key] = train_data[key].index_select(-2, index)
+        return data
+
+    def balanced_terms(self, trainer: Any, train_data: Dict[str, Any]) -> List[str]:
+        """Get the names of the loss terms to balance."""
+        names = [term.name for term in trainer.active_loss_terms(train_data)]
+        if self.terms is not None:
+            return [name for name in names if name in self.terms]
+        return [name for name in names if name != 'l2']
+
+    @staticmethod
+    def flat_gradient(value: torch.Tensor, params: List[nn.Parameter]) -> torch.Tensor:
+        """Gradient of a scalar with respect to the parameters, flattened."""
+        grads = torch.autograd.grad(value, params, retain_graph=True, allow_unused=True)
+        return torch.cat([
+            (g if g is not None else torch.zeros_like(p)).reshape(-1) for g, p in zip(grads, params)
+        ])
+
+    def term_gradients(self, trainer: Any, train_data: Dict[str, Any], physics_fn: Callable,
+                       names: List[str]) -> Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
+        """Loss values and flattened parameter gradients per term (one backward each).
+
+        Args:
+            trainer (PINNTrainer): Trainer.
+            train_data (Dict[str, Any]): (Subsampled) training data.
+            physics_fn (Callable): Physics function.
+            names (List[str]): Loss terms.
+
+        Returns:
+            Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]: Losses and gradients by term name.
+        """
+        params = trainer.trainable_parameters()
+        losses = trainer.compute_losses(train_data, physics_fn, {})
+        values, gradients = {}, {}
+        for name in names:
+            values[name] = losses[f"{name}_loss"].detach()
+            gradients[name] = self.flat_gradient(losses[f"{name}_loss"], params)
+        return values, gradients
+
+    def target_weights(self, trainer: Any, train_data: Dict[str, Any], physics_fn: Callable,
+                       weights: Dict[str, float], names: List[str]) -> Dict[str, float]:
+        """Compute the target weights from gradient statistics.
+
+        Args:
+            trainer (PINNTrainer): Trainer.
+            train_data (Dict[str, Any]): Subsampled training data.
+            physics_fn (Callable): Physics function.
+            weights (Dict[str, float]): Current weights.
+            names (List[str]): Loss terms to balance.
+
+        Returns:
+            Dict[str, float]: Target weight per term.
+        """
+        raise NotImplementedError
+
+    def update(self, trainer: Any, train_data: Dict[str, Any], physics_fn: Callable,
+               weights: Dict[str, float], step: int) -> Dict[str, float]:
+        """Recompute the weights if an update is due.
+
+        Args:
+            trainer (PINNTrainer): Trainer.
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function.
+            weights (Dict[str, float]): Current weights.
+            step (int): Training step.
+
+        Returns:
+            Dict[str, float]: Weights for the next steps.
+        """
+        if step % self.update_interval != 0:
+            return weights
+
+        data = self.subsample_data(trainer, trainer.step_data(train_data))
+        names = self.balanced_terms(trainer, data)
+        if len(names) < 2:
+            return weights
+
+        targets = self.target_weights(trainer, data, physics_fn, weights, names)
+        updated = dict(weights)
+        for name, target in targets.items():
+            if not torch.isfinite(torch.tensor(target)):
+                continue
+            updated[name] = self.smoothing * weights.get(name, 1.0) + (1.0 - self.smoothing) * target
+
+        self.history.append({'step': step, 'weights': {name: updated.get(name, 1.0) for name in names}})
+        self.logger.info(f"{self.name} weights at step {step}: "
+                         + ", ".join(f"{name}={updated.get(name, 1.0):.3g}" for name in names))
+        return updated
+
+
+class LearningRateAnnealing(LossBalancer):
+    """Learning-rate annealing weights from gradient ratios.
+
+    Each term k gets stat(|grad L_ref|) / mean(|grad L_k|), where stat is the
+    maximum or the mean over parameters and the reference term (the PDE
+    residual by default) keeps weight 1.
+    """
+
+    name = "lr_annealing"
+
+    def __init__(self, update_interval: int = 100, smoothing: float = 0.9,
+                 subsample: Optional[int] = 512, terms: Optional[List[str]] = None,
+                 statistic: str = "max", reference: str = "physics"):
+        """Initialize learning-rate annealing.
+
+        Args:
+            update_interval (int): Recompute the weights every this many steps.
+            smoothing (float): Moving-average factor of the weights.
+            subsample (int, optional): Points per group used for the statistics.
+            terms (List[str], optional): Loss terms to balance.
+            statistic (str): 'max' or 'mean' of the reference gradient magnitudes.
+            reference (str): Loss term whose weight stays fixed.
+        """
+        super(LearningRateAnnealing, self).__init__(update_interval, smoothing, subsample, terms)
+
+        if statistic not in ('max', 'mean'):
+            raise ValueError(f"Unsupported gradient statistic: {statistic}")
+        self.statistic = statistic
+        self.reference = reference
+
+    def target_weights(self, trainer, train_data, physics_fn, weights, names):
+        if self.reference not in names:
+            raise ValueError(f"Reference loss term '{self.reference}' is not active")
+
+        _, gradients = self.term_gradients(trainer, train_data, physics_fn, names)
+        reference = gradients[self.reference].abs()
+        scale = reference.max() if self.statistic == 'max' else reference.mean()
+
+        targets = {}
+        for name in names:
+            if name == self.reference:
+                continue
+            targets[name] = (scale / gradients[name].abs().mean().clamp_min(1e-12)).item()
+        return targets
+
+
+class GradNorm(LossBalancer):
+    """GradNorm weights in closed form.
+
+    The weighted gradient norm of term k is steered to
+    mean_j(w_j ||grad L_j||) * r_k^alpha, where r_k is the term's loss
+    relative to its value at the first update, divided by the mean ratio.
+    Terms that train slower get larger weights; the weights are rescaled to
+    sum to the number of terms.
+    """
+
+    name = "gradnorm"
+
+    def __init__(self, update_interval: int = 100, smoothing: float = 0.9,
+                 subsample: Optional[int] = 512, terms: Optional[List[str]] = None,
+                 alpha: float = 1.5):
+        """Initialize GradNorm.
+
+        Args:
+            update_interval (int): Recompute the weights every this many steps.
+            smoothing (float): Moving-average factor of the weights.
+            subsample (int, optional): Points per group used for the statistics.
+            terms (List[str], optional): Loss terms to balance.
+            alpha (float): Restoring-force asymmetry.
+        """
+        super(GradNorm, self).__init__(update_interval, smoothing, subsample, terms)
+
+        self.alpha = alpha
+        self.initial_losses = {}
+
+    def target_weights(self, trainer, train_data, physics_fn, weights, names):
+        losses, gradients = self.term_gradients(trainer, train_data, physics_fn, names)
+        for name in names:
+            self.initial_losses.setdefault(name, losses[name].clamp_min(1e-12))
+
+        norms = {name: weights.get(name, 1.0) * gradients[name].norm() for name in names}
+        mean_norm = torch.stack(list(norms.values())).mean()
+        ratios = {name: losses[name] / self.initial_losses[name] for name in names}
+        mean_ratio = torch.stack(list(ratios.values())).mean().clamp_min(1e-12)
+
+        targets = {}
+        for name in names:
+            target_norm = mean_norm * (ratios[name] / mean_ratio) ** self.alpha
+            targets[name] = weights.get(name, 1.0) * target_norm / norms[name].clamp_min(1e-12)
+        total = torch.stack(list(targets.values())).sum().clamp_min(1e-12)
+        return {name: (len(names) * value / total).item() for name, value in targets.items()}
+
+
+class NTKWeighting(LossBalancer):
+    """Neural tangent kernel trace weighting.
+
+    Term k gets sum_j tr(K_j) / tr(K_k), where tr(K_k) / n_k is the mean
+    squared norm of the parameter gradient of the pointwise residual. The
+    trace is estimated with one Rademacher probe per term:
+    E ||grad (v . r_k)||^2 = sum_i ||grad r_k,i||^2, i.e. one backward pass
+    instead of one per point.
+    """
+
+    name = "ntk"
+
+    def target_weights(self, trainer, train_data, physics_fn, weights, names):
+        params = trainer.trainable_parameters()
+        residuals = trainer.compute_residuals(train_data, physics_fn)
+
+        traces = {}
+        for name in names:
+            if name not in residuals:
+                continue
+            residual = residuals[name]
+            probe = torch.randint(0, 2, residual.shape, device=residual.device).to(residual.dtype) * 2 - 1
+            gradient = self.flat_gradient(torch.sum(probe * residual), params)
+            traces[name] = torch.sum(gradient**2) / residual.numel()
+
+        total = torch.stack(list(traces.values())).sum()
+        return {name: (total / trace.clamp_min(1e-12)).item() for name, trace in traces.items()}
+
+
+LOSS_BALANCERS = {
+    'lr_annealing': LearningRateAnnealing,
+    'gradnorm': GradNorm,
+    'ntk': NTKWeighting
+}
+
+
+def get_loss_balancer(name: str, **kwargs) -> LossBalancer:
+    """Get a loss balancer by name.
+
+    Args:
+        name (str): 'lr_annealing', 'gradnorm' or 'ntk'.
+        **kwargs: Arguments for the balancer constructor.
+
+    Returns:
+        LossBalancer: Loss balancer instance.
+    """
+    if name.lower() not in LOSS_BALANCERS:
+        raise ValueError(f"Unsupported loss balancer: {name}")
+
+    return LOSS_BALANCERS[name.lower()](**kwargs)
@@ -0,0 +1,206 @@
+"""
+Shared Model Store Module for PINN Research Platform.
+
+This module keeps trained model weights indexed by purpose, equation and
+architecture together with the equation coefficients they were trained for,
+so new runs can warm-start from the closest previously trained model.
+"""
+
+import torch
+import torch.nn as nn
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+import hashlib
+import json
+import math
+import threading
+
+from utils.loggers import get_general_logger
+
+
+def architecture_key(model: nn.Module) -> str:
+    """Identify a model architecture by class name and parameter shapes.
+
+    Two models share a key exactly when one's state dict loads into the other.
+
+    Args:
+        model (nn.Module): PINN model.
+
+    Returns:
+        str: Architecture key, e.g. 'MLP-3f2a9c1b0d4e'.
+    """
+    shapes = [(name, tuple(tensor.shape)) for name, tensor in model.state_dict().items()]
+    digest = hashlib.sha1(repr(shapes).encode()).hexdigest()[:12]
+    return f"{model.__class__.__name__}-{digest}"
+
+
+def freeze_layers(model: nn.Module, num_layers: int) -> List[str]:
+    """Freeze the first ``num_layers`` linear layers of a model.
+
+    Args:
+        model (nn.Module): PINN model.
+        num_layers (int): Number of leading nn.Linear layers to freeze.
+
+    Returns:
+        List[str]: Names of the frozen layers.
+    """
+    frozen = []
+    for name, module in model.named_modules():
+        if len(frozen) >= num_layers:
+            break
+        if isinstance(module, nn.Linear):
+            for param in module.parameters():
+                param.requires_grad_(False)
+            frozen.append(name)
+    return frozen
+
+
+class ModelStore:
+    """On-disk store of trained weights with nearest-coefficient lookup.
+
+    Entries are grouped by (purpose, equation, architecture). Each group has
+    a JSON index of coefficient vectors and weight files; lookups compare
+    coefficient vectors in log space for positive values (coefficients such
+    as viscosity span several decades) and in linear space otherwise.
+    """
+
+    def __init__(self, root_dir: str = "model_store"):
+        """Initialize the model store.
+
+        Args:
+            root_dir (str): Directory holding the weight files and indices.
+        """
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = get_general_logger("model_store")
+        self._lock = threading.Lock()
+        self._indices = {}
+
+    def _group_dir(self, purpose: str, equation: str, architecture: str) -> Path:
+        """Directory of one (purpose, equation, architecture) group."""
+        return self.root_dir / purpose / equation / architecture
+
+    def _load_index(self, purpose: str, equation: str, architecture: str) -> List[Dict[str, Any]]:
+        """Load (and cache) the index of one group."""
+        key = (purpose, equation, architecture)
+        if key not in self._indices:
+            index_path = self._group_dir(*key) / "index.json"
+            if index_path.exists():
+                with open(index_path, 'r') as f:
+                    self._indices[key] = json.load(f)
+            else:
+                self._indices[key] = []
+        return self._indices[key]
+
+    def add(self, model: nn.Module, purpose: str, equation: str,
+            coefficients: Dict[str, float], metrics: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Store trained weights for a coefficient vector.
+
+        An existing entry with the same coefficients is replaced.
+
+        Args:
+            model (nn.Module): Trained model.
+            purpose (str): PINN purpose.
+            equation (str): Equation type.
+            coefficients (Dict[str, float]): Equation coefficients the model was trained for.
+            metrics (Dict[str, float], optional): Final losses or evaluation metrics.
+
+        Returns:
+            Dict[str, Any]: The stored index entry.
+        """
+        architecture = architecture_key(model)
+        group_dir = self._group_dir(purpose, equation, architecture)
+        group_dir.mkdir(parents=True, exist_ok=True)
+
+        coefficients = {name: float(value) for name, value in sorted(coefficients.items())}
+        tag = hashlib.sha1(json.dumps(coefficients).encode()).hexdigest()[:12]
+        weights_path = group_dir / f"{tag}.pt"
+
+        entry = {
+            'coefficients': coefficients,
+            'weights': weights_path.name,
+            'metrics': metrics or {},
+            'timestamp': datetime.now().isoformat()
+        }
+
+        with self._lock:
+            torch.save(model.state_dict(), weights_path)
+            index = self._load_index(purpose, equation, architecture)
+            index[:] = [e for e in index if e['coefficients'] != coefficients]
+            index.append(entry)
+            with open(group_dir / "index.json", 'w') as f:
+                json.dump(index, f, indent=2)
+
+        self.logger.info(f"Stored {architecture} for {purpose}/{equation} at {coefficients}")
+        return entry
+
+    @staticmethod
+    def _distance(a: Dict[str, float], b: Dict[str, float]) -> float:
+        """Distance between two coefficient vectors (log space for positive values)."""
+        if set(a) != set(b):
+            return math.inf
+        total = 0.0
+        for name in a:
+            x, y = a[name], b[name]
+            if x > 0 and y > 0:
+                total += math.log(x / y) ** 2
+            else:
+                total += ((x - y) / max(abs(x), abs(y), 1e-12)) ** 2
+        return math.sqrt(total)
+
+    def nearest(self, model: nn.Module, purpose: str, equation: str,
+                coefficients: Dict[str, float], k: int = 1,
+                max_distance: Optional[float] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """Find the stored entries closest to a coefficient vector.
+
+        Args:
+            model (nn.Module): Model whose architecture the entries must match.
+            purpose (str): PINN purpose.
+            equation (str): Equation type.
+            coefficients (Dict[str, float]): Target coefficients.
+            k (int): Number of neighbours.
+            max_distance (float, optional): Ignore entries farther than this.
+
+        Returns:
+            List[Tuple[float, Dict[str, Any]]]: (distance, entry) pairs, closest first.
+        """
+        index = self._load_index(purpose, equation, architecture_key(model))
+        candidates = [(self._distance(coefficients, entry['coefficients']), entry) for entry in index]
+        candidates = [(d, e) for d, e in candidates
+                      if math.isfinite(d) and (max_distance is None or d <= max_distance)]
+        candidates.sort(key=lambda pair: pair[0])
+        return candidates[:k]
+
+    def warm_start(self, model: nn.Module, purpose: str, equation: str,
+                   coefficients: Dict[str, float], freeze: int = 0,
+                   max_distance: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Load the closest stored weights into a model.
+
+        Args:
+            model (nn.Module): Freshly built model to initialize in place.
+            purpose (str): PINN purpose.
+            equation (str): Equation type.
+            coefficients (Dict[str, float]): Target coefficients.
+            freeze (int): Number of leading linear layers to freeze after loading.
+            max_distance (float, optional): Only warm-start from entries within this distance.
+
+        Returns:
+            Optional[Dict[str, Any]]: The entry used (with its 'distance'), or None if nothing matched.
+        """
+        matches = self.nearest(model, purpose, equation, coefficients, 1, max_distance)
+        if not matches:
+            self.logger.info(f"No warm start available for {purpose}/{equation} at {coefficients}")
+            return None
+
+        distance, entry = matches[0]
+        group_dir = self._group_dir(purpose, equation, architecture_key(model))
+        device = next(model.parameters()).device
+        model.load_state_dict(torch.load(group_dir / entry['weights'], map_location=device))
+
+        frozen = freeze_layers(model, freeze) if freeze > 0 else []
+        self.logger.info(
+            f"Warm start from {entry['coefficients']} (distance {distance:.3f}), frozen layers: {frozen}"
+        )
+        return dict(entry, distance=distance, frozen_layers=frozen)
@@ -8,10 +8,15 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable
 import math
+import copy
+import functools
+
+from torch.func import functional_call, stack_module_state, vmap
 
 from utils.loggers import get_general_logger
+from utils.physics import BoundaryConditions, get_boundary_condition, get_initial_condition
 
 
 class MLP(nn.Module):
@@ -103,6 +108,101 @@ class MLP(nn.Module):
         return self.network(x)
 
 
+class StackedMLP(nn.Module):
+    """Several identically shaped MLPs evaluated as one batched network.
+
+    Layer weights of all networks are kept in stacked tensors of shape
+    (num_networks, in, out), so one forward pass is a chain of batched
+    matmuls (``baddbmm``) instead of a Python loop over modules.
+    """
+
+    def __init__(self, num_networks: int, input_dim: int, output_dim: int, hidden_dims: List[int],
+                 activation: str = "tanh"):
+        """Initialize the stacked MLP.
+
+        Args:
+            num_networks (int): Number of networks.
+            input_dim (int): Input dimension.
+            output_dim (int): Output dimension.
+            hidden_dims (List[int]): Hidden layer dimensions.
+            activation (str): Activation function for hidden layers.
+        """
+        super(StackedMLP, self).__init__()
+
+        self.num_networks = num_networks
+        self.input_dim = input_dim
+        self.output_dim = output_dim
+        self.hidden_dims = hidden_dims
+        self.activation_name = activation
+        self.activation_fn = self._get_activation(activation)
+
+        dims = [input_dim] + list(hidden_dims) + [output_dim]
+        self.weights = nn.ParameterList()
+        self.biases = nn.ParameterList()
+        for fan_in, fan_out in zip(dims[:-1], dims[1:]):
+            # Xavier normal per network, as in MLP
+            std = math.sqrt(2.0 / (fan_in + fan_out))
+            self.weights.append(nn.Parameter(torch.randn(num_networks, fan_in, fan_out) * std))
+            self.biases.append(nn.Parameter(torch.zeros(num_networks, 1, fan_out)))
+
+    def _get_activation(self, activation: str) -> nn.Module:
+        """Get activation function."""
+        if activation.lower() == "tanh":
+            return nn.Tanh()
+        elif activation.lower() == "relu":
+            return nn.ReLU()
+        elif activation.lower() == "sigmoid":
+            return nn.Sigmoid()
+        elif activation.lower() == "swish":
+            return nn.SiLU()
+        elif activation.lower() == "gelu":
+            return nn.GELU()
+        else:
+            raise ValueError(f"Unsupported activation: {activation}")
+
+    @classmethod
+    def from_mlps(cls, mlps: List[MLP]) -> 'StackedMLP':
+        """Stack existing MLPs (same shape, linear output, no dropout).
+
+        Args:
+            mlps (List[MLP]): Networks to stack.
+
+        Returns:
+            StackedMLP: Stacked copy of the networks.
+        """
+        first = mlps[0]
+        stacked = cls(len(mlps), first.input_dim, first.output_dim, first.hidden_dims, first.activation_name)
+        with torch.no_grad():
+            for index, mlp in enumerate(mlps):
+                if mlp.dropout > 0 or mlp.output_activation_name.lower() != "linear":
+                    raise ValueError("Only MLPs without dropout and with a linear output can be stacked")
+                layers = [m for m in mlp.network if isinstance(m, nn.Linear)]
+                if len(layers) != len(stacked.weights):
+                    raise ValueError("All MLPs must have the same architecture")
+                for weight, bias, layer in zip(stacked.weights, stacked.biases, layers):
+                    weight[index].copy_(layer.weight.t())
+                    bias[index, 0].copy_(layer.bias)
+        return stacked
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass of all networks.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., input_dim) shared by all networks.
+
+        Returns:
+            torch.Tensor: Outputs of shape (num_networks, ..., output_dim).
+        """
+        shape = x.shape[:-1]
+        h = x.reshape(1, -1, self.input_dim).expand(self.num_networks, -1, -1)
+        last = len(self.weights) - 1
+        for index, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            h = torch.baddbmm(bias, h, weight)
+            if index < last:
+                h = self.activation_fn(h)
+        return h.reshape((self.num_networks,) + shape + (self.output_dim,))
+
+
 class FourierFeatureMLP(nn.Module):
     """MLP with Fourier feature embedding for better approximation of high-frequency functions."""
 
@@ -151,6 +251,180 @@ class FourierFeatureMLP(nn.Module):
         return self.mlp(fourier_features)
 
 
+class HashGridEncoding(nn.Module):
+    """Multiresolution hash-grid encoding for 1-3D inputs.
+
+    Level l covers the normalized domain with a grid of resolution
+    N_l = floor(N_min * b^l), growing geometrically from ``base_resolution``
+    to ``finest_resolution``. Every level stores trainable feature vectors in
+    a table of at most 2^``log2_table_size`` entries: coarse levels get a
+    dense table of exactly their (N_l + 1)^D vertices, finer ones are indexed
+    through a spatial hash. A point's encoding
+    concatenates, over the levels, the interpolation of the features at the
+    2^D corners of its grid cell. All levels and corners are gathered in one
+    vectorized lookup. Multilinear interpolation has vanishing second
+    derivatives inside a cell, so ``smooth=True`` interpolates with quintic
+    smoothstep weights instead, which are twice continuously differentiable.
+    """
+
+    # Spatial hash primes per input axis (Teschner et al.)
+    HASH_PRIMES = (1, 2654435761, 805459861)
+
+    def __init__(self, input_dim: int = 2, num_levels: int = 8, features_per_level: int = 2,
+                 log2_table_size: int = 15, base_resolution: int = 4, finest_resolution: int = 64,
+                 bounds: Optional[List[Tuple[float, float]]] = None, smooth: bool = True):
+        """Initialize the hash-grid encoding.
+
+        Args:
+            input_dim (int): Input dimension (1 to 3).
+            num_levels (int): Number of resolution levels.
+            features_per_level (int): Feature dimension per level.
+            log2_table_size (int): Log2 of the table size per level.
+            base_resolution (int): Coarsest grid resolution.
+            finest_resolution (int): Finest grid resolution.
+            bounds (List[Tuple[float, float]], optional): Input range per axis (default [0, 1]).
+            smooth (bool): Interpolate with smoothstep weights (C2) instead of multilinearly.
+        """
+        super(HashGridEncoding, self).__init__()
+
+        if not 1 <= input_dim <= 3:
+            raise ValueError(f"Hash-grid encoding supports 1 to 3 input dimensions, got {input_dim}")
+
+        self.input_dim = input_dim
+        self.num_levels = num_levels
+        self.features_per_level = features_per_level
+        self.table_size = 2**log2_table_size
+        self.smooth = smooth
+        self.output_dim = num_levels * features_per_level
+
+        growth = math.exp((math.log(finest_resolution) - math.log(base_resolution)) / max(num_levels - 1, 1))
+        resolutions = torch.tensor([math.floor(base_resolution * growth**level) for level in range(num_levels)])
+        # Levels whose (N + 1)^D vertices fit into the table are indexed without hashing
+        dense = (resolutions + 1)**input_dim <= self.table_size
+        strides = torch.stack([(resolutions + 1)**axis for axis in range(input_dim)], dim=1)
+        level_sizes = torch.where(dense, (resolutions + 1)**input_dim, torch.full_like(resolutions, self.table_size))
+
+        if bounds is None:
+            bounds = [(0.0, 1.0)] * input_dim
+        bounds = torch.tensor(bounds, dtype=torch.float32)
+
+        self.register_buffer('resolutions', resolutions)
+        self.register_buffer('dense', dense)
+        self.register_buffer('strides', strides)
+        self.register_buffer('primes', torch.tensor(self.HASH_PRIMES[:input_dim]))
+        self.register_buffer('corners', torch.tensor(
+            [[(corner >> axis) & 1 for axis in range(input_dim)] for corner in range(2**input_dim)]
+        ))
+        self.register_buffer('level_offsets', torch.cumsum(level_sizes, dim=0) - level_sizes)
+        self.register_buffer('lower', bounds[:, 0])
+        self.register_buffer('upper', bounds[:, 1])
+
+        self.tables = nn.Parameter(
+            torch.empty(int(level_sizes.sum()), features_per_level).uniform_(-1e-4, 1e-4)
+        )
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Encode inputs.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., input_dim).
+
+        Returns:
+            torch.Tensor: Encoding of shape (..., num_levels * features_per_level).
+        """
+        shape = x.shape[:-1]
+        x = x.reshape(-1, self.input_dim)
+        normalized = ((x - self.lower) / (self.upper - self.lower)).clamp(0.0, 1.0)
+
+        # (n, L, D) grid coordinates, cell origins and local coordinates
+        scaled = normalized.unsqueeze(1) * self.resolutions.to(x.dtype).unsqueeze(-1)
+        origin = torch.floor(scaled).detach().clamp_max(self.resolutions.unsqueeze(-1) - 1)
+        local = scaled - origin
+        if self.smooth:
+            local = local**3 * (10.0 - 15.0 * local + 6.0 * local**2)
+
+        # (n, L, 2^D, D) integer corner coordinates
+        vertices = origin.long().unsqueeze(2) + self.corners
+        dense_index = torch.sum(vertices * self.strides.unsqueeze(1), dim=-1)
+        hashed = vertices[..., 0] * self.primes[0]
+        for axis in range(1, self.input_dim):
+            hashed = torch.bitwise_xor(hashed, vertices[..., axis] * self.primes[axis])
+        index = torch.where(self.dense.unsqueeze(-1), dense_index, hashed) & (self.table_size - 1)
+        features = self.tables[index + self.level_offsets.unsqueeze(-1)]
+
+        # (n, L, 2^D) interpolation weights: product of w or 1 - w per axis, multiplied
+        # out explicitly since the double backward of torch.prod is expensive
+        corners = self.corners.to(x.dtype)
+        weights = None
+        for axis in range(self.input_dim):
+            w = local[..., axis:axis + 1]
+            factor = corners[:, axis] * w + (1.0 - corners[:, axis]) * (1.0 - w)
+            weights = factor if weights is None else weights * factor
+
+        encoding = torch.einsum('nlc,nlcf->nlf', weights, features)
+        return encoding.reshape(shape + (self.output_dim,))
+
+
+class HashGridPINN(nn.Module):
+    """PINN with a multiresolution hash-grid encoding and a small MLP head.
+
+    The encoding tables carry the fine-scale detail, so a head of one or two
+    narrow layers suffices. Table entries are only constrained near training
+    points, so collocation points should be dense relative to the finest
+    grid (or resampled during training).
+    """
+
+    def __init__(self, input_dim: int = 2, output_dim: int = 1, hidden_dims: List[int] = [64],
+                 activation: str = "tanh", output_activation: str = "linear", num_levels: int = 8,
+                 features_per_level: int = 2, log2_table_size: int = 15, base_resolution: int = 4,
+                 finest_resolution: int = 64, bounds: Optional[List[Tuple[float, float]]] = None,
+                 smooth: bool = True, include_inputs: bool = True):
+        """Initialize the hash-grid PINN.
+
+        Args:
+            input_dim (int): Input dimension (1 to 3).
+            output_dim (int): Output dimension.
+            hidden_dims (List[int]): Hidden layer dimensions of the head.
+            activation (str): Activation function of the head.
+            output_activation (str): Output activation of the head.
+            num_levels (int): Number of resolution levels.
+            features_per_level (int): Feature dimension per level.
+            log2_table_size (int): Log2 of the table size per level.
+            base_resolution (int): Coarsest grid resolution.
+            finest_resolution (int): Finest grid resolution.
+            bounds (List[Tuple[float, float]], optional): Input range per axis (default [0, 1]).
+            smooth (bool): Use the C2 smoothstep interpolation (needed for second derivatives).
+            include_inputs (bool): Also pass the raw inputs to the head, which gives it a smooth
+                global component.
+        """
+        super(HashGridPINN, self).__init__()
+
+        self.input_dim = input_dim
+        self.output_dim = output_dim
+        self.hidden_dims = hidden_dims
+        self.activation = activation
+        self.include_inputs = include_inputs
+
+        self.encoding = HashGridEncoding(input_dim, num_levels, features_per_level, log2_table_size,
+                                         base_resolution, finest_resolution, bounds, smooth)
+        head_dim = self.encoding.output_dim + (input_dim if include_inputs else 0)
+        self.head = MLP(head_dim, output_dim, hidden_dims, activation, output_activation)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Input tensor.
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        features = self.encoding(x)
+        if self.include_inputs:
+            features = torch.cat([x, features], dim=-1)
+        return self.head(features)
+
+
 class AdaptivePINN(nn.Module):
     """Adaptive PINN with dynamic loss weighting."""
 
@@ -239,11 +513,8 @@ class MultiScalePINN(nn.Module):
         self.activation = activation
         self.num_scales = num_scales
         
-        # Networks for different scales
-        self.scale_networks = nn.ModuleList([
-            MLP(input_dim, output_dim, hidden_dims, activation)
-            for _ in range(num_scales)
-        ])
+        # Networks for different scales, evaluated together as one stacked network
+        self.scale_networks = StackedMLP(num_scales, input_dim, output_dim, hidden_dims, activation)
         
         # Scale weights
         self.scale_weights = nn.Parameter(torch.ones(num_scales))
@@ -258,14 +529,22 @@ class MultiScalePINN(nn.Module):
         Returns:
             torch.Tensor: Output tensor.
         """
-        outputs = []
         weights = self.softmax(self.scale_weights)
-        
-        for i, network in enumerate(self.scale_networks):
-            output = network(x)
-            outputs.append(weights[i] * output)
-        
-        return torch.sum(torch.stack(outputs), dim=0)
+        outputs = self.scale_networks(x)
+        return torch.tensordot(weights, outputs, dims=1)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """Convert checkpoints saved with one MLP module per scale to stacked weights."""
+        legacy = f"{prefix}scale_networks.0.network.0.weight"
+        if legacy in state_dict:
+            for index in range(len(self.scale_networks.weights)):
+                layer = 2 * index
+                keys = [f"{prefix}scale_networks.{scale}.network.{layer}" for scale in range(self.num_scales)]
+                state_dict[f"{prefix}scale_networks.weights.{index}"] = torch.stack(
+                    [state_dict.pop(f"{key}.weight").t() for key in keys])
+                state_dict[f"{prefix}scale_networks.biases.{index}"] = torch.stack(
+                    [state_dict.pop(f"{key}.bias").unsqueeze(0) for key in keys])
+        super(MultiScalePINN, self)._load_from_state_dict(state_dict, prefix, *args, **kwargs)
 
     def predict(self, x: torch.Tensor, t: torch.Tensor) -> torch.Tensor:
         """Make predictions.
@@ -425,16 +704,1009 @@ class ResidualBlock(nn.Module):
         return self.activation(out + identity)
 
 
+def init_linear_weights(model: nn.Module, weight_init: str = "xavier") -> None:
+    """Initialize the linear layers of a model with a named scheme.
+
+    Weights follow the scheme and biases are set to zero.
+
+    Args:
+        model (nn.Module): Model to initialize in place.
+        weight_init (str): Initialization scheme ('xavier', 'normal', 'uniform', 'he').
+    """
+    initializers = {
+        'xavier': nn.init.xavier_uniform_,
+        'normal': lambda weight: nn.init.normal_(weight, mean=0.0, std=0.1),
+        'uniform': lambda weight: nn.init.uniform_(weight, -0.1, 0.1),
+        'he': nn.init.kaiming_uniform_
+    }
+    if weight_init.lower() not in initializers:
+        raise ValueError(f"Unsupported weight initialization: {weight_init}")
+
+    for module in model.modules():
+        if isinstance(module, nn.Linear):
+            initializers[weight_init.lower()](module.weight)
+            if module.bias is not None:
+                nn.init.zeros_(module.bias)
+
+
+def input_derivatives(fn: Callable[[torch.Tensor], torch.Tensor], points: torch.Tensor
+                      ) -> Tuple[torch.Tensor, torch.Tensor, Dict[Tuple[int, int], torch.Tensor]]:
+    """Exact first and second input derivatives of a pointwise feature map.
+
+    Uses forward mode, one pass per input direction (nested for second
+    derivatives), so the cost does not grow with the number of features.
+
+    Args:
+        fn (Callable): Map from (n, d) points to (n, k) features, row by row.
+        points (torch.Tensor): Points of shape (n, d).
+
+    Returns:
+        Tuple: Features (n, k), first derivatives (d, n, k) and second
+        derivatives keyed (i, j) with i <= j, each (n, k).
+    """
+    n_dims = points.shape[1]
+    directions = [torch.zeros_like(points).index_fill_(1, torch.tensor([i], device=points.device), 1.0)
+                  for i in range(n_dims)]
+
+    with torch.no_grad():
+        features = fn(points)
+        first = torch.stack([torch.func.jvp(fn, (points,), (e,))[1] for e in directions])
+
+        second = {}
+        for i in range(n_dims):
+            def directional(x, i=i):
+                return torch.func.jvp(fn, (x,), (directions[i],))[1]
+            for j in range(i, n_dims):
+                second[(i, j)] = torch.func.jvp(directional, (points,), (directions[j],))[1]
+
+    return features, first, second
+
+
+def split_frozen_trunk(model: nn.Module, num_frozen: int) -> Tuple[nn.Module, nn.Module]:
+    """Split a model into a trunk of leading hidden layers and a trainable head.
+
+    The returned modules share their layers with ``model``, so training the
+    head updates the original model.
+
+    Args:
+        model (nn.Module): MLP or ResNetPINN.
+        num_frozen (int): Number of leading hidden layers in the trunk (for a
+            ResNetPINN the input layer counts as the first, then one per residual block).
+
+    Returns:
+        Tuple[nn.Module, nn.Module]: Trunk and head.
+    """
+    if isinstance(model, MLP):
+        linear_positions = [i for i, layer in enumerate(model.network) if isinstance(layer, nn.Linear)]
+        if not 1 <= num_frozen < len(linear_positions):
+            raise ValueError(f"num_frozen must be between 1 and {len(linear_positions) - 1}")
+        # Trunk ends right before the next linear layer (after activation and dropout)
+        split = linear_positions[num_frozen]
+        return model.network[:split], model.network[split:]
+    elif isinstance(model, ResNetPINN):
+        if not 1 <= num_frozen <= len(model.residual_blocks):
+            raise ValueError(f"num_frozen must be between 1 and {len(model.residual_blocks)}")
+        trunk = nn.Sequential(model.input_layer, model.activation_fn,
+                              *model.residual_blocks[:num_frozen - 1])
+        head = nn.Sequential(*model.residual_blocks[num_frozen - 1:], model.output_layer)
+        return trunk, head
+    else:
+        raise ValueError(f"Unsupported model for trunk caching: {model.__class__.__name__}")
+
+
+class CachedTrunkPINN(nn.Module):
+    """Head-only view of a PINN whose leading layers are frozen.
+
+    The frozen trunk's features h and their first and second input
+    derivatives are computed once (forward-mode, one pass per direction) at a
+    fixed set of points. When the model is called on exactly those points the
+    trunk is replaced by its second-order Taylor expansion around them,
+
+        h(x) = h(x0) + J (x - x0) + 1/2 (x - x0)^T H (x - x0),
+
+    which has the same value and the same first and second derivatives at
+    x0. Autograd-based residuals up to second order are therefore exact while
+    only the head is evaluated. Any other input runs the full model.
+    """
+
+    def __init__(self, model: nn.Module, num_frozen: int):
+        """Initialize the cached-trunk view.
+
+        Args:
+            model (nn.Module): MLP or ResNetPINN to fine-tune.
+            num_frozen (int): Number of leading hidden layers to freeze and cache.
+        """
+        super(CachedTrunkPINN, self).__init__()
+
+        self.base_model = model
+        self.trunk, self.head = split_frozen_trunk(model, num_frozen)
+        self.num_frozen = num_frozen
+        self.input_dim = getattr(model, 'input_dim', 'Unknown')
+        self.output_dim = getattr(model, 'output_dim', 'Unknown')
+        self.hidden_dims = getattr(model, 'hidden_dims', 'Unknown')
+
+        for param in self.trunk.parameters():
+            param.requires_grad_(False)
+
+        self.cached_points = None
+        self.features = None
+        self.first_derivatives = None
+        self.second_derivatives = None
+
+    def cache(self, points: torch.Tensor) -> None:
+        """Compute and store trunk features and input derivatives at fixed points.
+
+        Args:
+            points (torch.Tensor): Points of shape (n, input_dim).
+        """
+        points = points.detach()
+        was_training = self.trunk.training
+        self.trunk.eval()
+        features, first, second = input_derivatives(self.trunk, points)
+        self.trunk.train(was_training)
+
+        self.cached_points = points
+        self.features = features
+        self.first_derivatives = first
+        self.second_derivatives = second
+
+    def clear_cache(self) -> None:
+        """Drop the cached features."""
+        self.cached_points = None
+        self.features = None
+        self.first_derivatives = None
+        self.second_derivatives = None
+
+    def trunk_features(self, x: torch.Tensor) -> torch.Tensor:
+        """Trunk features, from the cache when ``x`` holds the cached points.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (n, input_dim).
+
+        Returns:
+            torch.Tensor: Trunk features.
+        """
+        if (self.cached_points is None or x.shape != self.cached_points.shape or
+                not torch.equal(x.detach(), self.cached_points)):
+            return self.trunk(x)
+
+        # Zero-valued displacement that carries the gradient path to x
+        delta = x - self.cached_points
+        h = self.features
+        for i in range(x.shape[1]):
+            h = h + delta[:, i:i + 1] * self.first_derivatives[i]
+        for (i, j), hessian in self.second_derivatives.items():
+            factor = 0.5 if i == j else 1.0
+            h = h + factor * delta[:, i:i + 1] * delta[:, j:j + 1] * hessian
+        return h
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (n, input_dim).
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        return self.head(self.trunk_features(x))
+
+
+class ParametricPINN(nn.Module):
+    """PINN with equation coefficients as additional inputs, u(x, t; theta).
+
+    Inputs are laid out as ``[coordinates..., coefficients...]``. The
+    coefficients are rescaled to [-1, 1] over their ranges before entering the
+    network; coefficients whose range spans two or more decades are rescaled
+    in log space. One trained network serves every coefficient value in range.
+    """
+
+    def __init__(self, parameter_ranges: Dict[str, Tuple[float, float]], coordinate_dim: int = 2,
+                 output_dim: int = 1, hidden_dims: List[int] = [64, 64, 64, 64],
+                 activation: str = "tanh", output_activation: str = "linear",
+                 log_scale: Optional[Dict[str, bool]] = None):
+        """Initialize the parametric PINN.
+
+        Args:
+            parameter_ranges (Dict[str, Tuple[float, float]]): Coefficient name to (low, high).
+            coordinate_dim (int): Number of coordinate inputs (e.g. 2 for x, t).
+            output_dim (int): Output dimension.
+            hidden_dims (List[int]): List of hidden layer dimensions.
+            activation (str): Activation function for hidden layers.
+            output_activation (str): Activation function for output layer.
+            log_scale (Dict[str, bool], optional): Override log-space rescaling per coefficient.
+        """
+        super(ParametricPINN, self).__init__()
+
+        if len(parameter_ranges) == 0:
+            raise ValueError("ParametricPINN needs at least one coefficient range")
+
+        self.parameter_names = list(parameter_ranges.keys())
+        self.parameter_ranges = {name: tuple(float(v) for v in bounds)
+                                 for name, bounds in parameter_ranges.items()}
+        self.coordinate_dim = coordinate_dim
+        self.num_parameters = len(self.parameter_names)
+        self.input_dim = coordinate_dim + self.num_parameters
+        self.output_dim = output_dim
+        self.hidden_dims = hidden_dims
+
+        log_scale = log_scale or {}
+        use_log, lower, upper = [], [], []
+        for name in self.parameter_names:
+            low, high = self.parameter_ranges[name]
+            if high <= low:
+                raise ValueError(f"Invalid range for coefficient '{name}': {low} >= {high}")
+            is_log = log_scale.get(name, low > 0 and high / low >= 100.0)
+            use_log.append(is_log)
+            lower.append(math.log(low) if is_log else low)
+            upper.append(math.log(high) if is_log else high)
+
+        self.register_buffer('log_mask', torch.tensor(use_log, dtype=torch.bool))
+        self.register_buffer('scale_lower', torch.tensor(lower))
+        self.register_buffer('scale_upper', torch.tensor(upper))
+
+        self.network = MLP(self.input_dim, output_dim, hidden_dims, activation, output_activation)
+
+    def scale_parameters(self, theta: torch.Tensor) -> torch.Tensor:
+        """Rescale coefficient values to [-1, 1].
+
+        Args:
+            theta (torch.Tensor): Coefficients of shape (..., num_parameters).
+
+        Returns:
+            torch.Tensor: Rescaled coefficients.
+        """
+        theta = torch.where(self.log_mask, torch.log(theta.clamp_min(1e-30)), theta)
+        return 2.0 * (theta - self.scale_lower) / (self.scale_upper - self.scale_lower) - 1.0
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., coordinate_dim + num_parameters).
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        coordinates = x[..., :self.coordinate_dim]
+        theta = self.scale_parameters(x[..., self.coordinate_dim:])
+        return self.network(torch.cat([coordinates, theta], dim=-1))
+
+
+class HardConstraintPINN(nn.Module):
+    """PINN whose output satisfies Dirichlet boundary and initial conditions exactly.
+
+    On the domain [a, b] x [t0, T] the wrapped network N is combined as
+
+        u = G(x, t) + d_x(x) d_t(t) N(x, t),
+
+    with d_x = (x - a)(b - x) / (L/2)^2 and d_t = (t - t0) / (T - t0), which
+    vanish on the boundary and at t0. G interpolates the boundary values
+    between the two ends and matches the initial condition at t0:
+
+        G = u0(x) + (g(a, t) - g(a, t0)) (b - x) / L + (g(b, t) - g(b, t0)) (x - a) / L.
+
+    With only one of the conditions enforced the other distance factor is
+    dropped. When the boundary and initial data disagree at the corners, the
+    initial condition wins. Constrained point groups are listed in
+    ``hard_constraints`` so the trainer skips their loss terms.
+    """
+
+    def __init__(self, model: nn.Module, x_range: Tuple[float, float] = (0.0, 1.0),
+                 t_range: Tuple[float, float] = (0.0, 1.0),
+                 initial_condition: Optional[Callable[[torch.Tensor, torch.Tensor], torch.Tensor]] = None,
+                 boundary_value: Optional[Any] = None):
+        """Initialize the hard-constraint wrapper.
+
+        Args:
+            model (nn.Module): Network N taking [x, t, ...] inputs.
+            x_range (Tuple[float, float]): Spatial domain [a, b].
+            t_range (Tuple[float, float]): Temporal domain [t0, T].
+            initial_condition (Callable, optional): u0(x, t) to enforce at t0.
+            boundary_value (float or Callable, optional): Dirichlet value g(x, t) (or a constant)
+                to enforce at x = a and x = b.
+        """
+        super(HardConstraintPINN, self).__init__()
+
+        if initial_condition is None and boundary_value is None:
+            raise ValueError("HardConstraintPINN needs an initial condition or a boundary value")
+
+        self.base_model = model
+        self.x_range = tuple(float(v) for v in x_range)
+        self.t_range = tuple(float(v) for v in t_range)
+        self.initial_condition = initial_condition
+        if boundary_value is not None and not callable(boundary_value):
+            constant = float(boundary_value)
+            boundary_value = lambda x, t: torch.full_like(t, constant)
+        self.boundary_value = boundary_value
+
+        self.hard_constraints = tuple(
+            group for group, condition in (('boundary', boundary_value), ('initial', initial_condition))
+            if condition is not None
+        )
+        self.input_dim = getattr(model, 'input_dim', 'Unknown')
+        self.output_dim = getattr(model, 'output_dim', 'Unknown')
+        self.hidden_dims = getattr(model, 'hidden_dims', 'Unknown')
+
+    @classmethod
+    def from_specs(cls, model: nn.Module, x_range: Tuple[float, float] = (0.0, 1.0),
+                   t_range: Tuple[float, float] = (0.0, 1.0),
+                   ic_type: Optional[str] = None, ic_params: Optional[Dict[str, Any]] = None,
+                   bc_type: Optional[str] = 'dirichlet', boundary_value: Any = 0.0) -> 'HardConstraintPINN':
+        """Build the wrapper from initial and boundary condition specs.
+
+        Args:
+            model (nn.Module): Network N.
+            x_range (Tuple[float, float]): Spatial domain.
+            t_range (Tuple[float, float]): Temporal domain.
+            ic_type (str, optional): Initial condition type (see ``get_initial_condition``).
+            ic_params (Dict[str, Any], optional): Initial condition parameters.
+            bc_type (str, optional): Boundary condition type; only 'dirichlet' can be enforced (None to skip).
+            boundary_value (float or Callable): Dirichlet value g(x, t).
+
+        Returns:
+            HardConstraintPINN: Wrapped model.
+        """
+        initial_condition = None
+        if ic_type is not None:
+            initial_condition = functools.partial(get_initial_condition(ic_type), **(ic_params or {}))
+
+        dirichlet = None
+        if bc_type is not None:
+            if bc_type.lower() != 'dirichlet':
+                raise ValueError(f"Boundary condition cannot be enforced exactly: {bc_type}")
+            if callable(boundary_value):
+                dirichlet = functools.partial(BoundaryConditions.dirichlet_bc, boundary_value=boundary_value)
+            else:
+                dirichlet = boundary_value
+
+        return cls(model, x_range, t_range, initial_condition, dirichlet)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., input_dim) with x and t in the first two columns.
+
+        Returns:
+            torch.Tensor: Constrained output.
+        """
+        a, b = self.x_range
+        t0, t1 = self.t_range
+        xs = x[..., 0:1]
+        ts = x[..., 1:2]
+        length = b - a
+
+        distance = 1.0
+        particular = 0.0
+        if self.initial_condition is not None:
+            distance = distance * (ts - t0) / (t1 - t0)
+            particular = self.initial_condition(xs, torch.full_like(ts, t0))
+        if self.boundary_value is not None:
+            distance = distance * (xs - a) * (b - xs) / (0.5 * length) ** 2
+            left = self.boundary_value(torch.full_like(xs, a), ts)
+            right = self.boundary_value(torch.full_like(xs, b), ts)
+            if self.initial_condition is not None:
+                # Only the change since t0 is added on top of the initial condition
+                left = left - self.boundary_value(torch.full_like(xs, a), torch.full_like(ts, t0))
+                right = right - self.boundary_value(torch.full_like(xs, b), torch.full_like(ts, t0))
+            particular = particular + left * (b - xs) / length + right * (xs - a) / length
+
+        return particular + distance * self.base_model(x)
+
+
+class PeriodicPINN(nn.Module):
+    """PINN that is exactly periodic in space through a Fourier input embedding.
+
+    The wrapped network takes the embedded inputs (see ``PeriodicEmbedding``),
+    so no boundary samples or boundary loss are needed: the boundary group is
+    listed in ``hard_constraints`` and skipped by the trainer.
+    """
+
+    def __init__(self, embedding: nn.Module, model: nn.Module):
+        """Initialize the periodic PINN.
+
+        Args:
+            embedding (nn.Module): PeriodicEmbedding, e.g. from ``get_boundary_condition('periodic')``.
+            model (nn.Module): Network taking ``embedding.output_dim`` inputs.
+        """
+        super(PeriodicPINN, self).__init__()
+
+        self.embedding = embedding
+        self.base_model = model
+        self.hard_constraints = ('boundary',)
+        self.input_dim = embedding.input_dim
+        self.output_dim = getattr(model, 'output_dim', 'Unknown')
+        self.hidden_dims = getattr(model, 'hidden_dims', 'Unknown')
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (..., input_dim).
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        return self.base_model(self.embedding(x))
+
+
+class TimeMarchingPINN(nn.Module):
+    """Piecewise-in-time PINN assembled from per-window models.
+
+    Model j covers [t_j, t_{j+1}); points are routed by their time column, so
+    the composite behaves like a single model over the whole horizon.
+    """
+
+    def __init__(self, models: List[nn.Module], time_edges: List[float]):
+        """Initialize the time-marching PINN.
+
+        Args:
+            models (List[nn.Module]): One model per time window.
+            time_edges (List[float]): Window edges t_0 < ... < t_M (M = number of models).
+        """
+        super(TimeMarchingPINN, self).__init__()
+
+        if len(time_edges) != len(models) + 1:
+            raise ValueError("TimeMarchingPINN needs one more time edge than models")
+
+        self.models = nn.ModuleList(models)
+        self.register_buffer('time_edges', torch.tensor([float(t) for t in time_edges]))
+        self.input_dim = getattr(models[0], 'input_dim', 'Unknown')
+        self.output_dim = getattr(models[0], 'output_dim', 'Unknown')
+        self.hidden_dims = getattr(models[0], 'hidden_dims', 'Unknown')
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., input_dim) with t in the second column.
+
+        Returns:
+            torch.Tensor: Output of the model owning each point's time window.
+        """
+        window = torch.bucketize(x[..., 1].detach(), self.time_edges[1:-1].to(x.dtype), right=True)
+        output = None
+        for j, model in enumerate(self.models):
+            selected = window == j
+            if not selected.any():
+                continue
+            prediction = model(x[selected])
+            if output is None:
+                output = prediction.new_zeros(x.shape[:-1] + prediction.shape[-1:])
+            output = output.index_put((selected,), prediction)
+        return output
+
+
+def partition_domain(x_range: Tuple[float, float], t_range: Tuple[float, float], num_x: int, num_t: int,
+                     overlap: float = 0.1) -> List[Dict[str, Tuple[float, float]]]:
+    """Split a space-time box into a grid of overlapping subdomains.
+
+    Args:
+        x_range (Tuple[float, float]): Spatial domain.
+        t_range (Tuple[float, float]): Temporal domain.
+        num_x (int): Subdomains along x.
+        num_t (int): Subdomains along t.
+        overlap (float): Overlap on each side as a fraction of the subdomain width.
+
+    Returns:
+        List[Dict[str, Tuple[float, float]]]: Per subdomain the 'core' box (non-overlapping,
+        as ((x_lo, t_lo), (x_hi, t_hi))) and the 'support' box (core grown by the overlap,
+        clipped to the domain).
+    """
+    x_edges = np.linspace(x_range[0], x_range[1], num_x + 1)
+    t_edges = np.linspace(t_range[0], t_range[1], num_t + 1)
+
+    subdomains = []
+    for j in range(num_t):
+        for i in range(num_x):
+            lower = (x_edges[i], t_edges[j])
+            upper = (x_edges[i + 1], t_edges[j + 1])
+            margin = (overlap * (upper[0] - lower[0]), overlap * (upper[1] - lower[1]))
+            support_lower = (max(lower[0] - margin[0], x_range[0]), max(lower[1] - margin[1], t_range[0]))
+            support_upper = (min(upper[0] + margin[0], x_range[1]), min(upper[1] + margin[1], t_range[1]))
+            subdomains.append({
+                'core': (tuple(float(v) for v in lower), tuple(float(v) for v in upper)),
+                'support': (tuple(float(v) for v in support_lower), tuple(float(v) for v in support_upper))
+            })
+    return subdomains
+
+
+class SubdomainNetwork(nn.Module):
+    """Small MLP on one subdomain, with inputs rescaled from its box to [-1, 1]."""
+
+    def __init__(self, lower: Tuple[float, ...], upper: Tuple[float, ...], output_dim: int = 1,
+                 hidden_dims: List[int] = [20, 20], activation: str = "tanh"):
+        """Initialize the subdomain network.
+
+        Args:
+            lower (Tuple[float, ...]): Lower corner of the subdomain.
+            upper (Tuple[float, ...]): Upper corner of the subdomain.
+            output_dim (int): Output dimension.
+            hidden_dims (List[int]): Hidden layer dimensions.
+            activation (str): Activation function.
+        """
+        super(SubdomainNetwork, self).__init__()
+
+        self.register_buffer('lower', torch.tensor(lower, dtype=torch.float32))
+        self.register_buffer('upper', torch.tensor(upper, dtype=torch.float32))
+        self.input_dim = len(lower)
+        self.output_dim = output_dim
+        self.hidden_dims = hidden_dims
+        self.network = MLP(len(lower), output_dim, hidden_dims, activation)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (n, input_dim).
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        return self.network(2.0 * (x - self.lower) / (self.upper - self.lower) - 1.0)
+
+
+class DomainDecompositionPINN(nn.Module):
+    """PINN built from small networks on overlapping subdomains.
+
+    With ``coupling='window'`` (FBPINN) the networks are blended by a smooth
+    partition of unity: each subdomain has a window that is 1 inside its
+    core away from the overlaps, ramps smoothly to 0 at its support edge (no
+    ramp on the domain boundary), and is normalized to sum to one. With ``coupling='interface'``
+    (XPINN) every point belongs to the subdomain whose core box contains it,
+    and the subdomains are coupled through an interface loss during training.
+    Networks are only evaluated on points inside their support.
+    """
+
+    def __init__(self, x_range: Tuple[float, float] = (0.0, 1.0), t_range: Tuple[float, float] = (0.0, 1.0),
+                 num_x: int = 2, num_t: int = 2, overlap: float = 0.1, output_dim: int = 1,
+                 hidden_dims: List[int] = [20, 20], activation: str = "tanh", coupling: str = "window"):
+        """Initialize the domain-decomposition PINN.
+
+        Args:
+            x_range (Tuple[float, float]): Spatial domain.
+            t_range (Tuple[float, float]): Temporal domain.
+            num_x (int): Subdomains along x.
+            num_t (int): Subdomains along t.
+            overlap (float): Overlap on each side as a fraction of the subdomain width.
+            output_dim (int): Output dimension.
+            hidden_dims (List[int]): Hidden layer dimensions of every subdomain network.
+            activation (str): Activation function.
+            coupling (str): 'window' (FBPINN) or 'interface' (XPINN).
+        """
+        super(DomainDecompositionPINN, self).__init__()
+
+        if coupling not in ('window', 'interface'):
+            raise ValueError(f"Unsupported coupling: {coupling}")
+
+        self.coupling = coupling
+        self.x_range = tuple(float(v) for v in x_range)
+        self.t_range = tuple(float(v) for v in t_range)
+        self.subdomains = partition_domain(x_range, t_range, num_x, num_t, overlap)
+        self.num_subdomains = len(self.subdomains)
+        self.input_dim = 2
+        self.output_dim = output_dim
+        self.hidden_dims = hidden_dims
+
+        boxes = [s['support'] if coupling == 'window' else s['core'] for s in self.subdomains]
+        self.networks = nn.ModuleList([
+            SubdomainNetwork(lower, upper, output_dim, hidden_dims, activation) for lower, upper in boxes
+        ])
+
+        support = torch.tensor([s['support'] for s in self.subdomains])
+        core = torch.tensor([s['core'] for s in self.subdomains])
+        self.register_buffer('support_lower', support[:, 0])
+        self.register_buffer('support_upper', support[:, 1])
+        self.register_buffer('core_lower', core[:, 0])
+        self.register_buffer('core_upper', core[:, 1])
+
+        # Window ramps run across the overlap, from the support edge to the far side of the
+        # core edge; a zero width marks a face on the domain boundary (no ramp)
+        self.register_buffer('ramp_lower', self.support_lower.clone())
+        self.register_buffer('ramp_upper', self.support_upper.clone())
+        self.register_buffer('ramp_lower_width', 2.0 * (self.core_lower - self.support_lower))
+        self.register_buffer('ramp_upper_width', 2.0 * (self.support_upper - self.core_upper))
+
+    def inside(self, x: torch.Tensor, lower: torch.Tensor, upper: torch.Tensor, index: int) -> torch.Tensor:
+        """Mask of points inside box ``index`` (upper faces included on the domain boundary)."""
+        domain_upper = torch.tensor([self.x_range[1], self.t_range[1]], dtype=x.dtype, device=x.device)
+        low = lower[index].to(x.dtype)
+        high = upper[index].to(x.dtype)
+        below = (x < high) | ((x <= high) & (high >= domain_upper))
+        return ((x >= low) & below).all(dim=-1)
+
+    @staticmethod
+    def _ramp(distance: torch.Tensor, width: torch.Tensor) -> torch.Tensor:
+        """Smoothstep from 0 to 1 over ``width`` (C2, constant outside; 1 where width is 0)."""
+        s = (distance / width.clamp_min(1e-12)).clamp(0.0, 1.0)
+        ramp = s**3 * (10.0 - 15.0 * s + 6.0 * s**2)
+        return torch.where(width > 0, ramp, torch.ones_like(ramp))
+
+    def windows(self, x: torch.Tensor) -> torch.Tensor:
+        """Normalized partition-of-unity weights.
+
+        Each window is a product of C2 smoothstep ramps over the overlaps, so
+        it vanishes outside its support together with its first and second
+        derivatives.
+
+        Args:
+            x (torch.Tensor): Points of shape (n, 2).
+
+        Returns:
+            torch.Tensor: Weights of shape (n, num_subdomains), summing to one.
+        """
+        points = x.unsqueeze(1)
+        lower = self._ramp(points - self.ramp_lower.to(x.dtype), self.ramp_lower_width.to(x.dtype))
+        upper = self._ramp(self.ramp_upper.to(x.dtype) - points, self.ramp_upper_width.to(x.dtype))
+        weights = torch.prod(lower * upper, dim=-1)
+        return weights / weights.sum(dim=1, keepdim=True).clamp_min(1e-12)
+
+    def owner(self, x: torch.Tensor) -> torch.Tensor:
+        """Index of the subdomain whose core box contains each point.
+
+        Args:
+            x (torch.Tensor): Points of shape (n, 2).
+
+        Returns:
+            torch.Tensor: Subdomain indices of shape (n,).
+        """
+        inside = torch.stack([self.inside(x, self.core_lower, self.core_upper, i)
+                              for i in range(self.num_subdomains)], dim=1)
+        return torch.argmax(inside.to(torch.int8), dim=1)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., 2).
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        shape = x.shape[:-1]
+        x = x.reshape(-1, x.shape[-1])
+        output = x.new_zeros(x.shape[0], self.output_dim)
+
+        if self.coupling == 'window':
+            weights = self.windows(x)
+            for i, network in enumerate(self.networks):
+                selected = weights[:, i].detach() > 0
+                if selected.any():
+                    contribution = weights[selected, i:i + 1] * network(x[selected])
+                    output = output.index_put((selected,), contribution, accumulate=True)
+        else:
+            owner = self.owner(x.detach())
+            for i, network in enumerate(self.networks):
+                selected = owner == i
+                if selected.any():
+                    output = output.index_put((selected,), network(x[selected]))
+
+        return output.reshape(shape + (self.output_dim,))
+
+
+class SeparablePINN(nn.Module):
+    """Separable PINN for tensor-product domains.
+
+    Every input axis d has its own network f_d mapping a scalar coordinate to
+    ``rank`` features per output, and the solution is the low-rank product
+    u(x_1, ..., x_D) = sum_r prod_d f_d(x_d)_r. On a grid of n_1 x ... x n_D
+    points the axis networks are evaluated only n_1 + ... + n_D times and
+    combined by an outer product, and derivatives along an axis come from a
+    forward-mode pass through that axis' one-dimensional network.
+    """
+
+    def __init__(self, input_dim: int = 2, output_dim: int = 1, hidden_dims: List[int] = [64, 64],
+                 rank: int = 32, activation: str = "tanh", output_activation: str = "linear"):
+        """Initialize the separable PINN.
+
+        Args:
+            input_dim (int): Number of input axes.
+            output_dim (int): Output dimension.
+            hidden_dims (List[int]): Hidden layer dimensions of every axis network.
+            rank (int): Number of separable features per output.
+            activation (str): Activation function.
+            output_activation (str): Must be 'linear' (the product forms the output).
+        """
+        super(SeparablePINN, self).__init__()
+
+        if output_activation.lower() != "linear":
+            raise ValueError("SeparablePINN only supports a linear output activation")
+
+        self.input_dim = input_dim
+        self.output_dim = output_dim
+        self.hidden_dims = hidden_dims
+        self.rank = rank
+        self.activation = activation
+
+        self.axis_networks = nn.ModuleList([
+            MLP(1, output_dim * rank, hidden_dims, activation) for _ in range(input_dim)
+        ])
+
+    def axis_features(self, axis: int, coordinates: torch.Tensor) -> torch.Tensor:
+        """Evaluate the network of one axis.
+
+        Args:
+            axis (int): Input axis.
+            coordinates (torch.Tensor): Coordinates along the axis of shape (n,) or (n, 1).
+
+        Returns:
+            torch.Tensor: Features of shape (n, output_dim, rank).
+        """
+        features = self.axis_networks[axis](coordinates.reshape(-1, 1))
+        return features.reshape(-1, self.output_dim, self.rank)
+
+    def axis_derivatives(self, axis: int, coordinates: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Features of one axis and their first and second derivatives.
+
+        Each point only depends on its own coordinate, so a forward-mode pass
+        with a tangent of ones gives all pointwise derivatives at once.
+
+        Args:
+            axis (int): Input axis.
+            coordinates (torch.Tensor): Coordinates along the axis of shape (n,) or (n, 1).
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor, torch.Tensor]: f, df and d2f, each (n, output_dim, rank).
+        """
+        coordinates = coordinates.reshape(-1, 1)
+        tangent = torch.ones_like(coordinates)
+
+        def first(a):
+            return torch.func.jvp(functools.partial(self.axis_features, axis), (a,), (tangent,))
+
+        (features, first_derivative), (_, second_derivative) = torch.func.jvp(first, (coordinates,), (tangent,))
+        return features, first_derivative, second_derivative
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass at scattered points.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., input_dim).
+
+        Returns:
+            torch.Tensor: Output tensor.
+        """
+        shape = x.shape[:-1]
+        x = x.reshape(-1, self.input_dim)
+        product = self.axis_features(0, x[:, 0])
+        for axis in range(1, self.input_dim):
+            product = product * self.axis_features(axis, x[:, axis])
+        return product.sum(dim=-1).reshape(shape + (self.output_dim,))
+
+    def forward_grid(self, axes: List[torch.Tensor]) -> torch.Tensor:
+        """Evaluate on the tensor-product grid of per-axis coordinates.
+
+        Args:
+            axes (List[torch.Tensor]): Coordinates per axis, each of shape (n_d,) or (n_d, 1).
+
+        Returns:
+            torch.Tensor: Output of shape (n_1, ..., n_D, output_dim) ('ij' indexing).
+        """
+        if len(axes) != self.input_dim:
+            raise ValueError(f"Expected {self.input_dim} axes, got {len(axes)}")
+
+        return self.combine([self.axis_features(axis, coordinates) for axis, coordinates in enumerate(axes)])
+
+    @staticmethod
+    def combine(features: List[torch.Tensor]) -> torch.Tensor:
+        """Outer product of per-axis features, summed over the rank.
+
+        Args:
+            features (List[torch.Tensor]): Features per axis, each (n_d, output_dim, rank).
+
+        Returns:
+            torch.Tensor: Tensor of shape (n_1, ..., n_D, output_dim).
+        """
+        if len(features) == 2:
+            # Contract the rank directly instead of materializing the product
+            return torch.einsum('xor,tor->xto', features[0], features[1])
+
+        product = features[0]
+        for axis_features in features[1:]:
+            product = product.unsqueeze(-3) * axis_features.reshape(
+                (1,) * (product.dim() - 2) + axis_features.shape)
+        return product.sum(dim=-1)
+
+    def grid_derivatives(self, x_axis: torch.Tensor, t_axis: torch.Tensor) -> Dict[str, torch.Tensor]:
+        """Solution and derivatives up to second order on an (x, t) grid.
+
+        Args:
+            x_axis (torch.Tensor): Spatial coordinates of shape (n_x,) or (n_x, 1).
+            t_axis (torch.Tensor): Temporal coordinates of shape (n_t,) or (n_t, 1).
+
+        Returns:
+            Dict[str, torch.Tensor]: 'u', 'u_x', 'u_t', 'u_xx', 'u_xt', 'u_tt',
+            each of shape (n_x, n_t, output_dim).
+        """
+        if self.input_dim != 2:
+            raise ValueError("Grid derivatives are defined for (x, t) inputs")
+
+        f, f_x, f_xx = self.axis_derivatives(0, x_axis)
+        g, g_t, g_tt = self.axis_derivatives(1, t_axis)
+        return {
+            'u': self.combine([f, g]),
+            'u_x': self.combine([f_x, g]),
+            'u_t': self.combine([f, g_t]),
+            'u_xx': self.combine([f_xx, g]),
+            'u_xt': self.combine([f_x, g_t]),
+            'u_tt': self.combine([f, g_tt])
+        }
+
+
+class StackedEnsemble(nn.Module):
+    """Ensemble of identically shaped networks held as stacked parameters.
+
+    The member parameters are stacked along a leading member axis with
+    ``torch.func.stack_module_state`` and all members are evaluated together
+    with ``vmap`` over ``functional_call``, i.e. one wide forward pass instead
+    of a Python loop over models.
+    """
+
+    def __init__(self, models: List[nn.Module]):
+        """Initialize the stacked ensemble.
+
+        Args:
+            models (List[nn.Module]): Members with identical architecture.
+        """
+        super(StackedEnsemble, self).__init__()
+
+        if len(models) == 0:
+            raise ValueError("Ensemble needs at least one member")
+
+        self.num_members = len(models)
+        self.input_dim = getattr(models[0], 'input_dim', 'Unknown')
+        self.output_dim = getattr(models[0], 'output_dim', 'Unknown')
+        self.hidden_dims = getattr(models[0], 'hidden_dims', 'Unknown')
+
+        params, buffers = stack_module_state(models)
+
+        # Parameter names may contain dots, which nn.Module attributes cannot
+        self._param_names = list(params.keys())
+        self._buffer_names = list(buffers.keys())
+        for name, value in params.items():
+            self.register_parameter(self._attribute_name(name), nn.Parameter(value.detach()))
+        for name, value in buffers.items():
+            self.register_buffer(self._attribute_name(name), value.detach())
+
+        # Stateless copy of a member used as the functional template; kept out
+        # of the module tree so it is not moved, saved or counted
+        object.__setattr__(self, '_template', copy.deepcopy(models[0]).to('meta'))
+
+    @staticmethod
+    def _attribute_name(name: str) -> str:
+        """Map a member parameter name to an attribute name."""
+        return "member__" + name.replace('.', '__')
+
+    def stacked_parameters(self) -> Dict[str, torch.Tensor]:
+        """Get the stacked member parameters keyed by member parameter name.
+
+        Returns:
+            Dict[str, torch.Tensor]: Tensors of shape (num_members, ...).
+        """
+        return {name: getattr(self, self._attribute_name(name)) for name in self._param_names}
+
+    def stacked_buffers(self) -> Dict[str, torch.Tensor]:
+        """Get the stacked member buffers keyed by member buffer name.
+
+        Returns:
+            Dict[str, torch.Tensor]: Tensors of shape (num_members, ...).
+        """
+        return {name: getattr(self, self._attribute_name(name)) for name in self._buffer_names}
+
+    def functional_forward(self, params: Dict[str, torch.Tensor], x: torch.Tensor,
+                           buffers: Optional[Dict[str, torch.Tensor]] = None) -> torch.Tensor:
+        """Evaluate all members for given stacked parameters.
+
+        Args:
+            params (Dict[str, torch.Tensor]): Stacked parameters.
+            x (torch.Tensor): Inputs of shape (n, input_dim) shared by all members,
+                or (num_members, n, input_dim) with per-member inputs.
+            buffers (Dict[str, torch.Tensor], optional): Stacked buffers.
+
+        Returns:
+            torch.Tensor: Outputs of shape (num_members, n, output_dim).
+        """
+        if buffers is None:
+            buffers = self.stacked_buffers()
+        template = self._template
+
+        def member_forward(member_params, member_buffers, inputs):
+            return functional_call(template, (member_params, member_buffers), (inputs,))
+
+        in_dims = (0, 0, 0 if x.dim() == 3 else None)
+        return vmap(member_forward, in_dims=in_dims, randomness='different')(params, buffers, x)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass of all members.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (n, input_dim) or (num_members, n, input_dim).
+
+        Returns:
+            torch.Tensor: Outputs of shape (num_members, n, output_dim).
+        """
+        return self.functional_forward(self.stacked_parameters(), x)
+
+    def predict_mean_var(self, x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Predictive mean and variance over the members.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (n, input_dim).
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Mean and variance of shape (n, output_dim).
+        """
+        outputs = self.forward(x)
+        return outputs.mean(dim=0), outputs.var(dim=0, unbiased=self.num_members > 1)
+
+    def flat_parameters(self) -> torch.Tensor:
+        """Get the member parameters as one matrix.
+
+        Returns:
+            torch.Tensor: Tensor of shape (num_members, num_parameters_per_member).
+        """
+        return torch.cat([p.reshape(self.num_members, -1) for p in self.stacked_parameters().values()], dim=1)
+
+    def set_flat_parameters(self, theta: torch.Tensor) -> None:
+        """Overwrite the member parameters from one matrix.
+
+        Args:
+            theta (torch.Tensor): Tensor of shape (num_members, num_parameters_per_member).
+        """
+        offset = 0
+        with torch.no_grad():
+            for param in self.stacked_parameters().values():
+                size = param[0].numel()
+                param.copy_(theta[:, offset:offset + size].reshape(param.shape))
+                offset += size
+
+    def member(self, index: int) -> nn.Module:
+        """Materialize one member as a regular module.
+
+        Args:
+            index (int): Member index.
+
+        Returns:
+            nn.Module: Copy of the member with its own parameters.
+        """
+        model = copy.deepcopy(self._template).to_empty(device=next(self.parameters()).device)
+        state = {name: tensor[index] for name, tensor in self.stacked_parameters().items()}
+        state.update({name: tensor[index] for name, tensor in self.stacked_buffers().items()})
+        model.load_state_dict(state)
+        return model
+
+
 def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
     """Factory function to create PINN models.
 
     Args:
         model_type (str): Type of PINN model.
-        **kwargs: Additional arguments for model initialization.
+        **kwargs: Additional arguments for model initialization. With
+            ``boundary_condition='periodic'`` the model is built behind a
+            periodic embedding (options ``period`` or ``x_range`` (period = its length),
+            ``num_harmonics``, ``periodic_dims``). A 'hash_grid' model needs its
+            grid ``bounds`` or the domain ``x_range`` and ``t_range``.
 
     Returns:
         nn.Module: PINN model.
     """
+    if str(kwargs.get('boundary_condition', '')).lower() == 'periodic':
+        kwargs.pop('boundary_condition')
+        embedding_options = {key: kwargs.pop(key) for key in ('period', 'num_harmonics', 'periodic_dims')
+                             if key in kwargs}
+        x_range = kwargs.pop('x_range', None)
+        if 'period' not in embedding_options:
+            if x_range is None:
+                raise ValueError("Periodic models need the domain period: pass period or x_range")
+            embedding_options['period'] = x_range[1] - x_range[0]
+        embedding = get_boundary_condition('periodic', input_dim=kwargs.get('input_dim', 2), **embedding_options)
+        kwargs['input_dim'] = embedding.output_dim
+        return PeriodicPINN(embedding, create_pinn_model(model_type, **kwargs))
+    kwargs.pop('boundary_condition', None)
+    x_range = kwargs.pop('x_range', None)
+    t_range = kwargs.pop('t_range', None)
+
     # Handle separate hidden_activation and output_activation parameters
     if 'hidden_activation' in kwargs and 'output_activation' in kwargs:
         # Map to the new MLP parameters
@@ -451,12 +1723,25 @@ def create_pinn_model(model_type: str = "standard", **kwargs) -> nn.Module:
         return MLP(**kwargs)
     elif model_type.lower() == "fourier":
         return FourierFeatureMLP(**kwargs)
+    elif model_type.lower() == "hash_grid":
+        if kwargs.get('bounds') is None:
+            ranges = {1: [x_range], 2: [x_range, t_range]}.get(kwargs.get('input_dim', 2))
+            if ranges is None or any(r is None for r in ranges):
+                raise ValueError("Hash-grid models need the input domain: pass bounds or x_range and t_range")
+            kwargs['bounds'] = [tuple(r) for r in ranges]
+        return HashGridPINN(**kwargs)
     elif model_type.lower() == "adaptive":
         return AdaptivePINN(**kwargs)
     elif model_type.lower() == "multiscale":
         return MultiScalePINN(**kwargs)
     elif model_type.lower() == "resnet":
         return ResNetPINN(**kwargs)
+    elif model_type.lower() == "parametric":
+        return ParametricPINN(**kwargs)
+    elif model_type.lower() == "domain_decomposition":
+        return DomainDecompositionPINN(**kwargs)
+    elif model_type.lower() == "separable":
+        return SeparablePINN(**kwargs)
     else:
         raise ValueError(f"Unsupported model type: {model_type}")
 
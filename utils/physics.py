@@ -7,7 +7,8 @@ This module provides common physics functions and differential equation implemen
 import torch
 import torch.nn as nn
 import numpy as np
-from typing import Callable, Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import functools
 import math
 
 from utils.loggers import get_general_logger
@@ -221,10 +222,63 @@ class BoundaryConditions:
             torch.Tensor: Boundary condition values.
         """
         # This is a simplified version - in practice, you'd need to handle
-        # the specific boundary points and their periodic counterparts
+        # the specific boundary points and their periodic counterparts.
+        # get_boundary_condition('periodic') returns a PeriodicEmbedding,
+        # which enforces periodicity exactly instead.
         return u
 
 
+class PeriodicEmbedding(nn.Module):
+    """Fourier input embedding that makes a network exactly periodic in space.
+
+    Each periodic input column x is replaced by
+    (cos(2 pi k x / L), sin(2 pi k x / L)) for k = 1..num_harmonics, so any
+    network applied to the embedding satisfies u(x, t) = u(x + L, t) with all
+    derivatives. Other columns (time, coefficients) pass through unchanged.
+    """
+
+    def __init__(self, period: float, input_dim: int = 2,
+                 num_harmonics: int = 1, periodic_dims: Tuple[int, ...] = (0,)):
+        """Initialize the periodic embedding.
+
+        Args:
+            period (float): Period L of the domain, i.e. its length (1.0 for x in [0, 1]).
+            input_dim (int): Number of input columns.
+            num_harmonics (int): Number of harmonics per periodic column.
+            periodic_dims (Tuple[int, ...]): Input columns that are periodic.
+        """
+        super(PeriodicEmbedding, self).__init__()
+
+        if period <= 0:
+            raise ValueError(f"Period must be positive, got {period}")
+
+        self.input_dim = input_dim
+        self.period = float(period)
+        self.num_harmonics = num_harmonics
+        self.periodic_dims = tuple(periodic_dims)
+        self.output_dim = input_dim + (2 * num_harmonics - 1) * len(self.periodic_dims)
+
+        self.register_buffer('frequencies', 2 * math.pi / self.period * torch.arange(1, num_harmonics + 1).float())
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Embed the periodic columns.
+
+        Args:
+            x (torch.Tensor): Inputs of shape (..., input_dim).
+
+        Returns:
+            torch.Tensor: Embedded inputs of shape (..., output_dim).
+        """
+        columns = []
+        for i in range(x.shape[-1]):
+            if i in self.periodic_dims:
+                phase = x[..., i:i + 1] * self.frequencies.to(x.dtype)
+                columns.extend([torch.cos(phase), torch.sin(phase)])
+            else:
+                columns.append(x[..., i:i + 1])
+        return torch.cat(columns, dim=-1)
+
+
 class InitialConditions:
     """Collection of initial condition functions."""
 
@@ -299,19 +353,121 @@ def get_physics_function(equation_type: str) -> Callable:
     return physics_functions[equation_type.lower()]
 
 
-def get_boundary_condition(bc_type: str) -> Callable:
+# Residuals written pointwise in terms of u and its derivatives at one point,
+# for function transforms (torch.func) that cannot run the autograd-based
+# physics functions above. Coefficient names and defaults match them.
+POINTWISE_RESIDUALS = {
+    'heat': lambda d, alpha=1.0: d['u_t'] - alpha * d['u_xx'],
+    'wave': lambda d, c=1.0: d['u_tt'] - c**2 * d['u_xx'],
+    'burgers': lambda d, nu=0.01: d['u_t'] + d['u'] * d['u_x'] - nu * d['u_xx'],
+    'advection': lambda d, c=1.0: d['u_t'] + c * d['u_x'],
+    'reaction_diffusion': lambda d, D=1.0, k=1.0: d['u_t'] - D * d['u_xx'] + k * d['u']
+}
+
+
+def get_pointwise_residual(equation_type: str) -> Callable:
+    """Get the pointwise residual of an equation.
+
+    Args:
+        equation_type (str): Type of differential equation.
+
+    Returns:
+        Callable: Function of a dict with 'u', 'u_x', 'u_t', 'u_xx', 'u_xt', 'u_tt'
+        and the equation coefficients.
+    """
+    if equation_type.lower() not in POINTWISE_RESIDUALS:
+        raise ValueError(f"Unsupported equation type: {equation_type}")
+    
+    return POINTWISE_RESIDUALS[equation_type.lower()]
+
+
+def physics_coefficients(physics_fn: Callable,
+                         coefficients: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Get the equation coefficients for evaluating a pointwise residual.
+
+    Pointwise residuals cannot call an arbitrary physics function, so the
+    coefficients must be known explicitly: from ``coefficients`` (e.g. the
+    'coefficients' entry of the training data) and/or the keywords of a
+    ``functools.partial`` physics function, which take precedence (they carry
+    per-point values in parametric training).
+
+    Args:
+        physics_fn (Callable): Physics function.
+        coefficients (Dict[str, Any], optional): Explicit equation coefficients.
+
+    Returns:
+        Dict[str, Any]: Coefficients keyed by their keyword name.
+    """
+    if coefficients is None and not isinstance(physics_fn, functools.partial):
+        raise ValueError("Equation coefficients are unknown: pass the physics function as a "
+                         "functools.partial with its coefficients or provide them explicitly "
+                         "(the 'coefficients' entry of the training data)")
+
+    merged = dict(coefficients or {})
+    if isinstance(physics_fn, functools.partial):
+        merged.update(physics_fn.keywords)
+    return merged
+
+
+# Equation coefficients in the equation parameter configs, keyed by their
+# keyword name in the physics functions
+EQUATION_COEFFICIENTS = {
+    'heat': {'alpha': 'thermal_diffusivity'},
+    'wave': {'c': 'wave_speed'},
+    'burgers': {'nu': 'viscosity'},
+    'advection': {'c': 'advection_velocity'},
+    'reaction_diffusion': {'D': 'diffusion_coefficient', 'k': 'reaction_rate'}
+}
+
+
+def get_coefficient_ranges(equation_type: str, equation_parameters: Dict[str, Any],
+                           coefficients: Optional[List[str]] = None) -> Dict[str, Tuple[float, float]]:
+    """Get coefficient ranges from an equation parameter config.
+
+    Args:
+        equation_type (str): Type of differential equation.
+        equation_parameters (Dict[str, Any]): Equation parameter config entries with a 'range'
+            (e.g. ``FORWARD_PROBLEMS_EQUATION_PARAMETERS['burgers']``).
+        coefficients (List[str], optional): Physics-function coefficient names to include (default: all).
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Physics-function coefficient name to (low, high).
+    """
+    if equation_type.lower() not in EQUATION_COEFFICIENTS:
+        raise ValueError(f"Unsupported equation type: {equation_type}")
+
+    ranges = {}
+    for name, config_name in EQUATION_COEFFICIENTS[equation_type.lower()].items():
+        if coefficients is not None and name not in coefficients:
+            continue
+        if config_name not in equation_parameters:
+            raise ValueError(f"Equation parameters have no '{config_name}' entry for coefficient '{name}'")
+        low, high = equation_parameters[config_name]['range']
+        ranges[name] = (float(low), float(high))
+    
+    return ranges
+
+
+def get_boundary_condition(bc_type: str, **kwargs) -> Callable:
     """Get boundary condition function for a given type.
 
+    Periodic conditions are not penalized but built into the model: 'periodic'
+    returns a PeriodicEmbedding to place in front of the network.
+
     Args:
         bc_type (str): Type of boundary condition.
+        **kwargs: PeriodicEmbedding arguments for 'periodic' (period (required), input_dim,
+            num_harmonics, periodic_dims).
 
     Returns:
-        Callable: Boundary condition function.
+        Callable: Boundary condition function (or input embedding for 'periodic').
     """
+    if bc_type.lower() == 'periodic':
+        return PeriodicEmbedding(**kwargs)
+
     bc_functions = {
         'dirichlet': BoundaryConditions.dirichlet_bc,
-        'neumann': BoundaryConditions.neumann_bc,
-        'periodic': BoundaryConditions.periodic_bc
+        'neumann': BoundaryConditions.neumann_bc
     }
     
     if bc_type.lower() not in bc_functions:
@@ -0,0 +1,1203 @@
+"""
+Shared Trainer Module for PINN Research Platform.
+
+This module provides the training engine that every purpose trainer builds on.
+Loss terms are pluggable, all point groups (interior, boundary, initial, data)
+are evaluated in one fused forward pass, and losses are recorded into
+preallocated history buffers instead of being synchronised every step.
+"""
+
+import torch
+import torch.nn as nn
+import torch.optim as optim
+import numpy as np
+from typing import Dict, Any, List, Optional, Callable
+import time
+import copy
+import math
+from pathlib import Path
+
+from utils.loggers import get_purpose_logger
+from utils.models import StackedEnsemble, CachedTrunkPINN, TimeMarchingPINN
+from utils.model_store import ModelStore
+from utils.adapters import add_lora_adapters
+from utils.least_squares import LeastSquaresSolver
+from utils.levenberg_marquardt import LevenbergMarquardt
+from utils.physics import get_pointwise_residual, physics_coefficients
+from utils.loss_balancing import LossBalancer, get_loss_balancer
+
+
+class LossTerm:
+    """Base class for a pluggable loss term.
+
+    A loss term declares the point group it needs evaluated (``group``) and the
+    keys it expects in the training data (``required_keys``). The trainer
+    evaluates all requested groups in one forward pass and hands the
+    predictions to :meth:`compute`. Losses reduce over the last two (point and
+    output) axes only, so stacked predictions of shape (members, points,
+    outputs) yield one loss per member.
+    """
+
+    name: str = "loss"
+    group: Optional[str] = None
+    required_keys: tuple = ()
+
+    def is_available(self, train_data: Dict[str, Any]) -> bool:
+        """Check whether the training data provides everything this term needs.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            bool: True if the term can be computed.
+        """
+        return all(key in train_data for key in self.required_keys)
+
+    def compute(self, model: nn.Module, outputs: Dict[str, torch.Tensor],
+                train_data: Dict[str, Any], physics_fn: Callable) -> torch.Tensor:
+        """Compute the loss value.
+
+        Args:
+            model (nn.Module): Model being trained.
+            outputs (Dict[str, torch.Tensor]): Predictions per point group.
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics residual function.
+
+        Returns:
+            torch.Tensor: Scalar loss (or one loss per stacked member).
+        """
+        raise NotImplementedError
+
+    def residual(self, model: nn.Module, outputs: Dict[str, torch.Tensor],
+                 train_data: Dict[str, Any], physics_fn: Callable) -> torch.Tensor:
+        """Compute the pointwise residual whose mean square is the loss.
+
+        Terms without a pointwise residual (e.g. weight regularization) leave
+        this unimplemented.
+
+        Args:
+            model (nn.Module): Model being trained.
+            outputs (Dict[str, torch.Tensor]): Predictions per point group.
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics residual function.
+
+        Returns:
+            torch.Tensor: Residual of shape (..., points, outputs).
+        """
+        raise NotImplementedError
+
+
+def mean_over_points(values: torch.Tensor) -> torch.Tensor:
+    """Average over the point and output axes, keeping any leading member axis.
+
+    Args:
+        values (torch.Tensor): Tensor of shape (..., points, outputs).
+
+    Returns:
+        torch.Tensor: Tensor of shape (...).
+    """
+    return torch.mean(values, dim=(-2, -1))
+
+
+class PhysicsLoss(LossTerm):
+    """Mean squared PDE residual at interior collocation points."""
+
+    name = "physics"
+    group = "interior"
+    required_keys = ('x',)
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        return physics_fn(outputs['x_interior'], outputs['t_interior'], outputs['interior'])
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class CausalPhysicsLoss(PhysicsLoss):
+    """PDE residual loss with causal temporal weights.
+
+    The interior points are binned into ``num_windows`` time windows with mean
+    squared residuals L_1..L_M. Window i is weighted by
+    exp(-epsilon * sum_{k<i} L_k) (no gradient), so late times only enter the
+    loss once earlier times are resolved. The term keeps the name 'physics',
+    so loss weights and history keys are unchanged.
+    """
+
+    def __init__(self, num_windows: int = 32, epsilon: float = 1.0,
+                 t_range: Optional[tuple] = None):
+        """Initialize the causal physics loss.
+
+        Args:
+            num_windows (int): Number of time windows.
+            epsilon (float): Causality parameter (larger is stricter).
+            t_range (tuple, optional): (t_min, t_max); defaults to the range of the batch.
+        """
+        self.num_windows = num_windows
+        self.epsilon = epsilon
+        self.t_range = t_range
+        self.temporal_weights = None
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        residual = self.residual(model, outputs, train_data, physics_fn)
+        t = outputs['t_interior'].detach()[..., 0]
+        t_min, t_max = self.t_range if self.t_range is not None else (t.min(), t.max())
+
+        index = ((t - t_min) / max(float(t_max - t_min), 1e-12) * self.num_windows).long()
+        index = index.clamp(0, self.num_windows - 1)
+        windows = nn.functional.one_hot(index, self.num_windows).to(residual.dtype)
+
+        # Per-window mean squared residual, keeping any leading member axis
+        squared = torch.mean(residual**2, dim=-1).unsqueeze(-2)
+        counts = windows.sum(dim=-2)
+        window_losses = (squared @ windows).squeeze(-2) / counts.clamp_min(1.0)
+
+        cumulative = torch.cumsum(window_losses.detach(), dim=-1) - window_losses.detach()
+        weights = torch.exp(-self.epsilon * cumulative)
+        self.temporal_weights = weights
+
+        occupied = (counts > 0).to(residual.dtype)
+        return torch.sum(weights * window_losses * occupied, dim=-1) / occupied.sum(dim=-1).clamp_min(1.0)
+
+
+class GridPhysicsLoss(LossTerm):
+    """Mean squared PDE residual on a tensor-product (x, t) grid.
+
+    For SeparablePINN models: the solution derivatives on the grid spanned by
+    'x_axis' and 't_axis' come from forward-mode passes through the axis
+    networks, and the residual is evaluated pointwise. The equation defaults
+    to the trainer's; the coefficients come from the training data's
+    'coefficients' entry and/or a ``functools.partial`` physics function.
+    The term keeps the name 'physics'.
+    """
+
+    name = "physics"
+    required_keys = ('x_axis', 't_axis')
+
+    def __init__(self, equation: Optional[str] = None):
+        """Initialize the grid physics loss.
+
+        Args:
+            equation (str, optional): Equation type (default: set by the trainer).
+        """
+        self.equation = equation
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        if self.equation is None:
+            raise ValueError("Grid physics loss needs an equation type")
+        derivatives = model.grid_derivatives(train_data['x_axis'], train_data['t_axis'])
+        coefficients = physics_coefficients(physics_fn, train_data.get('coefficients'))
+        residual = get_pointwise_residual(self.equation)(derivatives, **coefficients)
+        return residual.reshape(-1, residual.shape[-1])
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class BoundaryLoss(LossTerm):
+    """Mean squared boundary condition violation."""
+
+    name = "boundary"
+    group = "boundary"
+    required_keys = ('x_bc', 'u_bc')
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        return outputs['boundary'] - train_data['u_bc']
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class InitialLoss(LossTerm):
+    """Mean squared initial condition violation."""
+
+    name = "initial"
+    group = "initial"
+    required_keys = ('x_ic', 'u_ic')
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        return outputs['initial'] - train_data['u_ic']
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class DataLoss(LossTerm):
+    """Mean squared misfit to observational data."""
+
+    name = "data"
+    group = "data"
+    required_keys = ('x_data', 'u_data')
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        return outputs['data'] - train_data['u_data']
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class InterfaceLoss(LossTerm):
+    """Mean squared mismatch to neighbouring subdomain solutions on interfaces.
+
+    The prediction is matched to 'u_interface' (e.g. the average of both
+    sides, as in XPINNs). Optional targets 'du_interface' (first derivatives
+    (u_x, u_t) per output) and 'r_interface' (PDE residual) make the solution
+    continuously differentiable across the interface, which second-order
+    equations need to be well posed per subdomain.
+    """
+
+    name = "interface"
+    group = "interface"
+    required_keys = ('x_interface', 'u_interface')
+
+    @staticmethod
+    def derivatives(outputs: Dict[str, torch.Tensor]) -> torch.Tensor:
+        """First derivatives (u_x, u_t) of every output at the interface points."""
+        x, t, u = outputs['x_interface'], outputs['t_interface'], outputs['interface']
+        columns = []
+        for k in range(u.shape[-1]):
+            u_x, u_t = torch.autograd.grad(u[..., k].sum(), [x, t], create_graph=True)
+            columns.extend([u_x, u_t])
+        return torch.cat(columns, dim=-1)
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        mismatch = [outputs['interface'] - train_data['u_interface']]
+        if 'du_interface' in train_data:
+            mismatch.append(self.derivatives(outputs) - train_data['du_interface'])
+        if 'r_interface' in train_data:
+            pde_residual = physics_fn(outputs['x_interface'], outputs['t_interface'], outputs['interface'])
+            mismatch.append(pde_residual - train_data['r_interface'])
+        return torch.cat(mismatch, dim=-1)
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class DistillationLoss(LossTerm):
+    """Mean squared mismatch to a teacher model at collocation points.
+
+    The student matches the teacher's predictions 'u_teacher' and PDE
+    residuals 'r_teacher' at the points 'x_distill', so it learns the
+    teacher's solution and inherits where (and by how much) the teacher
+    violates the physics. ``residual_weight`` scales the residual part.
+    """
+
+    name = "distillation"
+    group = "distillation"
+    required_keys = ('x_distill', 'u_teacher', 'r_teacher')
+
+    def __init__(self, residual_weight: float = 1.0):
+        """Initialize the distillation loss.
+
+        Args:
+            residual_weight (float): Weight of the residual mismatch relative to the output mismatch.
+        """
+        self.residual_weight = residual_weight
+
+    def residual(self, model, outputs, train_data, physics_fn):
+        pde_residual = physics_fn(outputs['x_distillation'], outputs['t_distillation'], outputs['distillation'])
+        return torch.cat([
+            outputs['distillation'] - train_data['u_teacher'],
+            math.sqrt(self.residual_weight) * (pde_residual - train_data['r_teacher'])
+        ], dim=-1)
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        return mean_over_points(self.residual(model, outputs, train_data, physics_fn)**2)
+
+
+class L2Regularization(LossTerm):
+    """Squared L2 norm of the trainable model weights."""
+
+    name = "l2"
+
+    def compute(self, model, outputs, train_data, physics_fn):
+        norm = sum(torch.sum(p**2) for p in model.parameters() if p.requires_grad)
+        if isinstance(model, StackedEnsemble):
+            norm = norm / model.num_members
+        return norm
+
+
+# Input keys in the training data for each point group
+POINT_GROUPS = {
+    'interior': 'x',
+    'boundary': 'x_bc',
+    'initial': 'x_ic',
+    'data': 'x_data',
+    'interface': 'x_interface',
+    'distillation': 'x_distill'
+}
+
+# Point groups whose coordinates are differentiated by the loss terms
+DIFFERENTIATED_GROUPS = ('interior', 'interface', 'distillation')
+
+LOSS_TERMS = {
+    'physics': PhysicsLoss,
+    'causal_physics': CausalPhysicsLoss,
+    'grid_physics': GridPhysicsLoss,
+    'boundary': BoundaryLoss,
+    'initial': InitialLoss,
+    'data': DataLoss,
+    'interface': InterfaceLoss,
+    'distillation': DistillationLoss,
+    'l2': L2Regularization
+}
+
+
+def get_loss_term(name: str, **kwargs) -> LossTerm:
+    """Get a loss term instance by name.
+
+    Args:
+        name (str): Loss term name ('physics', 'causal_physics', 'grid_physics', 'boundary',
+            'initial', 'data', 'interface', 'distillation', 'l2').
+        **kwargs: Arguments for the loss term constructor.
+
+    Returns:
+        LossTerm: Loss term instance.
+    """
+    if name.lower() not in LOSS_TERMS:
+        raise ValueError(f"Unsupported loss term: {name}")
+
+    return LOSS_TERMS[name.lower()](**kwargs)
+
+
+class PINNTrainer:
+    """Training engine shared by all purpose trainers."""
+
+    # Loss terms used when none are passed to the constructor; terms whose
+    # data is missing (e.g. 'data' without observations) are skipped
+    default_loss_terms: List[str] = ['physics', 'boundary', 'initial', 'data']
+
+    # Epoch interval for progress logging
+    log_interval: int = 100
+
+    def __init__(self, model: nn.Module, purpose: str, equation: str,
+                 loss_terms: Optional[List[Any]] = None):
+        """Initialize the trainer.
+
+        Args:
+            model (nn.Module): PINN model to train.
+            purpose (str): PINN purpose (e.g., 'forward_problems').
+            equation (str): Equation type (e.g., 'heat', 'wave', 'burgers').
+            loss_terms (List[Any], optional): Loss term names or LossTerm instances.
+        """
+        self.model = model
+        self.purpose = purpose
+        self.equation = equation
+        self.logger = get_purpose_logger(purpose, equation)
+
+        if loss_terms is None:
+            loss_terms = self.default_loss_terms
+        self.loss_terms = [self.make_loss_term(term) for term in loss_terms]
+
+        # Training state
+        self.optimizer = None
+        self.optimizer_type = None
+        self.learning_rate = None
+        self.scheduler = None
+        self.scheduler_settings = None
+        self.gradient_clipping = None
+        self.lbfgs_switch_fraction = 0.8
+        self.loss_balancer = None
+        self.training_history = self._empty_history()
+
+    def _empty_history(self) -> Dict[str, list]:
+        """Create an empty training history for the configured loss terms."""
+        history = {f"{term.name}_loss": [] for term in self.loss_terms}
+        history['total_loss'] = []
+        history['epochs'] = []
+        return history
+
+    def make_loss_term(self, term: Any) -> LossTerm:
+        """Build a loss term; terms that take an equation default to the trainer's.
+
+        Args:
+            term (Any): Loss term name or LossTerm instance.
+
+        Returns:
+            LossTerm: Loss term instance.
+        """
+        if not isinstance(term, LossTerm):
+            term = get_loss_term(term)
+        if hasattr(term, 'equation') and term.equation is None:
+            term.equation = self.equation
+        return term
+
+    def add_loss_term(self, term: Any) -> None:
+        """Register an additional loss term.
+
+        Args:
+            term (Any): Loss term name or LossTerm instance.
+        """
+        term = self.make_loss_term(term)
+        self.loss_terms.append(term)
+        self.training_history.setdefault(f"{term.name}_loss", [])
+
+    def trainable_parameters(self) -> List[nn.Parameter]:
+        """Get the parameters updated by the optimizer.
+
+        Subclasses that train additional parameters (e.g. PDE coefficients)
+        extend this list.
+
+        Returns:
+            List[nn.Parameter]: Trainable parameters.
+        """
+        return [p for p in self.model.parameters() if p.requires_grad]
+
+    def _create_optimizer(self, optimizer_type: str, learning_rate: float) -> optim.Optimizer:
+        """Create an optimizer over the trainable parameters."""
+        params = self.trainable_parameters()
+        if optimizer_type == "adam":
+            return optim.Adam(params, lr=learning_rate)
+        elif optimizer_type == "sgd":
+            return optim.SGD(params, lr=learning_rate)
+        elif optimizer_type == "adamw":
+            return optim.AdamW(params, lr=learning_rate)
+        elif optimizer_type == "lbfgs":
+            return optim.LBFGS(params, lr=learning_rate, max_iter=20,
+                               line_search_fn="strong_wolfe")
+        elif optimizer_type == "lm":
+            if isinstance(self.model, StackedEnsemble):
+                raise ValueError("Levenberg-Marquardt does not support stacked ensembles")
+            model_params = {id(p) for p in self.model.parameters()}
+            if any(id(p) not in model_params for p in params):
+                raise ValueError("Levenberg-Marquardt only trains model parameters")
+            # The learning rate is the initial damping
+            return LevenbergMarquardt(self.model, damping=learning_rate)
+        else:
+            raise ValueError(f"Unsupported optimizer type: {optimizer_type}")
+
+    def setup_optimizer(self, learning_rate: float = 0.001,
+                        optimizer_type: str = "adam",
+                        lbfgs_switch_fraction: float = 0.8) -> None:
+        """Setup optimizer for training.
+
+        Args:
+            learning_rate (float): Learning rate for optimization.
+            optimizer_type (str): Type of optimizer ('adam', 'sgd', 'adamw', 'adam_lbfgs', 'lbfgs', 'lm').
+                For 'lm' (Levenberg-Marquardt) the learning rate is the initial damping.
+            lbfgs_switch_fraction (float): Fraction of epochs after which 'adam_lbfgs' switches to L-BFGS.
+        """
+        optimizer_type = optimizer_type.lower()
+        if optimizer_type == "adam_lbfgs":
+            # Start with Adam, switched to L-BFGS during training
+            self.optimizer = self._create_optimizer("adam", learning_rate)
+        else:
+            self.optimizer = self._create_optimizer(optimizer_type, learning_rate)
+
+        self.optimizer_type = optimizer_type
+        self.learning_rate = learning_rate
+        self.lbfgs_switch_fraction = lbfgs_switch_fraction
+
+        self.logger.log_equation_specific_info(f"Optimizer {optimizer_type} setup with lr={learning_rate}")
+
+    def switch_optimizer(self, optimizer_type: str = "lbfgs",
+                         learning_rate: Optional[float] = None) -> None:
+        """Replace the optimizer in the middle of training.
+
+        Args:
+            optimizer_type (str): Type of the new optimizer.
+            learning_rate (float, optional): Learning rate; L-BFGS defaults to 1.0.
+        """
+        optimizer_type = optimizer_type.lower()
+        if learning_rate is None:
+            learning_rate = 1.0 if optimizer_type == "lbfgs" else self.learning_rate
+
+        self.optimizer = self._create_optimizer(optimizer_type, learning_rate)
+        # Schedulers are bound to the previous optimizer
+        self.scheduler = None
+
+        self.logger.log_equation_specific_info(f"Switched optimizer to {optimizer_type} with lr={learning_rate}")
+
+    def setup_scheduler(self, scheduler_type: str = "step",
+                        step_size: int = 1000, gamma: float = 0.9) -> None:
+        """Setup learning rate scheduler.
+
+        Args:
+            scheduler_type (str): Type of scheduler ('step', 'cosine', 'plateau').
+            step_size (int): Step size for step scheduler.
+            gamma (float): Gamma value for step scheduler.
+        """
+        if self.optimizer is None:
+            raise ValueError("Optimizer must be setup before scheduler")
+        self.scheduler_settings = {'scheduler_type': scheduler_type, 'step_size': step_size, 'gamma': gamma}
+
+        if scheduler_type.lower() == "step":
+            self.scheduler = optim.lr_scheduler.StepLR(
+                self.optimizer, step_size=step_size, gamma=gamma
+            )
+        elif scheduler_type.lower() == "cosine":
+            self.scheduler = optim.lr_scheduler.CosineAnnealingLR(
+                self.optimizer, T_max=step_size
+            )
+        elif scheduler_type.lower() == "plateau":
+            self.scheduler = optim.lr_scheduler.ReduceLROnPlateau(
+                self.optimizer, mode='min', factor=gamma, patience=step_size//10
+            )
+
+        self.logger.log_equation_specific_info(f"Scheduler {scheduler_type} setup")
+
+    def set_loss_balancer(self, balancer: Any = None, **kwargs) -> None:
+        """Set the adaptive loss weighting used during training.
+
+        Args:
+            balancer (Any): Balancer name ('lr_annealing', 'gradnorm', 'ntk'), LossBalancer
+                instance, or None for fixed weights.
+            **kwargs: Arguments for the balancer constructor when a name is given.
+        """
+        if isinstance(balancer, str):
+            balancer = get_loss_balancer(balancer, **kwargs)
+        self.loss_balancer = balancer
+
+        name = balancer.name if balancer is not None else "none"
+        self.logger.log_equation_specific_info(f"Loss balancing: {name}")
+
+    def active_loss_terms(self, train_data: Dict[str, Any]) -> List[LossTerm]:
+        """Get the loss terms that can be computed from the training data.
+
+        Terms on point groups the model satisfies exactly (its
+        ``hard_constraints``, e.g. a HardConstraintPINN) are skipped together
+        with their forward passes.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            List[LossTerm]: Loss terms to evaluate.
+        """
+        hard_constraints = getattr(self.model, 'hard_constraints', ())
+        return [term for term in self.loss_terms
+                if term.is_available(train_data) and term.group not in hard_constraints]
+
+    @staticmethod
+    def loss_groups(terms: List[LossTerm]) -> List[str]:
+        """Get the point groups needed by loss terms, in evaluation order.
+
+        Args:
+            terms (List[LossTerm]): Loss terms.
+
+        Returns:
+            List[str]: Point groups.
+        """
+        groups = []
+        for term in terms:
+            if term.group is not None and term.group not in groups:
+                groups.append(term.group)
+        return groups
+
+    def forward_groups(self, train_data: Dict[str, Any],
+                       groups: List[str]) -> Dict[str, torch.Tensor]:
+        """Evaluate the model on several point groups in one fused forward pass.
+
+        Interior and interface coordinates are split into leaf tensors with
+        gradients enabled so that physics functions can differentiate the
+        prediction with respect to x and t. For a StackedEnsemble every member gets its own copy of the
+        coordinates, so input derivatives stay per member and predictions have
+        shape (members, points, outputs). Subclasses adapt other batched models
+        through ``point_copies`` and ``model_forward``.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            groups (List[str]): Point groups to evaluate.
+
+        Returns:
+            Dict[str, torch.Tensor]: Predictions per group, plus 'x_<group>'
+            and 't_<group>' for the differentiated groups.
+        """
+        num_copies = self.point_copies(train_data)
+
+        outputs = {}
+        inputs = []
+        for group in groups:
+            points = train_data[POINT_GROUPS[group]].detach()
+            if num_copies is not None and points.dim() == 2:
+                points = points.unsqueeze(0).expand(num_copies, -1, -1)
+            if group in DIFFERENTIATED_GROUPS:
+                x = points[..., 0:1].clone().requires_grad_(True)
+                t = points[..., 1:2].clone().requires_grad_(True)
+                outputs[f'x_{group}'] = x
+                outputs[f't_{group}'] = t
+                points = torch.cat([x, t, points[..., 2:]], dim=-1)
+            inputs.append(points)
+
+        if not inputs:
+            return outputs
+
+        predictions = self.model_forward(train_data, torch.cat(inputs, dim=-2))
+        sizes = [points.shape[-2] for points in inputs]
+        for group, prediction in zip(groups, torch.split(predictions, sizes, dim=-2)):
+            outputs[group] = prediction
+
+        return outputs
+
+    def point_copies(self, train_data: Dict[str, Any]) -> Optional[int]:
+        """Get the number of per-copy coordinate sets the model evaluates.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            Optional[int]: Number of ensemble members for a StackedEnsemble, else None
+            (one shared set of points).
+        """
+        return self.model.num_members if isinstance(self.model, StackedEnsemble) else None
+
+    def model_forward(self, train_data: Dict[str, Any], inputs: torch.Tensor) -> torch.Tensor:
+        """Evaluate the model on the fused points of ``forward_groups``.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            inputs (torch.Tensor): Points of shape ([copies,] points, input_dim).
+
+        Returns:
+            torch.Tensor: Predictions of shape ([copies,] points, outputs).
+        """
+        return self.model(inputs)
+
+    def step_data(self, train_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the training data for one optimizer step.
+
+        Subclasses that resample inputs every step (e.g. parametric training)
+        override this.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            Dict[str, Any]: Training data for the step.
+        """
+        return train_data
+
+    def bind_physics(self, train_data: Dict[str, Any], physics_fn: Callable) -> Callable:
+        """Get the physics function for one batch of training data.
+
+        Subclasses bind coefficients the physics function does not carry
+        itself (trained coefficients, per-point coefficients).
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function.
+
+        Returns:
+            Callable: Physics function to evaluate.
+        """
+        return physics_fn
+
+    def compute_residuals(self, train_data: Dict[str, Any], physics_fn: Callable) -> Dict[str, torch.Tensor]:
+        """Compute the pointwise residuals of the active loss terms that have one.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function.
+
+        Returns:
+            Dict[str, torch.Tensor]: Residuals keyed by term name.
+        """
+        physics_fn = self.bind_physics(train_data, physics_fn)
+        terms = self.active_loss_terms(train_data)
+        outputs = self.forward_groups(train_data, self.loss_groups(terms))
+
+        residuals = {}
+        for term in terms:
+            try:
+                residuals[term.name] = term.residual(self.model, outputs, train_data, physics_fn)
+            except NotImplementedError:
+                continue
+        return residuals
+
+    def compute_losses(self, train_data: Dict[str, Any], physics_fn: Callable,
+                       weights: Dict[str, float]) -> Dict[str, torch.Tensor]:
+        """Compute all active loss terms and the weighted total.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function.
+            weights (Dict[str, float]): Loss weights keyed by term name (default 1.0).
+
+        Returns:
+            Dict[str, torch.Tensor]: Loss tensors keyed '<name>_loss' and 'total_loss'.
+        """
+        physics_fn = self.bind_physics(train_data, physics_fn)
+        terms = self.active_loss_terms(train_data)
+        outputs = self.forward_groups(train_data, self.loss_groups(terms))
+
+        losses = {}
+        total_loss = 0.0
+        for term in terms:
+            value = term.compute(self.model, outputs, train_data, physics_fn)
+            if value.dim() > 0:
+                # Stacked ensemble: members are independent, so the mean keeps
+                # their gradients separate
+                value = value.mean()
+            losses[f"{term.name}_loss"] = value
+            total_loss = total_loss + weights.get(term.name, 1.0) * value
+        losses['total_loss'] = total_loss
+
+        return losses
+
+    def history_keys(self, train_data: Dict[str, Any]) -> List[str]:
+        """Get the per-epoch quantities recorded in the training history.
+
+        Subclasses append extra keys and return matching values from
+        :meth:`_step`.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+
+        Returns:
+            List[str]: History keys.
+        """
+        return [f"{term.name}_loss" for term in self.active_loss_terms(train_data)] + ['total_loss']
+
+    def _step(self, train_data: Dict[str, Any], physics_fn: Callable,
+              weights: Dict[str, float]) -> Dict[str, torch.Tensor]:
+        """Perform one optimizer step and return detached loss tensors."""
+        train_data = self.step_data(train_data)
+        if isinstance(self.optimizer, optim.LBFGS):
+            last_losses = {}
+
+            def closure():
+                self.optimizer.zero_grad()
+                losses = self.compute_losses(train_data, physics_fn, weights)
+                losses['total_loss'].backward()
+                last_losses.update(losses)
+                return losses['total_loss']
+
+            self.optimizer.step(closure)
+            # Report the losses of the last closure evaluation instead of
+            # running another forward pass
+            losses = last_losses
+        elif isinstance(self.optimizer, LevenbergMarquardt):
+            losses = self.optimizer.step(self, train_data, physics_fn, weights)
+        else:
+            self.optimizer.zero_grad()
+            losses = self.compute_losses(train_data, physics_fn, weights)
+            losses['total_loss'].backward()
+
+            if self.gradient_clipping is not None:
+                nn.utils.clip_grad_norm_(self.trainable_parameters(), self.gradient_clipping)
+
+            self.optimizer.step()
+
+        if self.scheduler is not None:
+            if isinstance(self.scheduler, optim.lr_scheduler.ReduceLROnPlateau):
+                self.scheduler.step(losses['total_loss'].item())
+            else:
+                self.scheduler.step()
+
+        return {key: value.detach() for key, value in losses.items()}
+
+    def train_step(self, train_data: Dict[str, Any],
+                   physics_fn: Callable, weights: Dict[str, float]) -> Dict[str, float]:
+        """Perform a single training step.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function.
+            weights (Dict[str, float]): Loss weights.
+
+        Returns:
+            Dict[str, float]: Loss values for this step.
+        """
+        return {key: value.item() for key, value in self._step(train_data, physics_fn, weights).items()}
+
+    def _flush_history(self, buffer: torch.Tensor, keys: List[str],
+                       start_epoch: int, count: int) -> None:
+        """Append buffered loss values to the training history."""
+        if count == 0:
+            return
+        values = buffer[:count].cpu().numpy()
+        for column, key in enumerate(keys):
+            self.training_history.setdefault(key, []).extend(values[:, column].tolist())
+        self.training_history['epochs'].extend(range(start_epoch, start_epoch + count))
+
+    def train(self, train_data: Dict[str, Any],
+              physics_fn: Callable, epochs: int = 10000,
+              weights: Optional[Dict[str, float]] = None,
+              save_interval: int = 1000, save_path: Optional[str] = None,
+              progress_callback: Optional[Callable] = None,
+              gradient_clipping: Optional[float] = None) -> Dict[str, list]:
+        """Train the PINN model.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            physics_fn (Callable): Physics function.
+            epochs (int): Number of training epochs.
+            weights (Dict[str, float], optional): Loss weights (initial weights with a loss balancer).
+            save_interval (int): Interval for saving checkpoints.
+            save_path (str, optional): Path to save checkpoints.
+            progress_callback (Callable, optional): Called as callback(epoch, losses) every epoch.
+            gradient_clipping (float, optional): Maximum gradient norm.
+
+        Returns:
+            Dict[str, list]: Training history.
+        """
+        if weights is None:
+            weights = {'physics': 1.0, 'boundary': 1.0, 'initial': 1.0}
+        if self.optimizer is None:
+            self.setup_optimizer()
+        self.gradient_clipping = gradient_clipping
+
+        terms = self.active_loss_terms(train_data)
+        keys = self.history_keys(train_data)
+
+        # Log training start
+        training_params = {
+            'epochs': epochs,
+            'weights': weights,
+            'loss_terms': [term.name for term in terms],
+            'save_interval': save_interval,
+            'equation': self.equation,
+            'purpose': self.purpose
+        }
+        self.logger.log_training_start(training_params)
+
+        switch_epoch = None
+        if self.optimizer_type == "adam_lbfgs":
+            switch_epoch = int(epochs * self.lbfgs_switch_fraction)
+
+        # Loss values stay on the device until the buffer is flushed
+        start_epoch = len(self.training_history['epochs'])
+        flush_every = max(1, min(epochs, save_interval))
+        device = next(self.model.parameters()).device
+        buffer = torch.zeros(flush_every, len(keys), dtype=torch.float64, device=device)
+        buffered = 0
+
+        start_time = time.time()
+        losses = {}
+
+        for epoch in range(epochs):
+            if switch_epoch is not None and epoch == switch_epoch:
+                self.switch_optimizer("lbfgs")
+
+            if self.loss_balancer is not None:
+                weights = self.loss_balancer.update(self, train_data, physics_fn, weights, epoch)
+
+            step_losses = self._step(train_data, physics_fn, weights)
+            buffer[buffered] = torch.stack([step_losses[key].to(buffer) for key in keys])
+            buffered += 1
+
+            if progress_callback is not None:
+                losses = {key: value.item() for key, value in step_losses.items()}
+                progress_callback(epoch, losses)
+
+            if epoch % self.log_interval == 0:
+                losses = {key: value.item() for key, value in step_losses.items()}
+                self.logger.log_training_progress(
+                    epoch, epochs, losses.get('physics_loss', 0.0), losses['total_loss']
+                )
+
+            if buffered == flush_every:
+                self._flush_history(buffer, keys, start_epoch + epoch + 1 - buffered, buffered)
+                buffered = 0
+
+            # Save checkpoint
+            if save_path and epoch % save_interval == 0:
+                self._flush_history(buffer, keys, start_epoch + epoch + 1 - buffered, buffered)
+                buffered = 0
+                losses = {key: value.item() for key, value in step_losses.items()}
+                self.save_checkpoint(save_path, epoch, losses)
+
+        self._flush_history(buffer, keys, start_epoch + epochs - buffered, buffered)
+
+        training_time = time.time() - start_time
+        final_loss = self.training_history['total_loss'][-1] if epochs > 0 else float('nan')
+        self.logger.log_training_complete(final_loss, training_time)
+
+        return self.training_history
+
+    def save_checkpoint(self, save_path: str, epoch: int, losses: Dict[str, float]) -> None:
+        """Save training checkpoint.
+
+        Args:
+            save_path (str): Path to save checkpoint.
+            epoch (int): Current epoch.
+            losses (Dict[str, float]): Current loss values.
+        """
+        checkpoint = {
+            'epoch': epoch,
+            'model_state_dict': self.model.state_dict(),
+            'optimizer_state_dict': self.optimizer.state_dict(),
+            'optimizer_type': self.optimizer_type,
+            'losses': losses,
+            'loss_terms': [term.name for term in self.loss_terms],
+            'training_history': self.training_history,
+            'purpose': self.purpose,
+            'equation': self.equation
+        }
+
+        if self.scheduler is not None:
+            checkpoint['scheduler_state_dict'] = self.scheduler.state_dict()
+
+        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+        torch.save(checkpoint, f"{save_path}_epoch_{epoch}.pt")
+
+        self.logger.log_equation_specific_info(f"Checkpoint saved at epoch {epoch}")
+
+    def load_checkpoint(self, checkpoint_path: str) -> int:
+        """Load training checkpoint.
+
+        Args:
+            checkpoint_path (str): Path to checkpoint file.
+
+        Returns:
+            int: Epoch number from checkpoint.
+        """
+        checkpoint = torch.load(checkpoint_path)
+
+        self.model.load_state_dict(checkpoint['model_state_dict'])
+        if self.optimizer is not None:
+            try:
+                self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
+            except ValueError:
+                # Optimizer type changed (e.g. after an Adam -> L-BFGS switch)
+                self.logger.log_equation_specific_info("Optimizer state not restored: optimizer type differs")
+
+        if 'scheduler_state_dict' in checkpoint and self.scheduler is not None:
+            self.scheduler.load_state_dict(checkpoint['scheduler_state_dict'])
+
+        self.training_history = checkpoint['training_history']
+
+        epoch = checkpoint['epoch']
+        self.logger.log_equation_specific_info(f"Checkpoint loaded from epoch {epoch}")
+
+        return epoch
+
+    def set_causal_training(self, enabled: bool = True, num_windows: int = 32, epsilon: float = 1.0,
+                            t_range: Optional[tuple] = None) -> None:
+        """Switch the physics loss between uniform and causal time weighting.
+
+        Args:
+            enabled (bool): Use the causal physics loss.
+            num_windows (int): Number of time windows.
+            epsilon (float): Causality parameter.
+            t_range (tuple, optional): (t_min, t_max) of the domain.
+        """
+        term = CausalPhysicsLoss(num_windows, epsilon, t_range) if enabled else PhysicsLoss()
+        self.loss_terms = [term if existing.name == 'physics' else existing for existing in self.loss_terms]
+
+        self.logger.log_equation_specific_info(
+            f"Causal training with {num_windows} windows, epsilon={epsilon}" if enabled else "Causal training disabled"
+        )
+
+    @staticmethod
+    def time_window_data(train_data: Dict[str, Any], t_start: float, t_end: float,
+                         last: bool = False) -> Dict[str, Any]:
+        """Restrict the point groups to a time window [t_start, t_end).
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            t_start (float): Window start.
+            t_end (float): Window end.
+            last (bool): Include t_end (for the last window).
+
+        Returns:
+            Dict[str, Any]: Training data of the window (initial points unchanged).
+        """
+        data = dict(train_data)
+        for x_key, u_key in (('x', None), ('x_bc', 'u_bc'), ('x_data', 'u_data')):
+            points = train_data.get(x_key)
+            if points is None:
+                continue
+            t = points[:, 1]
+            mask = (t >= t_start) & ((t <= t_end) if last else (t < t_end))
+            data[x_key] = points[mask]
+            if u_key is not None and u_key in train_data:
+                data[u_key] = train_data[u_key][mask]
+        return data
+
+    def train_time_marching(self, train_data: Dict[str, Any], physics_fn: Callable,
+                            num_windows: int = 4, epochs_per_window: int = 2500,
+                            weights: Optional[Dict[str, float]] = None,
+                            t_range: Optional[tuple] = None, **kwargs) -> Dict[str, list]:
+        """Train window by window over the time horizon.
+
+        Window j starts from a copy of the model trained on window j - 1 and
+        takes that model's prediction at the window start as its initial
+        condition (at the x locations of 'x_ic'). Afterwards the trainer's
+        model is a TimeMarchingPINN over all windows. Every window gets a fresh
+        optimizer and, if a scheduler is set up, a fresh schedule with the same
+        settings.
+
+        Args:
+            train_data (Dict[str, Any]): Training data over the full horizon.
+            physics_fn (Callable): Physics function.
+            num_windows (int): Number of time windows.
+            epochs_per_window (int): Training epochs per window.
+            weights (Dict[str, float], optional): Loss weights.
+            t_range (tuple, optional): (t_min, t_max); defaults to the range of the interior points.
+            **kwargs: Further arguments for :meth:`train` (save_path, progress_callback, ...).
+
+        Returns:
+            Dict[str, list]: Training history over all windows.
+        """
+        if self.optimizer is None:
+            self.setup_optimizer()
+        if t_range is None:
+            t = train_data['x'][:, 1]
+            t_range = (t.min().item(), t.max().item())
+        edges = np.linspace(t_range[0], t_range[1], num_windows + 1).tolist()
+        scheduler_settings = self.scheduler_settings if self.scheduler is not None else None
+
+        models = []
+        for j in range(num_windows):
+            data = self.time_window_data(train_data, edges[j], edges[j + 1], last=j == num_windows - 1)
+            if j > 0:
+                # Warm start from the previous window; its end state is the new initial condition
+                self.model = copy.deepcopy(models[-1])
+                self.setup_optimizer(self.learning_rate, self.optimizer_type, self.lbfgs_switch_fraction)
+                # Schedulers are bound to the previous optimizer; restart the schedule
+                self.scheduler = None
+                if scheduler_settings is not None:
+                    self.setup_scheduler(**scheduler_settings)
+                x_ic = train_data['x_ic'].clone()
+                x_ic[:, 1] = edges[j]
+                with torch.no_grad():
+                    data['u_ic'] = models[-1](x_ic)
+                data['x_ic'] = x_ic
+
+            self.logger.log_equation_specific_info(
+                f"Time window {j + 1}/{num_windows}: t in [{edges[j]:.3g}, {edges[j + 1]:.3g}], "
+                f"{data['x'].shape[0]} collocation points"
+            )
+            kwargs.setdefault('save_interval', epochs_per_window)
+            self.train(data, physics_fn, epochs_per_window, weights, **kwargs)
+            models.append(self.model)
+
+        self.model = TimeMarchingPINN(models, edges)
+        return self.training_history
+
+    def warm_start(self, store: ModelStore, coefficients: Dict[str, float], freeze: int = 0,
+                   max_distance: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Initialize the model from the closest stored model.
+
+        Call before ``setup_optimizer``; an existing optimizer is rebuilt so
+        that frozen layers are excluded from it, and an existing scheduler is
+        dropped (call ``setup_scheduler`` again).
+
+        Args:
+            store (ModelStore): Model store to look up.
+            coefficients (Dict[str, float]): Equation coefficients of this run.
+            freeze (int): Number of leading linear layers to freeze.
+            max_distance (float, optional): Only warm-start from entries within this distance.
+
+        Returns:
+            Optional[Dict[str, Any]]: The store entry used, or None if training starts from scratch.
+        """
+        entry = store.warm_start(self.model, self.purpose, self.equation, coefficients, freeze, max_distance)
+        if entry is None:
+            return None
+
+        if self.optimizer is not None:
+            self.setup_optimizer(self.learning_rate, self.optimizer_type, self.lbfgs_switch_fraction)
+            # Schedulers are bound to the previous optimizer
+            self.scheduler = None
+
+        self.logger.log_purpose_specific_info(
+            f"Warm start from {entry['coefficients']} (distance {entry['distance']:.3f})"
+        )
+        return entry
+
+    def enable_cached_trunk(self, train_data: Dict[str, Any], num_frozen: int) -> None:
+        """Fine-tune only the head of an MLP/ResNetPINN over cached trunk features.
+
+        The leading ``num_frozen`` hidden layers are frozen and their features
+        and input derivatives are cached at the fused training points, so each
+        step only runs the head. The head shares its layers with the original
+        model, which therefore holds the fine-tuned weights afterwards. The
+        training points must stay fixed while the cache is active. An existing
+        optimizer is rebuilt over the head and an existing scheduler is dropped
+        (call ``setup_scheduler`` again).
+
+        Args:
+            train_data (Dict[str, Any]): Training data used for fine-tuning.
+            num_frozen (int): Number of leading hidden layers to freeze.
+        """
+        if isinstance(self.model, CachedTrunkPINN):
+            self.disable_cached_trunk()
+
+        cached_model = CachedTrunkPINN(self.model, num_frozen)
+        groups = self.loss_groups(self.active_loss_terms(train_data))
+        points = torch.cat([train_data[POINT_GROUPS[group]] for group in groups], dim=0)
+        cached_model.cache(points)
+        self.model = cached_model
+
+        if self.optimizer is not None:
+            self.setup_optimizer(self.learning_rate, self.optimizer_type, self.lbfgs_switch_fraction)
+            # Schedulers are bound to the previous optimizer
+            self.scheduler = None
+
+        self.logger.log_purpose_specific_info(
+            f"Cached trunk of {num_frozen} frozen layers at {points.shape[0]} points; training head only"
+        )
+
+    def disable_cached_trunk(self) -> None:
+        """Return to training the full model (frozen layers stay frozen).
+
+        An existing optimizer is rebuilt and an existing scheduler is dropped,
+        as in :meth:`enable_cached_trunk`.
+        """
+        if isinstance(self.model, CachedTrunkPINN):
+            self.model.clear_cache()
+            self.model = self.model.base_model
+            if self.optimizer is not None:
+                self.setup_optimizer(self.learning_rate, self.optimizer_type, self.lbfgs_switch_fraction)
+                self.scheduler = None
+
+    def enable_lora(self, rank: int = 4, alpha: Optional[float] = None,
+                    layers: Optional[List[str]] = None) -> List[str]:
+        """Fine-tune low-rank adapters instead of the full model.
+
+        The linear layers get LoRA adapters and the base weights are frozen,
+        so a variant (e.g. another viscosity) trains and stores only the
+        adapters; see ``utils.adapters.AdapterBank`` for serving them. An
+        existing optimizer is rebuilt over the adapters and an existing
+        scheduler is dropped (call ``setup_scheduler`` again).
+
+        Args:
+            rank (int): Adapter rank.
+            alpha (float, optional): Adapter scale numerator (default: rank).
+            layers (List[str], optional): Names of the linear layers to adapt (default: all).
+
+        Returns:
+            List[str]: Names of the adapted layers.
+        """
+        adapted = add_lora_adapters(self.model, rank, alpha, layers)
+
+        if self.optimizer is not None:
+            self.setup_optimizer(self.learning_rate, self.optimizer_type, self.lbfgs_switch_fraction)
+            # Schedulers are bound to the previous optimizer
+            self.scheduler = None
+
+        self.logger.log_purpose_specific_info(
+            f"LoRA fine-tuning: rank-{rank} adapters on {len(adapted)} layers, base weights frozen"
+        )
+        return adapted
+
+    def solve_least_squares(self, train_data: Dict[str, Any], coefficients: Optional[Dict[str, float]] = None,
+                            weights: Optional[Dict[str, float]] = None, regularization: float = 1e-8,
+                            source_fn: Optional[Callable] = None,
+                            feature_scale: Optional[float] = None) -> Dict[str, float]:
+        """Fit the output layer of a linear PDE in one least-squares solve.
+
+        Replaces gradient training for linear equations with an MLP or
+        FourierFeatureMLP whose hidden layers are kept fixed.
+
+        Args:
+            train_data (Dict[str, Any]): Training data.
+            coefficients (Dict[str, float], optional): Equation coefficients (e.g. {'alpha': 0.1}).
+            weights (Dict[str, float], optional): Loss weights per block.
+            regularization (float): Ridge parameter.
+            source_fn (Callable, optional): Right-hand side f(x, t).
+            feature_scale (float, optional): Resample hidden layers uniformly in [-scale, scale] first.
+
+        Returns:
+            Dict[str, float]: Final losses and solve time.
+        """
+        solver = LeastSquaresSolver(self.model, self.equation, coefficients, source_fn)
+        if feature_scale is not None:
+            solver.reinitialize_features(feature_scale)
+        losses = solver.solve(train_data, weights, regularization)
+
+        self.logger.log_equation_specific_info(
+            f"Least-squares solve completed in {losses['solve_time']:.3f} s - total loss {losses['total_loss']:.6e}"
+        )
+        return losses
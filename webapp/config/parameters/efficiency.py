@@ -153,7 +153,7 @@ EFFICIENCY_PARAMETERS_DICT = {
         'description': 'Optimization algorithm for training',
         'unit': 'dimensionless',
         'default': 'adam',
-        'range': ['sgd', 'adam', 'lbfgs', 'rmsprop'],
+        'range': ['sgd', 'adam', 'lbfgs', 'lm', 'rmsprop'],
         'category': 'algorithm_parameters',
         'optimization_target': 'convergence'
     },